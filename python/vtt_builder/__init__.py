@@ -5,45 +5,59 @@ This module provides high-performance tools for creating, validating,
 and manipulating WebVTT (Web Video Text Tracks) files from transcript data.
 """
 
-from vtt_builder._lowlevel import (
-    VttCueError,
-    # Exception types
-    VttError,
-    VttEscapingError,
-    VttHeaderError,
-    VttTimestampError,
-    VttValidationError,
-    # Main builder functions
-    build_transcript_from_json_files,
-    build_vtt_from_json_files,
-    build_vtt_from_records,
-    build_vtt_string,
-    detect_chapters,
-    filter_by_confidence,
-    filter_segments_by_time,
-    # Statistics functions
-    get_segments_stats,
-    group_by_speaker,
-    # Segment transformation functions
-    merge_segments,
-    # Podcast processing functions
-    remove_filler_words,
-    remove_repeated_phrases,
-    # Timestamp conversion functions
-    seconds_to_timestamp,
-    shift_timestamps,
-    split_long_segments,
-    timestamp_to_seconds,
-    unescape_vtt_text,
-    validate_segments,
-    # Validation functions
-    validate_vtt_file,
-    words_to_segments,
-)
-from vtt_builder._lowlevel import (
-    # Escape/Unescape utilities
-    escape_vtt_text_py as escape_vtt_text,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vtt_builder._lowlevel import (
+        # Columnar segment container
+        Segments,
+        VttCueError,
+        # Exception types
+        VttError,
+        VttEscapingError,
+        VttHeaderError,
+        VttTimestampError,
+        VttValidationError,
+        # Main builder functions
+        build_transcript_from_json_files,
+        build_vtt_from_json_files,
+        build_vtt_from_records,
+        build_vtt_string,
+        detect_chapters,
+        detect_chapters_array,
+        escape_vtt_text_many,
+        filter_by_confidence,
+        filter_by_confidence_array,
+        filter_segments_by_time,
+        filter_segments_by_time_array,
+        # Statistics functions
+        get_segments_stats,
+        group_by_speaker,
+        # Segment transformation functions
+        merge_segments,
+        # Podcast processing functions
+        remove_filler_words,
+        remove_repeated_phrases,
+        # Timestamp conversion functions
+        seconds_to_timestamp,
+        seconds_to_timestamp_array,
+        shift_timestamps,
+        shift_timestamps_array,
+        split_long_segments,
+        timestamp_to_seconds,
+        timestamp_to_seconds_array,
+        unescape_vtt_text,
+        unescape_vtt_text_many,
+        validate_segments,
+        # Validation functions
+        validate_vtt_file,
+        validate_vtt_string,
+        words_to_segments,
+    )
+    from vtt_builder._lowlevel import (
+        # Escape/Unescape utilities
+        escape_vtt_text_py as escape_vtt_text,
+    )
 
 __version__ = "0.5.0"
 
@@ -55,27 +69,38 @@ __all__ = [
     "build_vtt_string",
     # Validation
     "validate_vtt_file",
+    "validate_vtt_string",
     "validate_segments",
     # Escape/Unescape
     "escape_vtt_text",
     "unescape_vtt_text",
+    "escape_vtt_text_many",
+    "unescape_vtt_text_many",
     # Transformations
     "merge_segments",
     "split_long_segments",
     "shift_timestamps",
     "filter_segments_by_time",
+    "shift_timestamps_array",
+    "filter_segments_by_time_array",
     # Timestamp conversions
     "seconds_to_timestamp",
     "timestamp_to_seconds",
+    "seconds_to_timestamp_array",
+    "timestamp_to_seconds_array",
     # Statistics
     "get_segments_stats",
     # Podcast processing
     "remove_filler_words",
     "group_by_speaker",
     "filter_by_confidence",
+    "filter_by_confidence_array",
     "words_to_segments",
     "remove_repeated_phrases",
     "detect_chapters",
+    "detect_chapters_array",
+    # Columnar segments
+    "Segments",
     # Exceptions
     "VttError",
     "VttValidationError",
@@ -84,3 +109,22 @@ __all__ = [
     "VttCueError",
     "VttEscapingError",
 ]
+
+# Public names whose attribute on the extension module differs
+_ALIASES = {"escape_vtt_text": "escape_vtt_text_py"}
+
+
+def __getattr__(name):
+    # Resolve exports from the compiled extension on first access (PEP 562),
+    # so importing the package does not load it until something is used.
+    if name in __all__:
+        from vtt_builder import _lowlevel
+
+        value = getattr(_lowlevel, _ALIASES.get(name, name))
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
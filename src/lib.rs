@@ -1,9 +1,13 @@
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString};
 use pyo3::{create_exception, exceptions::PyValueError};
+use serde::de::{DeserializeOwned, IgnoredAny};
 use serde::Deserialize;
+use std::borrow::Cow;
+use std::collections::HashMap;
 use std::fs::File;
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, Read, Write};
 
 // Custom exception hierarchy for better error handling in Python
 create_exception!(vtt_builder, VttError, PyValueError);
@@ -16,7 +20,7 @@ create_exception!(vtt_builder, VttEscapingError, VttValidationError);
 // Maximum allowed timestamp in seconds (99:59:59.999)
 const MAX_TIMESTAMP_SECONDS: f64 = 359999.999;
 
-#[derive(Deserialize, Debug, Clone)]
+#[derive(Debug, Clone)]
 struct Segment {
     id: u32,
     start: f64,
@@ -24,10 +28,148 @@ struct Segment {
     text: String,
 }
 
+/// A JSON string that is type-checked while parsing but not kept.
+#[derive(Debug)]
+struct SkippedString;
+
+impl<'de> Deserialize<'de> for SkippedString {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct SkippedStringVisitor;
+
+        impl serde::de::Visitor<'_> for SkippedStringVisitor {
+            type Value = SkippedString;
+
+            fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+                formatter.write_str("a string")
+            }
+
+            fn visit_str<E: serde::de::Error>(self, _value: &str) -> Result<Self::Value, E> {
+                Ok(SkippedString)
+            }
+        }
+
+        deserializer.deserialize_str(SkippedStringVisitor)
+    }
+}
+
+/// The parts of a transcript file needed to build VTT cues.
+///
+/// The full `transcript` text is required but never copied out of the file,
+/// and segments are decoded straight into columnar storage.
+#[derive(Deserialize, Debug)]
+struct TranscriptSegments {
+    #[serde(rename = "transcript")]
+    _transcript: SkippedString,
+    segments: Segments,
+}
+
+/// Keys of a transcript segment object; any other key is skipped.
+#[derive(Deserialize)]
+#[serde(field_identifier, rename_all = "lowercase")]
+enum SegmentField {
+    Id,
+    Start,
+    End,
+    Text,
+    #[serde(other)]
+    Other,
+}
+
+/// Decodes one segment object (id, start, end, text) into `Segments`.
+///
+/// The text is appended to the shared text buffer as soon as the parser
+/// yields it, whether it was borrowed from the input or unescaped into the
+/// parser's scratch space, so no per-segment `String` is ever built.
+struct SegmentSeed<'s>(&'s mut Segments);
+
+impl<'de> serde::de::DeserializeSeed<'de> for SegmentSeed<'_> {
+    type Value = ();
+
+    fn deserialize<D: serde::Deserializer<'de>>(self, deserializer: D) -> Result<(), D::Error> {
+        const FIELDS: &[&str] = &["id", "start", "end", "text"];
+        deserializer.deserialize_struct("Segment", FIELDS, self)
+    }
+}
+
+impl<'de> serde::de::Visitor<'de> for SegmentSeed<'_> {
+    type Value = ();
+
+    fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+        formatter.write_str("a segment object")
+    }
+
+    fn visit_map<A: serde::de::MapAccess<'de>>(self, mut map: A) -> Result<(), A::Error> {
+        use serde::de::Error;
+
+        let segments = self.0;
+        let (mut id, mut start, mut end) = (None, None, None);
+        let mut has_text = false;
+
+        while let Some(field) = map.next_key::<SegmentField>()? {
+            match field {
+                SegmentField::Id if id.is_some() => return Err(A::Error::duplicate_field("id")),
+                SegmentField::Id => id = Some(map.next_value::<u32>()?),
+                SegmentField::Start if start.is_some() => {
+                    return Err(A::Error::duplicate_field("start"))
+                }
+                SegmentField::Start => start = Some(map.next_value::<f64>()?),
+                SegmentField::End if end.is_some() => return Err(A::Error::duplicate_field("end")),
+                SegmentField::End => end = Some(map.next_value::<f64>()?),
+                SegmentField::Text if has_text => return Err(A::Error::duplicate_field("text")),
+                SegmentField::Text => {
+                    map.next_value_seed(AppendedText(&mut segments.text))?;
+                    has_text = true;
+                }
+                SegmentField::Other => {
+                    map.next_value::<IgnoredAny>()?;
+                }
+            }
+        }
+
+        let id = id.ok_or_else(|| A::Error::missing_field("id"))?;
+        let start = start.ok_or_else(|| A::Error::missing_field("start"))?;
+        let end = end.ok_or_else(|| A::Error::missing_field("end"))?;
+        if !has_text {
+            return Err(A::Error::missing_field("text"));
+        }
+
+        segments.finish_segment(id, start, end);
+        Ok(())
+    }
+}
+
+/// A JSON string appended to a buffer as it is parsed.
+struct AppendedText<'s>(&'s mut String);
+
+impl<'de> serde::de::DeserializeSeed<'de> for AppendedText<'_> {
+    type Value = ();
+
+    fn deserialize<D: serde::Deserializer<'de>>(self, deserializer: D) -> Result<(), D::Error> {
+        deserializer.deserialize_str(self)
+    }
+}
+
+impl serde::de::Visitor<'_> for AppendedText<'_> {
+    type Value = ();
+
+    fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+        formatter.write_str("a string")
+    }
+
+    fn visit_str<E: serde::de::Error>(self, value: &str) -> Result<(), E> {
+        self.0.push_str(value);
+        Ok(())
+    }
+}
+
+/// The parts of a transcript file needed to build a plain-text transcript.
+///
+/// `segments` is required but skipped without building any segment values.
 #[derive(Deserialize, Debug)]
-struct Transcript {
+struct TranscriptText {
     transcript: String,
-    segments: Vec<Segment>,
+    #[serde(rename = "segments")]
+    _segments: IgnoredAny,
 }
 
 /// Configuration options for VTT generation
@@ -81,13 +223,42 @@ fn extract_segment_data(
     segment_dict: &Bound<'_, PyDict>,
     idx: usize,
 ) -> PyResult<(u32, f64, f64, String)> {
-    let id: u32 = segment_dict
-        .get_item("id")?
+    let (id, start, end, text) = extract_segment_fields(segment_dict, idx)?;
+    let text = segment_text(&text)?.to_string();
+    Ok((id, start, end, text))
+}
+
+/// Like [`extract_segment_data`], but returns the segment's own `str` object
+/// for the text so callers can borrow it with [`segment_text`] instead of
+/// copying it.
+fn extract_segment_fields<'py>(
+    segment_dict: &Bound<'py, PyDict>,
+    idx: usize,
+) -> PyResult<(u32, f64, f64, Bound<'py, PyString>)> {
+    let id = extract_segment_id(segment_dict, idx)?;
+    let (start, end, text) = extract_segment_content(segment_dict)?;
+    Ok((id, start, end, text))
+}
+
+/// Reads a segment's 'id', defaulting to its 1-based position when the key
+/// is missing or not an integer.
+fn extract_segment_id(segment_dict: &Bound<'_, PyDict>, idx: usize) -> PyResult<u32> {
+    let py = segment_dict.py();
+    Ok(segment_dict
+        .get_item(pyo3::intern!(py, "id"))?
         .map(|v| v.extract().unwrap_or((idx + 1) as u32))
-        .unwrap_or((idx + 1) as u32);
+        .unwrap_or((idx + 1) as u32))
+}
+
+/// Reads a segment's required 'start', 'end' and 'text' fields.
+fn extract_segment_content<'py>(
+    segment_dict: &Bound<'py, PyDict>,
+) -> PyResult<(f64, f64, Bound<'py, PyString>)> {
+    // Interned keys are created once and have their hash cached
+    let py = segment_dict.py();
 
     let start: f64 = segment_dict
-        .get_item("start")?
+        .get_item(pyo3::intern!(py, "start"))?
         .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
         .extract()
         .map_err(|_| {
@@ -95,20 +266,72 @@ fn extract_segment_data(
         })?;
 
     let end: f64 = segment_dict
-        .get_item("end")?
+        .get_item(pyo3::intern!(py, "end"))?
         .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
         .extract()
         .map_err(|_| {
             pyo3::exceptions::PyTypeError::new_err("'end' must be a number (int or float)")
         })?;
 
-    let text: String = segment_dict
-        .get_item("text")?
+    let text = segment_dict
+        .get_item(pyo3::intern!(py, "text"))?
         .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-        .extract()
+        .downcast_into::<PyString>()
         .map_err(|_| pyo3::exceptions::PyTypeError::new_err("'text' must be a string"))?;
 
-    Ok((id, start, end, text))
+    Ok((start, end, text))
+}
+
+/// Builds an output segment dictionary, using interned keys.
+fn new_segment_dict<'py>(
+    py: Python<'py>,
+    id: u32,
+    start: f64,
+    end: f64,
+    text: impl IntoPyObject<'py>,
+) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new(py);
+    dict.set_item(pyo3::intern!(py, "id"), id)?;
+    dict.set_item(pyo3::intern!(py, "start"), start)?;
+    dict.set_item(pyo3::intern!(py, "end"), end)?;
+    dict.set_item(pyo3::intern!(py, "text"), text)?;
+    Ok(dict)
+}
+
+/// Borrows the UTF-8 contents of a segment's text without copying.
+fn segment_text<'a>(text: &'a Bound<'_, PyString>) -> PyResult<&'a str> {
+    text.to_str()
+        .map_err(|_| pyo3::exceptions::PyTypeError::new_err("'text' must be a string"))
+}
+
+/// Returns a segment's text with surrounding whitespace removed, as a Python
+/// string.
+///
+/// Text that is already trimmed, the usual case, is returned as the original
+/// object instead of being copied into a new `str`.
+fn trimmed_text<'py>(text: &Bound<'py, PyString>) -> PyResult<Bound<'py, PyString>> {
+    let full = segment_text(text)?;
+    let trimmed = full.trim();
+    if trimmed.len() == full.len() {
+        Ok(text.clone())
+    } else {
+        Ok(PyString::new(text.py(), trimmed))
+    }
+}
+
+/// Below this length, escaping scans bytes directly rather than through `memchr3`.
+const SHORT_TEXT_BYTES: usize = 16;
+
+/// Returns true for the bytes that must be escaped in cue text.
+#[inline(always)]
+fn is_vtt_special(byte: u8) -> bool {
+    matches!(byte, b'&' | b'<' | b'>')
+}
+
+/// Returns the index of the first `&`, `<` or `>` in a short byte string.
+#[inline(always)]
+fn find_vtt_special_short(bytes: &[u8]) -> Option<usize> {
+    bytes.iter().position(|&b| is_vtt_special(b))
 }
 
 /// Escapes special characters in text for WebVTT cue payload compliance.
@@ -118,10 +341,123 @@ fn extract_segment_data(
 /// - The less-than sign (<) - must be escaped as &lt;
 /// - The greater-than sign (>) - should be escaped as &gt;
 /// - The substring "-->" - must be escaped (we escape the > to prevent this)
-fn escape_vtt_text(text: &str) -> String {
-    text.replace('&', "&amp;")
-        .replace('<', "&lt;")
-        .replace('>', "&gt;")
+///
+/// Most cue text contains none of these characters, so the input is scanned
+/// once first and returned borrowed when there is nothing to escape. Only when
+/// a special character is found is a new string allocated. Short inputs count
+/// their hits to size it exactly; longer ones reserve a quarter of the
+/// remaining length as slack instead of scanning the text a second time just
+/// to count, growing the string in the rare case that is not enough.
+///
+/// The scans use `memchr3`, which selects the widest vector instructions the
+/// running CPU supports (AVX2 or SSE2 on x86_64, NEON on aarch64) at runtime.
+/// Inputs shorter than [`SHORT_TEXT_BYTES`] (most single words) are checked
+/// with a plain byte loop instead, skipping the vector setup entirely.
+fn escape_vtt_text(text: &str) -> Cow<'_, str> {
+    let bytes = text.as_bytes();
+    let short = bytes.len() < SHORT_TEXT_BYTES;
+    let first = if short {
+        find_vtt_special_short(bytes)
+    } else {
+        memchr::memchr3(b'&', b'<', b'>', bytes)
+    };
+    let Some(first) = first else {
+        return Cow::Borrowed(text);
+    };
+    // "&amp;" is the longest entity: at most 4 extra bytes per hit
+    let extra = if short {
+        let hits = bytes[first..]
+            .iter()
+            .filter(|&&b| is_vtt_special(b))
+            .count();
+        hits * 4
+    } else {
+        8 + (bytes.len() - first) / 4
+    };
+
+    // The prefix before the first hit is already known to be clean
+    let mut escaped = String::with_capacity(text.len() + extra);
+    escaped.push_str(&text[..first]);
+    push_escaped_vtt_text(&mut escaped, &text[first..]);
+
+    Cow::Owned(escaped)
+}
+
+/// Appends `text` to `out` with WebVTT special characters escaped.
+///
+/// Used by the cue writers so that escaped text goes straight into the
+/// output buffer instead of through an intermediate string. Short fragments
+/// (single words, when newlines are flattened) are scanned with a plain byte
+/// loop, as in [`escape_vtt_text`].
+fn push_escaped_vtt_text(out: &mut String, text: &str) {
+    let bytes = text.as_bytes();
+    if bytes.len() < SHORT_TEXT_BYTES {
+        let hits = bytes.iter().enumerate().filter(|(_, &b)| is_vtt_special(b));
+        push_with_entities(out, text, hits.map(|(i, _)| i));
+    } else {
+        push_with_entities(out, text, memchr::memchr3_iter(b'&', b'<', b'>', bytes));
+    }
+}
+
+/// Appends `text` to `out`, replacing the special characters at `hits`
+/// (ascending byte offsets) with their entities.
+#[inline(always)]
+fn push_with_entities(out: &mut String, text: &str, hits: impl Iterator<Item = usize>) {
+    let bytes = text.as_bytes();
+    let mut last = 0;
+    for i in hits {
+        let entity = match bytes[i] {
+            b'&' => "&amp;",
+            b'<' => "&lt;",
+            _ => "&gt;",
+        };
+        out.push_str(&text[last..i]);
+        out.push_str(entity);
+        last = i + 1;
+    }
+    out.push_str(&text[last..]);
+}
+
+/// Looks up the WebVTT entity starting right after an `&`.
+///
+/// Returns the replacement character and the number of bytes consumed after
+/// the `&` (including the terminating `;`), or `None` for unknown sequences.
+fn match_vtt_entity(rest: &[u8]) -> Option<(char, usize)> {
+    let (entity, replacement): (&[u8], char) = match rest.first()? {
+        b'a' => (b"amp;", '&'),
+        b'l' if rest.get(1) == Some(&b't') => (b"lt;", '<'),
+        b'l' => (b"lrm;", '\u{200E}'),
+        b'g' => (b"gt;", '>'),
+        b'n' => (b"nbsp;", '\u{00A0}'),
+        b'r' => (b"rlm;", '\u{200F}'),
+        b'#' => return match_decimal_reference(&rest[1..]),
+        _ => return None,
+    };
+    rest.starts_with(entity)
+        .then_some((replacement, entity.len()))
+}
+
+/// Decodes a decimal character reference such as `&#38;`, given the bytes
+/// after the `#`.
+///
+/// Returns the character and the bytes consumed after the `&`, as
+/// [`match_vtt_entity`] does. References to U+0000, surrogates and values
+/// past U+10FFFF are treated as unknown sequences.
+fn match_decimal_reference(digits: &[u8]) -> Option<(char, usize)> {
+    // U+10FFFF is 1114111, so no valid reference has more than 7 digits
+    let len = digits
+        .iter()
+        .take(8)
+        .take_while(|b| b.is_ascii_digit())
+        .count();
+    if len == 0 || len > 7 || digits.get(len) != Some(&b';') {
+        return None;
+    }
+    let value = digits[..len]
+        .iter()
+        .fold(0u32, |value, &digit| value * 10 + u32::from(digit - b'0'));
+    let decoded = char::from_u32(value).filter(|&c| c != '\0')?;
+    Some((decoded, len + 2))
 }
 
 /// Unescapes WebVTT escape sequences back to their original characters.
@@ -133,14 +469,40 @@ fn escape_vtt_text(text: &str) -> String {
 /// - &nbsp; -> non-breaking space
 /// - &lrm; -> left-to-right mark
 /// - &rlm; -> right-to-left mark
-#[pyfunction]
-fn unescape_vtt_text(text: &str) -> String {
-    text.replace("&amp;", "&")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&nbsp;", "\u{00A0}")
-        .replace("&lrm;", "\u{200E}")
-        .replace("&rlm;", "\u{200F}")
+/// - &#NNN; -> the character with that decimal code point
+///
+/// The text is decoded in a single forward pass that jumps between `&`
+/// characters with `memchr`, so replacement output is never decoded twice
+/// (`&amp;lt;` becomes `&lt;`, not `<`). Text without any recognized entity,
+/// including text whose only `&` characters are literal ones such as
+/// "Tom & Jerry", is returned borrowed.
+fn unescape_vtt_text(text: &str) -> Cow<'_, str> {
+    let bytes = text.as_bytes();
+    let Some(first) =
+        memchr::memchr_iter(b'&', bytes).find(|&amp| match_vtt_entity(&bytes[amp + 1..]).is_some())
+    else {
+        return Cow::Borrowed(text);
+    };
+
+    // Every entity decodes to fewer bytes than it occupies
+    let mut unescaped = String::with_capacity(text.len());
+    let mut last = 0;
+    let mut search = first;
+    while let Some(offset) = memchr::memchr(b'&', &bytes[search..]) {
+        let amp = search + offset;
+        match match_vtt_entity(&bytes[amp + 1..]) {
+            Some((replacement, len)) => {
+                unescaped.push_str(&text[last..amp]);
+                unescaped.push(replacement);
+                last = amp + 1 + len;
+                search = last;
+            }
+            None => search = amp + 1,
+        }
+    }
+    unescaped.push_str(&text[last..]);
+
+    Cow::Owned(unescaped)
 }
 
 /// Validates a single segment for WebVTT compliance.
@@ -151,158 +513,459 @@ fn unescape_vtt_text(text: &str) -> String {
 /// - Text is not empty (after trimming)
 /// - Text doesn't contain forbidden "-->" substring
 fn validate_segment(segment: &Segment) -> PyResult<()> {
-    if segment.start < 0.0 {
+    validate_cue(segment.id, segment.start, segment.end, &segment.text)
+}
+
+/// Validates one cue's fields; see [`validate_segment`].
+fn validate_cue(id: u32, start: f64, end: f64, text: &str) -> PyResult<()> {
+    if start < 0.0 {
         return Err(timestamp_error(&format!(
             "Segment {}: start time cannot be negative (got {})",
-            segment.id, segment.start
+            id, start
         )));
     }
 
-    if segment.end < 0.0 {
+    if end < 0.0 {
         return Err(timestamp_error(&format!(
             "Segment {}: end time cannot be negative (got {})",
-            segment.id, segment.end
+            id, end
         )));
     }
 
-    if segment.end < segment.start {
+    if end < start {
         return Err(timestamp_error(&format!(
             "Segment {}: end time ({}) must be >= start time ({})",
-            segment.id, segment.end, segment.start
+            id, end, start
         )));
     }
 
     // Check for very large timestamps that could cause overflow
-    if segment.start > MAX_TIMESTAMP_SECONDS || segment.end > MAX_TIMESTAMP_SECONDS {
+    if start > MAX_TIMESTAMP_SECONDS || end > MAX_TIMESTAMP_SECONDS {
         return Err(timestamp_error(&format!(
             "Segment {}: timestamp exceeds maximum allowed value (99:59:59.999)",
-            segment.id
+            id
         )));
     }
 
-    if segment.text.trim().is_empty() {
+    validate_cue_text(id, text)
+}
+
+/// Validates one cue's text; the text half of [`validate_cue`].
+fn validate_cue_text(id: u32, text: &str) -> PyResult<()> {
+    if text.trim().is_empty() {
         return Err(cue_error(&format!(
             "Segment {}: cue text cannot be empty",
-            segment.id
+            id
         )));
     }
 
     // Check for forbidden substring (before escaping)
-    if segment.text.contains("-->") {
+    if text.contains("-->") {
         return Err(cue_error(&format!(
             "Segment {}: cue text contains forbidden substring '-->'. \
              This will be escaped automatically, but you may want to review the content.",
-            segment.id
+            id
         )));
     }
 
     Ok(())
 }
 
-/// Formats a timestamp with optional short format (MM:SS.mmm when hours = 0).
+/// Returns true when every start/end pair passes the timestamp checks of
+/// [`validate_cue`].
 ///
-/// The WebVTT spec allows timestamps without hours component when the time
-/// is less than one hour. This can make files more readable for short videos.
-fn format_timestamp_flexible(seconds: f64, use_short_format: bool) -> String {
+/// The whole column is reduced without branching, so the check vectorises.
+/// NaN fails it here even though `validate_cue` lets it through, so a
+/// `false` only means the caller has to run `validate_cue` per cue to find
+/// (or rule out) the first error.
+fn cue_times_valid(starts: &[f64], ends: &[f64]) -> bool {
+    starts.iter().zip(ends).fold(true, |valid, (&start, &end)| {
+        valid & (start >= 0.0) & (end >= start) & (end <= MAX_TIMESTAMP_SECONDS)
+    })
+}
+
+/// Appends `value` to `out` as a zero-padded decimal of at least `width` digits.
+fn push_padded(out: &mut String, value: u64, width: usize) {
+    let mut buffer = itoa::Buffer::new();
+    let digits = buffer.format(value);
+    for _ in digits.len()..width {
+        out.push('0');
+    }
+    out.push_str(digits);
+}
+
+/// Appends a timestamp with optional short format (MM:SS.mmm when hours = 0).
+///
+/// Fields are written digit by digit rather than through `format!`, since
+/// this runs twice for every cue. The fixed-width "MM:SS.mmm" tail is
+/// rendered as ASCII bytes on the stack, then appended.
+fn push_timestamp(out: &mut String, seconds: f64, use_short_format: bool) {
     let total_millis = (seconds * 1000.0).round() as u64;
     let hours = total_millis / 3_600_000;
     let minutes = (total_millis / 60_000) % 60;
     let secs = (total_millis / 1_000) % 60;
     let millis = total_millis % 1_000;
 
-    if use_short_format && hours == 0 {
-        format!("{:02}:{:02}.{:03}", minutes, secs, millis)
+    if !(use_short_format && hours == 0) {
+        push_padded(out, hours, 2);
+        out.push(':');
+    }
+
+    let digit = |value: u64| b'0' + value as u8;
+    let tail = [
+        digit(minutes / 10),
+        digit(minutes % 10),
+        b':',
+        digit(secs / 10),
+        digit(secs % 10),
+        b'.',
+        digit(millis / 100),
+        digit(millis / 10 % 10),
+        digit(millis % 10),
+    ];
+    // Every byte is an ASCII digit or separator, so each maps to one char
+    out.extend(tail.iter().map(|&byte| byte as char));
+}
+
+/// Formats a timestamp with optional short format (MM:SS.mmm when hours = 0).
+///
+/// The WebVTT spec allows timestamps without hours component when the time
+/// is less than one hour. This can make files more readable for short videos.
+#[cfg(test)]
+fn format_timestamp_flexible(seconds: f64, use_short_format: bool) -> String {
+    let mut timestamp = String::with_capacity(12);
+    push_timestamp(&mut timestamp, seconds, use_short_format);
+    timestamp
+}
+
+/// Appends `text` to `out`, escaping it if `escape` is set.
+fn push_cue_fragment(out: &mut String, text: &str, escape: bool) {
+    if escape {
+        push_escaped_vtt_text(out, text);
     } else {
-        format!("{:02}:{:02}:{:02}.{:03}", hours, minutes, secs, millis)
+        out.push_str(text);
     }
 }
 
-/// Cleans and prepares cue text for WebVTT output.
+/// Appends `text` with surrounding whitespace removed and every inner
+/// whitespace run collapsed to a single space (as joining
+/// `split_whitespace` with spaces would).
+///
+/// Words that are already separated by lone spaces are copied as one
+/// fragment, so typical single-line cue text is escaped and copied in one
+/// go rather than word by word.
+fn push_flattened_text(out: &mut String, text: &str, escape: bool) {
+    let text = text.trim();
+    let mut run_start = 0;
+    let mut prev_end = 0;
+
+    for (pos, ws) in text.match_indices(char::is_whitespace) {
+        let end = pos + ws.len();
+        let lone_space =
+            ws == " " && prev_end != pos && !text[end..].starts_with(char::is_whitespace);
+        prev_end = end;
+        if lone_space {
+            continue;
+        }
+
+        // First character of a gap: flush the words before it
+        if run_start < pos {
+            push_cue_fragment(out, &text[run_start..pos], escape);
+            out.push(' ');
+        }
+        run_start = end;
+    }
+    push_cue_fragment(out, &text[run_start..], escape);
+}
+
+/// Appends cleaned cue text for WebVTT output to `out`.
 ///
 /// This function:
 /// 1. Optionally flattens newlines, carriage returns, and tabs to spaces
 /// 2. Normalizes whitespace (removes extra spaces)
 /// 3. Optionally escapes special characters for spec compliance
-fn prepare_cue_text(text: &str, config: &VttConfig) -> String {
-    let mut clean_text = if config.flatten_newlines {
-        text.replace(['\n', '\r', '\t'], " ")
-            .split_whitespace()
-            .collect::<Vec<&str>>()
-            .join(" ")
+fn push_cue_text(out: &mut String, text: &str, config: &VttConfig) {
+    if config.flatten_newlines {
+        push_flattened_text(out, text, config.escape_special_chars);
     } else {
-        text.trim().to_string()
-    };
-
-    if config.escape_special_chars {
-        clean_text = escape_vtt_text(&clean_text);
+        push_cue_fragment(out, text.trim(), config.escape_special_chars);
     }
+}
 
+/// Cleans and prepares cue text for WebVTT output.
+///
+/// See `push_cue_text` for the steps applied.
+#[cfg(test)]
+fn prepare_cue_text(text: &str, config: &VttConfig) -> String {
+    let mut clean_text = String::with_capacity(text.len());
+    push_cue_text(&mut clean_text, text, config);
     clean_text
 }
 
-/// Writes the VTT header block to output.
+/// Appends one cue block ("index", timing line, text, blank line) to `out`.
+fn push_cue(out: &mut String, index: usize, start: f64, end: f64, text: &str, config: &VttConfig) {
+    out.push_str(itoa::Buffer::new().format(index));
+    out.push('\n');
+    push_timestamp(out, start, config.use_short_timestamps);
+    out.push_str(" --> ");
+    push_timestamp(out, end, config.use_short_timestamps);
+    out.push('\n');
+    push_cue_text(out, text, config);
+    out.push_str("\n\n");
+}
+
+/// Rough per-cue size beyond the text: index, timing line and newlines.
+const CUE_OVERHEAD_BYTES: usize = 40;
+
+/// Cue output is written to files in chunks of about this many bytes.
+const CUE_WRITE_CHUNK_BYTES: usize = 64 * 1024;
+
+/// Output buffers larger than this are released after use instead of kept.
+const MAX_RETAINED_OUTPUT_BUFFER: usize = 16 * 1024 * 1024;
+
+thread_local! {
+    /// Per-thread buffer that VTT output is formatted into, reused across
+    /// calls so repeated builds do not regrow a fresh `String` each time.
+    static OUTPUT_BUFFER: std::cell::RefCell<String> = const { std::cell::RefCell::new(String::new()) };
+}
+
+/// Runs `f` with this thread's output buffer, cleared and holding at least
+/// `capacity` bytes of space.
+///
+/// `f` can run Python code (`__float__` during field extraction, `__del__`
+/// when a GC pass triggers) that starts another build on this thread. Such a
+/// nested call finds the buffer borrowed and uses a local one instead.
+fn with_output_buffer<R>(capacity: usize, f: impl FnOnce(&mut String) -> R) -> R {
+    OUTPUT_BUFFER.with(|buffer| {
+        let Ok(mut buffer) = buffer.try_borrow_mut() else {
+            return f(&mut String::with_capacity(capacity));
+        };
+        buffer.clear();
+        buffer.reserve(capacity);
+
+        let result = f(&mut buffer);
+
+        if buffer.capacity() > MAX_RETAINED_OUTPUT_BUFFER {
+            *buffer = String::new();
+        }
+        result
+    })
+}
+
+/// Appends the VTT header block to `out`.
 ///
 /// The header includes:
 /// - Required "WEBVTT" signature
 /// - Optional header text (e.g., "WEBVTT - Video Captions")
 /// - Optional metadata lines (e.g., "Kind: captions", "Language: en")
 /// - Required blank line separator
-fn write_vtt_header<W: Write>(output: &mut W, config: &VttConfig) -> Result<(), std::io::Error> {
+fn push_vtt_header(out: &mut String, config: &VttConfig) {
     // Write WEBVTT signature with optional header text
+    out.push_str("WEBVTT");
     if let Some(ref header_text) = config.header_text {
-        writeln!(output, "WEBVTT - {}", header_text)?;
-    } else {
-        writeln!(output, "WEBVTT")?;
+        out.push_str(" - ");
+        out.push_str(header_text);
     }
+    out.push('\n');
 
     // Write optional metadata
     for (key, value) in &config.metadata {
-        writeln!(output, "{}: {}", key, value)?;
+        out.push_str(key);
+        out.push_str(": ");
+        out.push_str(value);
+        out.push('\n');
     }
 
     // Blank line to separate header from content
-    writeln!(output)?;
-
-    Ok(())
+    out.push('\n');
 }
 
-/// Writes segments to the VTT file, updating the index and offset.
+/// Writes a complete VTT document: the header, then the cues of each
+/// transcript in order, numbered from 1.
 ///
-/// This function handles:
+/// Each transcript comes with the offset added to its timestamps. This
+/// function handles:
 /// - Text cleaning and escaping
 /// - Timestamp formatting
 /// - Cue identifier generation
 /// - Proper VTT cue block formatting
-fn write_segments_to_vtt<W: Write>(
-    segments: &[Segment],
-    offset: f64,
-    starting_index: usize,
+///
+/// Everything is formatted into one in-memory buffer that is flushed to
+/// `output` in large chunks regardless of transcript boundaries, so the
+/// writer sees a few big writes instead of several small ones per cue or
+/// per file.
+fn write_transcripts_to_vtt<'a, W: Write>(
+    transcripts: impl IntoIterator<Item = (&'a Segments, f64)>,
     output: &mut W,
     config: &VttConfig,
-) -> Result<(usize, f64), std::io::Error> {
-    let mut index = starting_index;
-
-    for segment in segments {
-        let start_time =
-            format_timestamp_flexible(segment.start + offset, config.use_short_timestamps);
-        let end_time = format_timestamp_flexible(segment.end + offset, config.use_short_timestamps);
-        let clean_text = prepare_cue_text(&segment.text, config);
-
-        writeln!(
-            output,
-            "{}\n{} --> {}\n{}\n",
-            index, start_time, end_time, clean_text
-        )?;
-        index += 1;
-    }
+) -> Result<(), std::io::Error> {
+    with_output_buffer(CUE_WRITE_CHUNK_BYTES + 1024, |buffer| {
+        push_vtt_header(buffer, config);
+
+        let mut index = 1;
+        for (segments, offset) in transcripts {
+            for idx in 0..segments.len() {
+                push_cue(
+                    buffer,
+                    index,
+                    segments.starts[idx] + offset,
+                    segments.ends[idx] + offset,
+                    segments.text_at(idx),
+                    config,
+                );
+                index += 1;
+
+                if buffer.len() >= CUE_WRITE_CHUNK_BYTES {
+                    output.write_all(buffer.as_bytes())?;
+                    buffer.clear();
+                }
+            }
+        }
+        output.write_all(buffer.as_bytes())
+    })
+}
+
+/// Read buffers larger than this are released after use instead of kept.
+const MAX_RETAINED_READ_BUFFER: usize = 16 * 1024 * 1024;
+
+thread_local! {
+    /// Per-thread buffer that transcript files are read into before parsing.
+    static READ_BUFFER: std::cell::RefCell<Vec<u8>> = const { std::cell::RefCell::new(Vec::new()) };
+}
+
+/// Files larger than this are parsed as a stream instead of read whole.
+const MAX_BUFFERED_FILE_BYTES: u64 = MAX_RETAINED_READ_BUFFER as u64;
 
-    let total_offset = if let Some(last_segment) = segments.last() {
-        offset + last_segment.end
+/// Read-ahead size used when streaming large transcript files.
+const STREAM_READ_BUFFER_BYTES: usize = 1024 * 1024;
+
+/// Converts a JSON parse error, keeping read failures as `IOError`.
+fn map_json_error(e: serde_json::Error) -> PyErr {
+    if e.is_io() {
+        pyo3::exceptions::PyIOError::new_err(e.to_string())
     } else {
-        offset
-    };
+        pyo3::exceptions::PyValueError::new_err(e.to_string())
+    }
+}
+
+/// Reads and parses a single transcript JSON file.
+///
+/// The whole file is read into a reused per-thread buffer and parsed with
+/// `serde_json::from_slice`, which is considerably faster than parsing
+/// through a `BufReader` and avoids a fresh allocation for every file.
+/// Files over [`MAX_BUFFERED_FILE_BYTES`] are instead parsed straight from a
+/// 1 MiB `BufReader`, so peak memory tracks the fields kept rather than the
+/// file size (a plain-text build of a huge file holds only its transcript).
+///
+/// `T` selects which fields are materialized: [`TranscriptSegments`] for VTT
+/// builds and [`TranscriptText`] for plain-text transcripts.
+fn read_transcript<T: DeserializeOwned>(file_path: &str) -> PyResult<T> {
+    let mut file = File::open(file_path).map_err(map_io_error)?;
+    let file_len = file.metadata().map_err(map_io_error)?.len();
+    if file_len > MAX_BUFFERED_FILE_BYTES {
+        let reader = BufReader::with_capacity(STREAM_READ_BUFFER_BYTES, file);
+        return serde_json::from_reader(reader).map_err(map_json_error);
+    }
+
+    READ_BUFFER.with(|buffer| {
+        let mut buffer = buffer.borrow_mut();
+        buffer.clear();
+
+        file.read_to_end(&mut buffer).map_err(map_io_error)?;
+        let transcript = serde_json::from_slice(&buffer).map_err(map_json_error);
+
+        if buffer.capacity() > MAX_RETAINED_READ_BUFFER {
+            *buffer = Vec::new();
+        }
+        transcript
+    })
+}
+
+/// Environment variable that caps the number of threads used to parse files.
+const THREADS_ENV_VAR: &str = "VTT_BUILDER_THREADS";
+
+/// Returns the maximum number of worker threads for parsing files.
+///
+/// This is `VTT_BUILDER_THREADS` when it is set to a positive integer and the
+/// number of available cores otherwise. It is resolved once, when the module
+/// is loaded, so builder calls never query the environment or the OS.
+fn worker_threads() -> usize {
+    static WORKERS: std::sync::OnceLock<usize> = std::sync::OnceLock::new();
+    *WORKERS.get_or_init(|| {
+        std::env::var(THREADS_ENV_VAR)
+            .ok()
+            .and_then(|value| value.trim().parse::<usize>().ok())
+            .filter(|&threads| threads > 0)
+            .unwrap_or_else(|| std::thread::available_parallelism().map_or(1, |n| n.get()))
+    })
+}
+
+/// Reads and parses transcript JSON files, preserving input order.
+///
+/// Files are independent, so with more than one file they are parsed on
+/// scoped worker threads (up to [`worker_threads`]) by [`map_in_order`].
+fn read_transcripts<T: DeserializeOwned + Send>(file_paths: &[String]) -> PyResult<Vec<T>> {
+    let workers = worker_threads().min(file_paths.len());
+    if workers < 2 {
+        return file_paths.iter().map(|p| read_transcript(p)).collect();
+    }
+    map_in_order(file_paths, workers, |p| read_transcript(p))
+}
 
-    Ok((index, total_offset))
+/// Applies `f` to every item on `workers` scoped threads, returning the
+/// results in input order.
+///
+/// Workers claim one item at a time from a shared counter instead of taking
+/// fixed chunks, so a single large transcript does not hold up the files
+/// queued behind it. After a failure no new items are claimed; every item
+/// before the failing one was already claimed, so the first error returned
+/// is always the one for the earliest failing item, exactly as in a
+/// sequential loop.
+fn map_in_order<I, T, E, F>(items: &[I], workers: usize, f: F) -> Result<Vec<T>, E>
+where
+    I: Sync,
+    T: Send,
+    E: Send,
+    F: Fn(&I) -> Result<T, E> + Sync,
+{
+    use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+
+    let next = AtomicUsize::new(0);
+    let failed = AtomicBool::new(false);
+
+    let mut results: Vec<(usize, Result<T, E>)> = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut claimed = Vec::new();
+                    while !failed.load(Ordering::Relaxed) {
+                        let idx = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(item) = items.get(idx) else {
+                            break;
+                        };
+                        let result = f(item);
+                        if result.is_err() {
+                            failed.store(true, Ordering::Relaxed);
+                        }
+                        claimed.push((idx, result));
+                    }
+                    claimed
+                })
+            })
+            .collect();
+
+        handles
+            .into_iter()
+            .flat_map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|panic| std::panic::resume_unwind(panic))
+            })
+            .collect()
+    });
+
+    results.sort_unstable_by_key(|(idx, _)| *idx);
+    results.into_iter().map(|(_, result)| result).collect()
 }
 
 /// Builds a VTT file from a list of JSON files.
@@ -327,6 +990,7 @@ fn write_segments_to_vtt<W: Write>(
 #[pyfunction]
 #[pyo3(signature = (file_paths, output_file, escape_text=true, validate_segments=true))]
 fn build_vtt_from_json_files(
+    py: Python<'_>,
     file_paths: Vec<String>,
     output_file: &str,
     escape_text: bool,
@@ -337,58 +1001,93 @@ fn build_vtt_from_json_files(
         ..Default::default()
     };
 
-    let mut output = File::create(output_file).map_err(map_io_error)?;
-    write_vtt_header(&mut output, &config).map_err(map_io_error)?;
-
-    let mut total_offset = 0.0;
-    let mut current_index = 1;
-
-    for file_path in file_paths {
-        let file = File::open(&file_path).map_err(map_io_error)?;
-        let reader = BufReader::new(file);
-        let transcript: Transcript = serde_json::from_reader(reader)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+    // No Python objects are touched below, so the GIL is released for the
+    // whole read/parse/write pipeline
+    py.detach(|| {
+        let transcripts = read_transcripts::<TranscriptSegments>(&file_paths)?;
 
         // Validate segments if requested
         if validate_segments {
-            for segment in &transcript.segments {
-                validate_segment(segment)?;
+            for segments in transcripts.iter().map(|t| &t.segments) {
+                for idx in 0..segments.len() {
+                    validate_cue(
+                        segments.ids[idx],
+                        segments.starts[idx],
+                        segments.ends[idx],
+                        segments.text_at(idx),
+                    )?;
+                }
             }
         }
 
-        let (new_index, new_offset) = write_segments_to_vtt(
-            &transcript.segments,
-            total_offset,
-            current_index,
-            &mut output,
-            &config,
-        )
-        .map_err(map_io_error)?;
-
-        current_index = new_index;
-        total_offset = new_offset;
-    }
+        // Each file's cues start where the previous file's last cue ended
+        let offsets = transcripts.iter().scan(0.0, |total_offset, transcript| {
+            let offset = *total_offset;
+            if let Some(last_end) = transcript.segments.ends.last() {
+                *total_offset += last_end;
+            }
+            Some(offset)
+        });
 
-    Ok(())
+        let mut output = File::create(output_file).map_err(map_io_error)?;
+        let files = transcripts.iter().map(|t| &t.segments).zip(offsets);
+        write_transcripts_to_vtt(files, &mut output, &config).map_err(map_io_error)
+    })
 }
 
 #[pyfunction]
-fn build_transcript_from_json_files(file_paths: Vec<String>, output_file: &str) -> PyResult<()> {
-    let mut output = File::create(output_file).map_err(map_io_error)?;
+fn build_transcript_from_json_files(
+    py: Python<'_>,
+    file_paths: Vec<String>,
+    output_file: &str,
+) -> PyResult<()> {
+    py.detach(|| {
+        let transcripts = read_transcripts::<TranscriptText>(&file_paths)?;
+
+        let mut output = File::create(output_file).map_err(map_io_error)?;
+
+        // Transcripts are separated by a blank line and written in one go
+        let capacity = transcripts.iter().map(|t| t.transcript.len() + 2).sum();
+        with_output_buffer(capacity, |buffer| {
+            for (index, transcript) in transcripts.iter().enumerate() {
+                if index > 0 {
+                    buffer.push('\n');
+                }
+                buffer.push_str(transcript.transcript.trim());
+                buffer.push('\n');
+            }
+            output.write_all(buffer.as_bytes()).map_err(map_io_error)
+        })
+    })
+}
 
-    for (index, file_path) in file_paths.iter().enumerate() {
-        let file = File::open(file_path).map_err(map_io_error)?;
-        let reader = BufReader::new(file);
-        let transcript: Transcript = serde_json::from_reader(reader)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+/// Per-record output reserved up front when cue text sizes are not yet known.
+const TYPICAL_RECORD_BYTES: usize = CUE_OVERHEAD_BYTES + 64;
 
-        writeln!(output, "{}", transcript.transcript.trim()).map_err(map_io_error)?;
+/// Appends a list of segment dictionaries to `out` as cues numbered from 1.
+///
+/// Each record's text is borrowed straight from its Python `str` and
+/// trimmed in place, so no per-segment `String` is built on the way to the
+/// output buffer.
+fn push_records_to_vtt(
+    out: &mut String,
+    segments_list: &Bound<'_, PyList>,
+    validate: bool,
+    config: &VttConfig,
+) -> PyResult<()> {
+    for (idx, segment) in segments_list.iter().enumerate() {
+        let segment_dict = segment.downcast::<PyDict>()?;
+        let (start, end, text) = extract_segment_content(segment_dict)?;
+        let text = segment_text(&text)?.trim();
 
-        if index < file_paths.len() - 1 {
-            writeln!(output).map_err(map_io_error)?;
+        // Cues are numbered by position; the 'id' field is only looked up
+        // for validation messages
+        if validate {
+            validate_cue(extract_segment_id(segment_dict, idx)?, start, end, text)?;
         }
-    }
 
+        push_cue(out, idx + 1, start, end, text, config);
+    }
     Ok(())
 }
 
@@ -425,33 +1124,22 @@ fn build_vtt_from_records(
     };
 
     let mut output = File::create(output_file).map_err(map_io_error)?;
-    write_vtt_header(&mut output, &config).map_err(map_io_error)?;
-
-    let mut segments = Vec::new();
-
-    for (idx, segment) in segments_list.iter().enumerate() {
-        let segment_dict = segment.downcast::<PyDict>()?;
-        let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
 
-        let segment = Segment {
-            id,
-            start,
-            end,
-            text: text.trim().to_string(),
-        };
+    // The header and all cues reach the file in a single write. Every record
+    // is validated first; if one fails, only the header is written
+    with_output_buffer(segments_list.len() * TYPICAL_RECORD_BYTES, |buffer| {
+        push_vtt_header(buffer, &config);
+        let header_len = buffer.len();
 
-        // Validate if requested
-        if validate_segments {
-            validate_segment(&segment)?;
+        let pushed = push_records_to_vtt(buffer, segments_list, validate_segments, &config);
+        if pushed.is_err() {
+            buffer.truncate(header_len);
         }
 
-        segments.push(segment);
-    }
-
-    write_segments_to_vtt(&segments, 0.0, 1, &mut output, &config).map_err(map_io_error)?;
-
-    Ok(())
-}
+        output.write_all(buffer.as_bytes()).map_err(map_io_error)?;
+        pushed
+    })
+}
 
 /// Validates a WebVTT file for spec compliance.
 ///
@@ -470,13 +1158,38 @@ fn build_vtt_from_records(
 #[pyfunction]
 fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
     let file = File::open(vtt_file).map_err(map_io_error)?;
-    let reader = BufReader::new(file);
+    validate_vtt_document(BufReader::with_capacity(VTT_READ_BUFFER_BYTES, file))
+}
+
+/// Validates WebVTT content held in a string, without touching the filesystem.
+///
+/// Runs exactly the checks of `validate_vtt_file`, raising the same
+/// exceptions, over the string's own UTF-8 buffer.
+///
+/// # Arguments
+/// * `content` - The complete VTT document
+///
+/// # Returns
+/// * `Ok(true)` if the document is valid
+/// * `Err(VttValidationError)` with specific error details if invalid
+///
+/// # Example
+/// ```python
+/// from vtt_builder import build_vtt_string, validate_vtt_string
+/// validate_vtt_string(build_vtt_string(segments))
+/// ```
+#[pyfunction]
+fn validate_vtt_string(content: &str) -> PyResult<bool> {
+    validate_vtt_document(content.as_bytes())
+}
 
-    let mut lines = reader.lines();
+/// Validates a complete VTT document read from `reader`; see
+/// [`validate_vtt_file`].
+fn validate_vtt_document<R: BufRead>(reader: R) -> PyResult<bool> {
+    let mut lines = VttLines::new(reader);
 
     // Check for the "WEBVTT" header (with BOM support)
-    if let Some(line_result) = lines.next() {
-        let header = line_result.map_err(map_io_error)?;
+    if let Some(header) = lines.next_line()? {
         // Remove UTF-8 BOM if present (U+FEFF)
         let header = header.trim_start_matches('\u{FEFF}');
         let header_trimmed = header.trim();
@@ -498,16 +1211,11 @@ fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
     }
 
     // Skip optional metadata headers until an empty line
-    for line_result in &mut lines {
-        let content = line_result.map_err(map_io_error)?;
-        if content.trim().is_empty() {
-            break;
-        }
-    }
+    lines.skip_block()?;
 
     // Validate the cues
-    while let Some(line_result) = lines.next() {
-        let line = line_result.map_err(map_io_error)?;
+    let mut identifier = String::new();
+    while let Some(line) = lines.next_line()? {
         let line_trimmed = line.trim();
 
         if line_trimmed.is_empty() {
@@ -520,31 +1228,27 @@ fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
             || line_trimmed.starts_with("REGION")
         {
             // Skip all lines until we find an empty line or EOF
-            for block_line_result in &mut lines {
-                let block_content = block_line_result.map_err(map_io_error)?;
-                if block_content.trim().is_empty() {
-                    break;
-                }
-            }
+            lines.skip_block()?;
             continue;
         }
 
         // Cue identifiers are optional; They can be any text line not containing "-->"
         if !line_trimmed.contains("-->") {
-            if let Some(next_result) = lines.next() {
-                let next_line = next_result.map_err(map_io_error)?;
+            identifier.clear();
+            identifier.push_str(line_trimmed);
+            if let Some(next_line) = lines.next_line()? {
                 let next_line_trimmed = next_line.trim();
                 if !is_valid_timing(next_line_trimmed) {
                     let msg = format!(
                         "Invalid timing line after cue identifier '{}': '{}'",
-                        line_trimmed, next_line_trimmed
+                        identifier, next_line_trimmed
                     );
                     return Err(timestamp_error(&msg));
                 }
             } else {
                 return Err(cue_error(&format!(
                     "Expected timing line after cue identifier '{}'",
-                    line_trimmed
+                    identifier
                 )));
             }
         } else if !is_valid_timing(line_trimmed) {
@@ -552,16 +1256,7 @@ fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
             return Err(timestamp_error(&msg));
         }
 
-        let mut has_text = false;
-        for cue_result in &mut lines {
-            let content = cue_result.map_err(map_io_error)?;
-            if content.trim().is_empty() {
-                break;
-            }
-            has_text = true;
-        }
-
-        if !has_text {
+        if !lines.skip_block()? {
             return Err(cue_error("Cue missing text content"));
         }
     }
@@ -569,6 +1264,81 @@ fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
     Ok(true)
 }
 
+/// Read buffer size used when validating VTT files.
+const VTT_READ_BUFFER_BYTES: usize = 64 * 1024;
+
+/// Line reader for VTT files that hands out lines without copying them.
+///
+/// Lines are split and stripped of their endings as by `BufRead::lines`, and
+/// invalid UTF-8 is still reported as an I/O error. A line that lies wholly
+/// inside the reader's buffer is located with `memchr` and borrowed from it
+/// in place; only lines that straddle a buffer refill are copied, into one
+/// reused `String`.
+struct VttLines<R> {
+    reader: R,
+    line: String,
+    /// Bytes of the previously returned line still to be consumed
+    pending: usize,
+}
+
+impl<R: BufRead> VttLines<R> {
+    fn new(reader: R) -> Self {
+        VttLines {
+            reader,
+            line: String::new(),
+            pending: 0,
+        }
+    }
+
+    /// Returns the next line without its line ending, or `None` at EOF.
+    fn next_line(&mut self) -> PyResult<Option<&str>> {
+        self.reader.consume(std::mem::take(&mut self.pending));
+
+        let available = self.reader.fill_buf().map_err(map_io_error)?;
+        if available.is_empty() {
+            return Ok(None);
+        }
+
+        if let Some(newline) = memchr::memchr(b'\n', available) {
+            self.pending = newline + 1;
+            let available = self.reader.fill_buf().map_err(map_io_error)?;
+            let line = &available[..newline];
+            let line = line.strip_suffix(b"\r").unwrap_or(line);
+            return match std::str::from_utf8(line) {
+                Ok(line) => Ok(Some(line)),
+                Err(_) => Err(map_io_error(std::io::Error::new(
+                    std::io::ErrorKind::InvalidData,
+                    "stream did not contain valid UTF-8",
+                ))),
+            };
+        }
+
+        // The line continues past the buffered data
+        self.line.clear();
+        self.reader
+            .read_line(&mut self.line)
+            .map_err(map_io_error)?;
+        let line = match self.line.strip_suffix('\n') {
+            Some(line) => line.strip_suffix('\r').unwrap_or(line),
+            None => &self.line,
+        };
+        Ok(Some(line))
+    }
+
+    /// Skips lines through the next blank line or EOF, returning whether any
+    /// non-blank line was skipped.
+    fn skip_block(&mut self) -> PyResult<bool> {
+        let mut skipped = false;
+        while let Some(line) = self.next_line()? {
+            if line.trim().is_empty() {
+                break;
+            }
+            skipped = true;
+        }
+        Ok(skipped)
+    }
+}
+
 /// Validates a WebVTT timing line (e.g., "00:00:00.000 --> 00:00:05.000").
 ///
 /// Checks:
@@ -577,18 +1347,27 @@ fn validate_vtt_file(vtt_file: &str) -> PyResult<bool> {
 /// - Optional cue settings after end timestamp
 fn is_valid_timing(line: &str) -> bool {
     // The timing line should have the format "start_time --> end_time [settings]"
-    let parts: Vec<&str> = line.split("-->").collect();
-    if parts.len() != 2 {
+    let Some((start_part, end_part)) = line.split_once("-->") else {
+        return false;
+    };
+    if end_part.contains("-->") {
         return false;
     }
 
-    let start_time = parts[0].trim();
-
     // End time may have cue settings after it (e.g., "00:05.000 position:50%")
-    let end_part = parts[1].trim();
     let end_time = end_part.split_whitespace().next().unwrap_or("");
 
-    is_valid_timestamp(start_time) && is_valid_timestamp(end_time)
+    is_valid_timestamp(start_part.trim()) && is_valid_timestamp(end_time)
+}
+
+/// Returns true if `field` is at least `min_len` ASCII digits.
+fn is_digit_field(field: &[u8], min_len: usize) -> bool {
+    field.len() >= min_len && field.iter().all(u8::is_ascii_digit)
+}
+
+/// Returns true if `field` is exactly two ASCII digits in the range 00-59.
+fn is_sexagesimal_field(field: &[u8]) -> bool {
+    matches!(field, [b'0'..=b'5', b'0'..=b'9'])
 }
 
 /// Validates a WebVTT timestamp format.
@@ -602,90 +1381,32 @@ fn is_valid_timing(line: &str) -> bool {
 /// - Minutes must be 0-59
 /// - Seconds must be 0-59
 /// - All components must be numeric
+///
+/// The trailing ":SS.mmm" part is fixed-width, so it is checked by position
+/// directly on the bytes; no intermediate strings or vectors are allocated.
 fn is_valid_timestamp(timestamp: &str) -> bool {
-    // Timestamp format: "MM:SS.mmm" or "HH:MM:SS.mmm"
-    let parts: Vec<&str> = timestamp.split('.').collect();
-    if parts.len() != 2 {
+    let bytes = timestamp.as_bytes();
+    let Some(split) = bytes.len().checked_sub(7) else {
         return false;
-    }
-
-    let time_part = parts[0];
-    let millis_part = parts[1];
+    };
 
-    // Milliseconds must be exactly 3 digits
-    if millis_part.len() != 3 || !millis_part.chars().all(|c| c.is_ascii_digit()) {
+    // Fixed-width tail: ":SS.mmm"
+    let (head, tail) = bytes.split_at(split);
+    if tail[0] != b':'
+        || !is_sexagesimal_field(&tail[1..3])
+        || tail[3] != b'.'
+        || !is_digit_field(&tail[4..], 3)
+    {
         return false;
     }
 
-    let time_parts: Vec<&str> = time_part.split(':').collect();
-
-    // Support both MM:SS and HH:MM:SS formats
-    match time_parts.len() {
-        2 => {
-            // MM:SS format
-            let minutes = time_parts[0];
-            let seconds = time_parts[1];
-
-            // Minutes must be at least 2 digits
-            if minutes.len() < 2 || !minutes.chars().all(|c| c.is_ascii_digit()) {
-                return false;
-            }
-
-            // Seconds must be exactly 2 digits and 0-59
-            if seconds.len() != 2 || !seconds.chars().all(|c| c.is_ascii_digit()) {
-                return false;
-            }
-
-            if let Ok(sec_val) = seconds.parse::<u32>() {
-                if sec_val > 59 {
-                    return false;
-                }
-            } else {
-                return false;
-            }
-
-            true
-        }
-        3 => {
-            // HH:MM:SS format
-            let hours = time_parts[0];
-            let minutes = time_parts[1];
-            let seconds = time_parts[2];
-
-            // Hours must be at least 2 digits (can be more for long videos)
-            if hours.len() < 2 || !hours.chars().all(|c| c.is_ascii_digit()) {
-                return false;
-            }
-
-            // Minutes must be exactly 2 digits and 0-59
-            if minutes.len() != 2 || !minutes.chars().all(|c| c.is_ascii_digit()) {
-                return false;
-            }
-
-            if let Ok(min_val) = minutes.parse::<u32>() {
-                if min_val > 59 {
-                    return false;
-                }
-            } else {
-                return false;
-            }
-
-            // Seconds must be exactly 2 digits and 0-59
-            if seconds.len() != 2 || !seconds.chars().all(|c| c.is_ascii_digit()) {
-                return false;
-            }
-
-            if let Ok(sec_val) = seconds.parse::<u32>() {
-                if sec_val > 59 {
-                    return false;
-                }
-            } else {
-                return false;
-            }
-
-            true
+    // Head is "MM" (at least 2 digits) or "HH:MM" (hours at least 2 digits
+    // for long videos, minutes exactly 2 digits and 0-59)
+    match head.iter().position(|&b| b == b':') {
+        None => is_digit_field(head, 2),
+        Some(colon) => {
+            is_digit_field(&head[..colon], 2) && is_sexagesimal_field(&head[colon + 1..])
         }
-        _ => false,
     }
 }
 
@@ -700,7 +1421,8 @@ fn is_valid_timestamp(timestamp: &str) -> bool {
 /// * `text` - The text to escape
 ///
 /// # Returns
-/// * String with special characters escaped
+/// * String with special characters escaped. When the text contains nothing
+///   to escape, the original `str` object is returned without copying.
 ///
 /// # Example
 /// ```python
@@ -709,8 +1431,105 @@ fn is_valid_timestamp(timestamp: &str) -> bool {
 /// # Returns: "Tom &amp; Jerry say 1 &lt; 2"
 /// ```
 #[pyfunction]
-fn escape_vtt_text_py(text: &str) -> String {
-    escape_vtt_text(text)
+fn escape_vtt_text_py<'py>(text: &Bound<'py, PyString>) -> PyResult<Bound<'py, PyString>> {
+    match escape_vtt_text(text.to_str()?) {
+        Cow::Borrowed(_) => Ok(text.clone()),
+        Cow::Owned(escaped) => Ok(PyString::new(text.py(), &escaped)),
+    }
+}
+
+/// Unescapes WebVTT escape sequences (Python-callable version).
+///
+/// Decodes &amp;, &lt;, &gt;, &nbsp;, &lrm;, &rlm; and decimal character
+/// references such as &#38; in a single pass.
+/// Unknown sequences are left untouched.
+///
+/// # Arguments
+/// * `text` - The text to unescape
+///
+/// # Returns
+/// * String with escape sequences decoded. When the text contains no `&`,
+///   the original `str` object is returned without copying.
+///
+/// # Example
+/// ```python
+/// from vtt_builder import unescape_vtt_text
+/// text = unescape_vtt_text("Tom &amp; Jerry")
+/// # Returns: "Tom & Jerry"
+/// ```
+#[pyfunction]
+#[pyo3(name = "unescape_vtt_text")]
+fn unescape_vtt_text_py<'py>(text: &Bound<'py, PyString>) -> PyResult<Bound<'py, PyString>> {
+    match unescape_vtt_text(text.to_str()?) {
+        Cow::Borrowed(_) => Ok(text.clone()),
+        Cow::Owned(unescaped) => Ok(PyString::new(text.py(), &unescaped)),
+    }
+}
+
+/// Applies a `&str -> Cow<str>` transform to every string in a list.
+///
+/// Strings the transform leaves unchanged are placed in the result list
+/// as-is, so only inputs that actually change allocate a new `PyString`.
+fn map_text_list<'py>(
+    texts: &Bound<'py, PyList>,
+    transform: fn(&str) -> Cow<'_, str>,
+) -> PyResult<Bound<'py, PyList>> {
+    let py = texts.py();
+    let mut results = Vec::with_capacity(texts.len());
+    for item in texts.iter() {
+        let text = item.downcast::<PyString>()?;
+        match transform(text.to_str()?) {
+            Cow::Borrowed(_) => results.push(item.clone()),
+            Cow::Owned(changed) => results.push(PyString::new(py, &changed).into_any()),
+        }
+    }
+    PyList::new(py, results)
+}
+
+/// Escapes special characters in a list of strings in one call.
+///
+/// Equivalent to `[escape_vtt_text(t) for t in texts]` but crosses the
+/// Python/Rust boundary once for the whole batch.
+///
+/// # Arguments
+/// * `texts` - List of strings to escape
+///
+/// # Returns
+/// * List of escaped strings in the same order. Strings that need no
+///   escaping are returned as the original objects.
+///
+/// # Example
+/// ```python
+/// from vtt_builder import escape_vtt_text_many
+/// escaped = escape_vtt_text_many(["Tom & Jerry", "plain"])
+/// # Returns: ["Tom &amp; Jerry", "plain"]
+/// ```
+#[pyfunction]
+fn escape_vtt_text_many<'py>(texts: &Bound<'py, PyList>) -> PyResult<Bound<'py, PyList>> {
+    map_text_list(texts, escape_vtt_text)
+}
+
+/// Unescapes WebVTT escape sequences in a list of strings in one call.
+///
+/// Equivalent to `[unescape_vtt_text(t) for t in texts]` but crosses the
+/// Python/Rust boundary once for the whole batch.
+///
+/// # Arguments
+/// * `texts` - List of strings to unescape
+///
+/// # Returns
+/// * List of unescaped strings in the same order. Strings without escape
+///   sequences are returned as the original objects.
+///
+/// # Example
+/// ```python
+/// from vtt_builder import unescape_vtt_text_many
+/// texts = unescape_vtt_text_many(["Tom &amp; Jerry", "1 &lt; 2"])
+/// # Returns: ["Tom & Jerry", "1 < 2"]
+/// ```
+#[pyfunction]
+fn unescape_vtt_text_many<'py>(texts: &Bound<'py, PyList>) -> PyResult<Bound<'py, PyList>> {
+    map_text_list(texts, unescape_vtt_text)
 }
 
 /// Validates segment data without writing to a file.
@@ -728,15 +1547,7 @@ fn validate_segments(segments_list: &Bound<'_, PyList>) -> PyResult<bool> {
     for (idx, segment) in segments_list.iter().enumerate() {
         let segment_dict = segment.downcast::<PyDict>()?;
         let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
-
-        let seg = Segment {
-            id,
-            start,
-            end,
-            text: text.trim().to_string(),
-        };
-
-        validate_segment(&seg)?;
+        validate_cue(id, start, end, text.trim())?;
     }
 
     Ok(true)
@@ -758,228 +1569,790 @@ fn validate_segments(segments_list: &Bound<'_, PyList>) -> PyResult<bool> {
 /// * String containing the complete VTT file content
 #[pyfunction]
 #[pyo3(signature = (segments_list, escape_text=true, validate=true))]
-fn build_vtt_string(
-    segments_list: &Bound<'_, PyList>,
+fn build_vtt_string<'py>(
+    py: Python<'py>,
+    segments_list: &Bound<'py, PyList>,
     escape_text: bool,
     validate: bool,
-) -> PyResult<String> {
+) -> PyResult<Bound<'py, PyString>> {
     let config = VttConfig {
         escape_special_chars: escape_text,
         ..Default::default()
     };
 
-    let mut output = Vec::new();
-    write_vtt_header(&mut output, &config)
-        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+    with_output_buffer(64 + segments_list.len() * TYPICAL_RECORD_BYTES, |output| {
+        push_vtt_header(output, &config);
+        push_records_to_vtt(output, segments_list, validate, &config)?;
+        Ok(PyString::new(py, output))
+    })
+}
 
-    let mut segments = Vec::new();
+// ============================================================================
+// Columnar Segment Storage
+// ============================================================================
 
-    for (idx, segment) in segments_list.iter().enumerate() {
-        let segment_dict = segment.downcast::<PyDict>()?;
-        let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
+/// Segment texts up to this length are shared between equal segments when
+/// converted to Python objects.
+const SHARED_TEXT_MAX_BYTES: usize = 32;
 
-        let segment = Segment {
-            id,
-            start,
-            end,
-            text: text.trim().to_string(),
-        };
+/// Segments stored column-wise instead of as a list of dictionaries.
+///
+/// Timestamps and ids live in contiguous vectors and all cue text is kept in
+/// a single string arena, so transformation passes walk flat memory and no
+/// per-segment Python objects exist until `to_dicts()` is called. The
+/// dictionary-based transform functions convert to and from this type
+/// internally; callers chaining several transforms can use it directly to
+/// skip those conversions.
+///
+/// # Example
+/// ```python
+/// from vtt_builder import Segments
+/// segments = Segments.from_dicts(records)
+/// merged = segments.merge(gap_threshold=0.5).split_long(max_chars=42)
+/// records = merged.to_dicts()
+/// ```
+#[pyclass(module = "vtt_builder", name = "Segments")]
+#[derive(Debug, Default)]
+struct Segments {
+    ids: Vec<u32>,
+    starts: Vec<f64>,
+    ends: Vec<f64>,
+    /// Concatenated text of all segments
+    text: String,
+    /// End offset of each segment's text in `text`
+    text_ends: Vec<usize>,
+    /// Set once a segment starts or ends before the one preceding it, which
+    /// rules out binary-searching the time columns
+    out_of_order: bool,
+    /// Last `to_vtt_string` result. Cleared by `append`, the only operation
+    /// that changes a `Segments` in place.
+    rendered_vtt: Option<RenderedVtt>,
+}
 
-        if validate {
-            validate_segment(&segment)?;
-        }
+/// A cached VTT rendering of a `Segments` and the options it was built with.
+#[derive(Debug)]
+struct RenderedVtt {
+    escape_text: bool,
+    validated: bool,
+    vtt: Py<PyString>,
+}
 
-        segments.push(segment);
+impl Clone for Segments {
+    /// Copies the columns; the clone starts without a cached rendering.
+    fn clone(&self) -> Self {
+        Segments {
+            ids: self.ids.clone(),
+            starts: self.starts.clone(),
+            ends: self.ends.clone(),
+            text: self.text.clone(),
+            text_ends: self.text_ends.clone(),
+            out_of_order: self.out_of_order,
+            rendered_vtt: None,
+        }
     }
-
-    write_segments_to_vtt(&segments, 0.0, 1, &mut output, &config)
-        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
-
-    String::from_utf8(output)
-        .map_err(|e| pyo3::exceptions::PyUnicodeDecodeError::new_err(("utf-8", e.to_string())))
 }
 
-/// Merges consecutive segments with gaps smaller than the threshold.
-///
-/// This is useful for:
-/// - Combining fragmented transcripts
-/// - Reducing the number of cues
-/// - Creating more readable captions
-///
-/// # Arguments
-/// * `segments_list` - List of segment dictionaries
-/// * `gap_threshold` - Maximum gap in seconds to merge (segments with gaps <= this are merged)
-///
-/// # Returns
-/// * List of merged segment dictionaries
-#[pyfunction]
-#[pyo3(signature = (segments_list, gap_threshold=0.5))]
-fn merge_segments(
-    py: Python<'_>,
-    segments_list: &Bound<'_, PyList>,
-    gap_threshold: f64,
-) -> PyResult<Py<PyList>> {
-    if segments_list.is_empty() {
-        return Ok(PyList::empty(py).into());
+impl Segments {
+    fn with_capacity(segments: usize, text_bytes: usize) -> Self {
+        Segments {
+            ids: Vec::with_capacity(segments),
+            starts: Vec::with_capacity(segments),
+            ends: Vec::with_capacity(segments),
+            text: String::with_capacity(text_bytes),
+            text_ends: Vec::with_capacity(segments),
+            out_of_order: false,
+            rendered_vtt: None,
+        }
     }
 
-    let mut segments = Vec::new();
+    fn len(&self) -> usize {
+        self.ids.len()
+    }
 
-    for (idx, segment) in segments_list.iter().enumerate() {
-        let segment_dict = segment.downcast::<PyDict>()?;
-        let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
+    fn push(&mut self, id: u32, start: f64, end: f64, text: &str) {
+        self.text.push_str(text);
+        self.finish_segment(id, start, end);
+    }
 
-        segments.push(Segment {
-            id,
-            start,
-            end,
-            text: text.trim().to_string(),
-        });
+    /// Appends a segment whose text has already been written to the end of
+    /// `self.text`, after the previous segment's text.
+    fn finish_segment(&mut self, id: u32, start: f64, end: f64) {
+        if let (Some(&last_start), Some(&last_end)) = (self.starts.last(), self.ends.last()) {
+            // Written so that NaN also marks the columns as unordered
+            if !(start >= last_start && end >= last_end) {
+                self.out_of_order = true;
+            }
+        } else if start.is_nan() || end.is_nan() {
+            self.out_of_order = true;
+        }
+        self.ids.push(id);
+        self.starts.push(start);
+        self.ends.push(end);
+        self.text_ends.push(self.text.len());
+    }
+
+    /// Time between the end of segment `idx - 1` and the start of `idx`.
+    ///
+    /// Merging and word grouping both split on this gap. It is a single
+    /// subtraction on two adjacent column entries, so it is recomputed where
+    /// needed rather than kept as a third column.
+    fn gap_before(&self, idx: usize) -> f64 {
+        self.starts[idx] - self.ends[idx - 1]
     }
 
-    // Perform merging
-    let mut merged = Vec::new();
-    let mut current = segments[0].clone();
+    fn text_at(&self, idx: usize) -> &str {
+        let begin = if idx == 0 { 0 } else { self.text_ends[idx - 1] };
+        &self.text[begin..self.text_ends[idx]]
+    }
 
-    for segment in &segments[1..] {
-        if segment.start - current.end <= gap_threshold {
-            // Merge: extend end time and concatenate text
-            current.end = segment.end;
-            current.text = format!("{} {}", current.text.trim(), segment.text.trim());
+    /// Copies the segments in `range`, column by column.
+    fn slice(&self, range: std::ops::Range<usize>) -> Segments {
+        let text_begin = if range.start == 0 {
+            0
         } else {
-            merged.push(current);
-            current = segment.clone();
+            self.text_ends[range.start - 1]
+        };
+        let text_end = self.text_ends[range.clone()]
+            .last()
+            .copied()
+            .unwrap_or(text_begin);
+
+        Segments {
+            ids: self.ids[range.clone()].to_vec(),
+            starts: self.starts[range.clone()].to_vec(),
+            ends: self.ends[range.clone()].to_vec(),
+            text: self.text[text_begin..text_end].to_string(),
+            text_ends: self.text_ends[range]
+                .iter()
+                .map(|end| end - text_begin)
+                .collect(),
+            out_of_order: self.out_of_order,
+            rendered_vtt: None,
         }
     }
-    merged.push(current);
 
-    // Convert back to Python list
-    let result = PyList::empty(py);
-    for (idx, seg) in merged.iter().enumerate() {
-        let dict = PyDict::new(py);
-        dict.set_item("id", (idx + 1) as u32)?;
-        dict.set_item("start", seg.start)?;
-        dict.set_item("end", seg.end)?;
-        dict.set_item("text", &seg.text)?;
-        result.append(dict)?;
+    /// Builds columns from segment dictionaries (id, start, end, text).
+    fn from_dict_list(segments_list: &Bound<'_, PyList>) -> PyResult<Self> {
+        let mut segments = Segments::with_capacity(segments_list.len(), 0);
+        for (idx, segment) in segments_list.iter().enumerate() {
+            let segment_dict = segment.downcast::<PyDict>()?;
+            let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
+            segments.push(id, start, end, text.trim());
+        }
+        Ok(segments)
     }
 
-    Ok(result.into())
-}
+    /// Creates a Python `str` for each segment's text.
+    ///
+    /// Word-level transcripts repeat the same short tokens ("the", "uh",
+    /// ",") many times, so equal texts up to `SHARED_TEXT_MAX_BYTES` share a
+    /// single object, much as `sys.intern` would, without keeping them alive
+    /// past the returned objects.
+    fn py_texts<'py>(&self, py: Python<'py>) -> Vec<Bound<'py, PyString>> {
+        let mut shared: HashMap<&str, Bound<'py, PyString>> = HashMap::new();
+        (0..self.len())
+            .map(|idx| {
+                let text = self.text_at(idx);
+                if text.len() > SHARED_TEXT_MAX_BYTES {
+                    return PyString::new(py, text);
+                }
+                shared
+                    .entry(text)
+                    .or_insert_with(|| PyString::new(py, text))
+                    .clone()
+            })
+            .collect()
+    }
 
-/// Splits segments that exceed a maximum character length.
-///
-/// This is useful for:
-/// - Ensuring readability of captions
-/// - Meeting platform character limits
-/// - Creating more digestible cue blocks
-///
-/// # Arguments
-/// * `segments_list` - List of segment dictionaries
-/// * `max_chars` - Maximum characters per segment
-///
-/// # Returns
-/// * List of segment dictionaries with long segments split
-#[pyfunction]
-#[pyo3(signature = (segments_list, max_chars=80))]
-fn split_long_segments(
-    py: Python<'_>,
-    segments_list: &Bound<'_, PyList>,
-    max_chars: usize,
-) -> PyResult<Py<PyList>> {
-    let result = PyList::empty(py);
-    let mut new_id = 1u32;
+    fn to_dict_list<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        // Built up front so the list is allocated at its final size
+        let mut dicts = Vec::with_capacity(self.len());
+        for (idx, text) in self.py_texts(py).into_iter().enumerate() {
+            dicts.push(new_segment_dict(
+                py,
+                self.ids[idx],
+                self.starts[idx],
+                self.ends[idx],
+                text,
+            )?);
+        }
+        PyList::new(py, dicts)
+    }
 
-    for segment in segments_list.iter() {
-        let segment_dict = segment.downcast::<PyDict>()?;
+    /// Merges segments separated by gaps <= `gap_threshold`, renumbering ids.
+    fn merged(&self, gap_threshold: f64) -> Segments {
+        // Runs are found from the time columns alone, before any text is
+        // touched. A run ends before every segment whose gap exceeds the
+        // threshold (or is NaN)
+        let joins_previous = |idx: usize| self.gap_before(idx) <= gap_threshold;
+        let run_ends: Vec<usize> = (1..self.len())
+            .filter(|&idx| !joins_previous(idx))
+            .chain((self.len() > 0).then_some(self.len()))
+            .collect();
+
+        let mut merged = Segments::with_capacity(run_ends.len(), self.text.len() + self.len());
+        let mut run_start = 0;
+        for run_end in run_ends {
+            // Each run is assembled in place at the end of the merged text,
+            // so the kept text is copied once
+            let run_begin = merged.text.len();
+            merged.text.push_str(self.text_at(run_start));
+            for idx in run_start + 1..run_end {
+                // Concatenate, trimming the text joined so far and the new piece
+                let run = &merged.text[run_begin..];
+                let leading = run.len() - run.trim_start().len();
+                merged.text.drain(run_begin..run_begin + leading);
+                let run_len = merged.text[run_begin..].trim_end().len();
+                merged.text.truncate(run_begin + run_len);
+                merged.text.push(' ');
+                merged.text.push_str(self.text_at(idx).trim());
+            }
 
-        let start: f64 = segment_dict
-            .get_item("start")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
-            .extract()?;
+            let id = merged.len() as u32 + 1;
+            merged.finish_segment(id, self.starts[run_start], self.ends[run_end - 1]);
+            run_start = run_end;
+        }
 
-        let end: f64 = segment_dict
-            .get_item("end")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
-            .extract()?;
+        merged
+    }
 
-        let text: String = segment_dict
-            .get_item("text")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-            .extract()?;
+    /// Splits segments longer than `max_chars` at word boundaries, renumbering
+    /// ids. Time is divided proportionally to the text length of each piece.
+    fn split_long(&self, max_chars: usize) -> Segments {
+        let mut result = Segments::with_capacity(self.len(), self.text.len());
+        let mut new_id = 1u32;
+
+        for idx in 0..self.len() {
+            let (start, end) = (self.starts[idx], self.ends[idx]);
+            let text = self.text_at(idx).trim();
+
+            if text.len() <= max_chars {
+                // No need to split
+                result.push(new_id, start, end, text);
+                new_id += 1;
+                continue;
+            }
 
-        let text = text.trim();
-
-        if text.len() <= max_chars {
-            // No need to split
-            let dict = PyDict::new(py);
-            dict.set_item("id", new_id)?;
-            dict.set_item("start", start)?;
-            dict.set_item("end", end)?;
-            dict.set_item("text", text)?;
-            result.append(dict)?;
-            new_id += 1;
-        } else {
-            // Split the segment
-            let words: Vec<&str> = text.split_whitespace().collect();
             let duration = end - start;
             let total_chars = text.len() as f64;
-
-            let mut current_text = String::new();
             let mut current_start = start;
+            // Characters in the pieces emitted so far. Each boundary is derived
+            // from this total rather than by adding up per-piece durations, so
+            // rounding does not accumulate along a long split.
+            let mut emitted_chars = 0;
+
+            if is_single_spaced_ascii(text) {
+                // Pieces are whole slices of the text, cut at the last space
+                // that fits, so they are copied in one go instead of word by word
+                let mut rest = text;
+                while let Some(cut) = split_point(rest.as_bytes(), max_chars) {
+                    result.text.push_str(&rest[..cut]);
+                    emitted_chars += cut;
+                    let current_end = start + (emitted_chars as f64 / total_chars) * duration;
+
+                    result.finish_segment(new_id, current_start, current_end);
+                    new_id += 1;
+
+                    current_start = current_end;
+                    rest = &rest[cut + 1..];
+                }
+                result.push(new_id, current_start, end, rest);
+                new_id += 1;
+                continue;
+            }
 
-            for word in words {
-                if !current_text.is_empty() && current_text.len() + word.len() + 1 > max_chars {
+            // Each piece is assembled in place at the end of the result text
+            let mut piece_begin = result.text.len();
+
+            for word in text.split_whitespace() {
+                let piece_len = result.text.len() - piece_begin;
+                if piece_len > 0 && piece_len + word.len() + 1 > max_chars {
                     // Save current segment
-                    let chars_in_segment = current_text.len() as f64;
-                    let segment_duration = (chars_in_segment / total_chars) * duration;
-                    let current_end = current_start + segment_duration;
-
-                    let dict = PyDict::new(py);
-                    dict.set_item("id", new_id)?;
-                    dict.set_item("start", current_start)?;
-                    dict.set_item("end", current_end)?;
-                    dict.set_item("text", current_text.trim())?;
-                    result.append(dict)?;
+                    emitted_chars += piece_len;
+                    let current_end = start + (emitted_chars as f64 / total_chars) * duration;
+
+                    result.finish_segment(new_id, current_start, current_end);
                     new_id += 1;
 
                     current_start = current_end;
-                    current_text = word.to_string();
-                } else {
-                    if !current_text.is_empty() {
-                        current_text.push(' ');
-                    }
-                    current_text.push_str(word);
+                    piece_begin = result.text.len();
+                } else if piece_len > 0 {
+                    result.text.push(' ');
                 }
+                result.text.push_str(word);
             }
 
             // Don't forget the last segment
-            if !current_text.is_empty() {
-                let dict = PyDict::new(py);
-                dict.set_item("id", new_id)?;
-                dict.set_item("start", current_start)?;
-                dict.set_item("end", end)?;
-                dict.set_item("text", current_text.trim())?;
-                result.append(dict)?;
+            if result.text.len() > piece_begin {
+                result.finish_segment(new_id, current_start, end);
                 new_id += 1;
             }
         }
+
+        result
     }
 
-    Ok(result.into())
-}
+    /// Groups word-level entries into sentence-like segments, renumbering ids.
+    ///
+    /// A new segment starts after sentence-ending punctuation, on a pause of at
+    /// least `pause_threshold`, or once the segment would exceed
+    /// `max_segment_duration`.
+    fn group_words(&self, max_segment_duration: f64, pause_threshold: f64) -> Segments {
+        fn ends_sentence(word: &str) -> bool {
+            word.ends_with('.') || word.ends_with('?') || word.ends_with('!')
+        }
 
-/// Formats seconds to a WebVTT timestamp string.
-///
+        let mut result = Segments::with_capacity(self.len() / 8 + 1, self.text.len() + self.len());
+        if self.len() == 0 {
+            return result;
+        }
+
+        // Each segment's words are joined in place at the end of the result text
+        result.text.push_str(self.text_at(0));
+        let mut segment_start = self.starts[0];
+        let mut segment_end = self.ends[0];
+        let mut last_word_ends_sentence = ends_sentence(self.text_at(0));
+
+        for idx in 1..self.len() {
+            let word = self.text_at(idx);
+            let (word_start, word_end) = (self.starts[idx], self.ends[idx]);
+            let current_duration = word_end - segment_start;
+
+            // Start a new segment on a pause, once the segment gets too long,
+            // on sentence-ending punctuation, or after the previous word ended
+            // a sentence
+            let should_break = self.gap_before(idx) >= pause_threshold
+                || current_duration > max_segment_duration
+                || ends_sentence(word)
+                || last_word_ends_sentence;
+
+            if should_break {
+                // Save current segment and start a new one
+                let id = result.len() as u32 + 1;
+                result.finish_segment(id, segment_start, segment_end);
+                segment_start = word_start;
+            } else {
+                // Continue current segment
+                result.text.push(' ');
+            }
+            result.text.push_str(word);
+            segment_end = word_end;
+
+            last_word_ends_sentence = ends_sentence(word);
+        }
+
+        // Output final segment
+        let id = result.len() as u32 + 1;
+        result.finish_segment(id, segment_start, segment_end);
+
+        result
+    }
+}
+
+/// Whether `text` is ASCII with words separated by exactly one space.
+///
+/// Splitting such text on whitespace and rejoining it with single spaces
+/// gives back the same bytes, so `Segments::split_long` can cut it into
+/// slices directly. Assumes `text` is already trimmed.
+fn is_single_spaced_ascii(text: &str) -> bool {
+    let bytes = text.as_bytes();
+    bytes.is_ascii()
+        && bytes.windows(2).fold(true, |single, pair| {
+            single & !(pair[0] == b' ' && pair[1] == b' ')
+        })
+        && !bytes.iter().any(|&byte| byte.wrapping_sub(b'\t') < 5)
+}
+
+/// Where `Segments::split_long` cuts single-spaced text that is longer than
+/// `max_chars`: the last space that leaves at most `max_chars` before it, or
+/// the first space when the leading word alone is too long.
+///
+/// # Returns
+/// * Byte offset of the space, or `None` when the text fits or has no space
+fn split_point(bytes: &[u8], max_chars: usize) -> Option<usize> {
+    if bytes.len() <= max_chars {
+        return None;
+    }
+    memchr::memrchr(b' ', &bytes[..=max_chars])
+        .filter(|&cut| cut > 0)
+        .or_else(|| memchr::memchr(b' ', bytes))
+}
+
+/// Decodes a JSON array of segment objects (id, start, end, text) directly
+/// into the columns, so no per-segment `String` is allocated.
+impl<'de> Deserialize<'de> for Segments {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct SegmentsVisitor;
+
+        impl<'de> serde::de::Visitor<'de> for SegmentsVisitor {
+            type Value = Segments;
+
+            fn expecting(&self, formatter: &mut std::fmt::Formatter) -> std::fmt::Result {
+                formatter.write_str("a list of segments")
+            }
+
+            fn visit_seq<A: serde::de::SeqAccess<'de>>(
+                self,
+                mut seq: A,
+            ) -> Result<Self::Value, A::Error> {
+                let mut segments = Segments::with_capacity(seq.size_hint().unwrap_or(0), 0);
+                while seq.next_element_seed(SegmentSeed(&mut segments))?.is_some() {}
+                Ok(segments)
+            }
+        }
+
+        deserializer.deserialize_seq(SegmentsVisitor)
+    }
+}
+
+#[pymethods]
+impl Segments {
+    #[new]
+    fn py_new() -> Self {
+        Segments::default()
+    }
+
+    /// Builds a `Segments` from a list of segment dictionaries.
+    ///
+    /// Uses the same rules as `build_vtt_from_records`: 'start', 'end' and
+    /// 'text' are required, a missing 'id' defaults to the 1-based position.
+    #[staticmethod]
+    fn from_dicts(segments_list: &Bound<'_, PyList>) -> PyResult<Self> {
+        Segments::from_dict_list(segments_list)
+    }
+
+    /// Builds a `Segments` from parallel columns.
+    ///
+    /// `starts` and `ends` are float64 buffers (`array.array("d")`, NumPy
+    /// arrays) and `texts` is a list of str of the same length. Texts are
+    /// trimmed as in `from_dicts` and ids run from 1.
+    #[staticmethod]
+    fn from_columns(
+        py: Python<'_>,
+        starts: PyBuffer<f64>,
+        ends: PyBuffer<f64>,
+        texts: &Bound<'_, PyList>,
+    ) -> PyResult<Self> {
+        let (starts, ends) = read_time_columns(py, &starts, &ends)?;
+        if texts.len() != starts.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "'texts' must have the same length as 'starts' (got {} and {})",
+                texts.len(),
+                starts.len()
+            )));
+        }
+
+        let mut segments = Segments::with_capacity(starts.len(), 0);
+        for (idx, text) in texts.iter().enumerate() {
+            let text = text.downcast::<PyString>()?.to_str()?;
+            segments.push(idx as u32 + 1, starts[idx], ends[idx], text.trim());
+        }
+        Ok(segments)
+    }
+
+    /// Converts back to a list of segment dictionaries.
+    fn to_dicts<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.to_dict_list(py)
+    }
+
+    /// Converts to a list of `(id, start, end, text)` tuples.
+    ///
+    /// A lighter record form than `to_dicts()`: a 4-tuple is a fraction of
+    /// the size of a dict and needs no key lookups to unpack.
+    fn to_tuples<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        let tuples = self
+            .py_texts(py)
+            .into_iter()
+            .enumerate()
+            .map(|(idx, text)| (self.ids[idx], self.starts[idx], self.ends[idx], text));
+        PyList::new(py, tuples)
+    }
+
+    /// Appends a single segment. `id` defaults to the next 1-based position
+    /// and the text is trimmed, as in `from_dicts`.
+    #[pyo3(signature = (start, end, text, id=None))]
+    fn append(&mut self, start: f64, end: f64, text: &str, id: Option<u32>) {
+        let id = id.unwrap_or(self.len() as u32 + 1);
+        self.push(id, start, end, text.trim());
+        self.rendered_vtt = None;
+    }
+
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Segments(len={})", self.len())
+    }
+
+    /// Segment ids, in order.
+    #[getter]
+    fn ids(&self) -> Vec<u32> {
+        self.ids.clone()
+    }
+
+    /// Segment start times, in order.
+    #[getter]
+    fn starts(&self) -> Vec<f64> {
+        self.starts.clone()
+    }
+
+    /// Segment end times, in order.
+    #[getter]
+    fn ends(&self) -> Vec<f64> {
+        self.ends.clone()
+    }
+
+    /// Segment start times as an `array.array("d")`.
+    ///
+    /// The values are packed C doubles, so they can be passed to the
+    /// `*_array` functions (or `numpy.frombuffer`) without a float object per
+    /// segment and without needing NumPy installed.
+    fn starts_array<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        new_double_array(py, &self.starts)
+    }
+
+    /// Segment end times as an `array.array("d")`; see `starts_array`.
+    fn ends_array<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        new_double_array(py, &self.ends)
+    }
+
+    /// Segment texts, in order.
+    #[getter]
+    fn texts<'py>(&self, py: Python<'py>) -> Vec<Bound<'py, PyString>> {
+        self.py_texts(py)
+    }
+
+    /// Columnar equivalent of `build_vtt_string`.
+    ///
+    /// The result is kept on the object and returned again by later calls
+    /// with the same options until `append` changes the segments, so
+    /// re-rendering an unchanged transcript costs nothing.
+    #[pyo3(signature = (escape_text=true, validate=true))]
+    fn to_vtt_string<'py>(
+        &mut self,
+        py: Python<'py>,
+        escape_text: bool,
+        validate: bool,
+    ) -> PyResult<Bound<'py, PyString>> {
+        if let Some(rendered) = &self.rendered_vtt {
+            if rendered.escape_text == escape_text && (rendered.validated || !validate) {
+                return Ok(rendered.vtt.bind(py).clone());
+            }
+        }
+
+        let config = VttConfig {
+            escape_special_chars: escape_text,
+            ..Default::default()
+        };
+        // With every timestamp known to be valid, only the text needs checking
+        let times_valid = validate && cue_times_valid(&self.starts, &self.ends);
+
+        let capacity = 64 + self.text.len() + self.len() * CUE_OVERHEAD_BYTES;
+        let vtt = with_output_buffer(capacity, |output| {
+            push_vtt_header(output, &config);
+            for idx in 0..self.len() {
+                let (start, end) = (self.starts[idx], self.ends[idx]);
+                let text = self.text_at(idx).trim();
+                if times_valid {
+                    validate_cue_text(self.ids[idx], text)?;
+                } else if validate {
+                    validate_cue(self.ids[idx], start, end, text)?;
+                }
+                push_cue(output, idx + 1, start, end, text, &config);
+            }
+            Ok::<_, PyErr>(PyString::new(py, output))
+        })?;
+
+        self.rendered_vtt = Some(RenderedVtt {
+            escape_text,
+            validated: validate,
+            vtt: vtt.clone().unbind(),
+        });
+        Ok(vtt)
+    }
+
+    /// Columnar equivalent of `merge_segments`.
+    #[pyo3(signature = (gap_threshold=0.5))]
+    fn merge(&self, gap_threshold: f64) -> Segments {
+        self.merged(gap_threshold)
+    }
+
+    /// Columnar equivalent of `split_long_segments`.
+    #[pyo3(name = "split_long", signature = (max_chars=80))]
+    fn py_split_long(&self, max_chars: usize) -> Segments {
+        self.split_long(max_chars)
+    }
+
+    /// Columnar equivalent of `words_to_segments`, treating each entry as a word.
+    #[pyo3(name = "group_words", signature = (max_segment_duration=10.0, pause_threshold=1.0))]
+    fn py_group_words(&self, max_segment_duration: f64, pause_threshold: f64) -> Segments {
+        self.group_words(max_segment_duration, pause_threshold)
+    }
+
+    /// Columnar equivalent of `shift_timestamps`.
+    fn shift(&self, offset_seconds: f64) -> PyResult<Segments> {
+        let mut shifted = self.clone();
+        shifted.out_of_order |= offset_seconds.is_nan();
+        let times = shifted.starts.iter_mut().zip(shifted.ends.iter_mut());
+        for (id, (start, end)) in self.ids.iter().zip(times) {
+            *start += offset_seconds;
+            *end += offset_seconds;
+            if *start < 0.0 || *end < 0.0 {
+                return Err(timestamp_error(&format!(
+                    "Segment {}: shifting by {} would result in negative timestamp",
+                    id, offset_seconds
+                )));
+            }
+        }
+        Ok(shifted)
+    }
+
+    /// Columnar equivalent of `get_segments_stats`.
+    fn stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        // Same left-to-right summation as the dict path, so totals match exactly
+        let total_duration = self
+            .starts
+            .iter()
+            .zip(&self.ends)
+            .fold(0.0, |total, (start, end)| total + (end - start));
+        let mut stats = SegmentStats {
+            num_segments: self.len(),
+            total_duration,
+            ..SegmentStats::default()
+        };
+
+        let mut begin = 0;
+        for &text_end in &self.text_ends {
+            stats.add_text(&self.text[begin..text_end]);
+            begin = text_end;
+        }
+        stats.to_dict(py)
+    }
+
+    /// Columnar equivalent of `detect_chapters`.
+    #[pyo3(signature = (min_chapter_duration=60.0, silence_threshold=3.0))]
+    fn detect_chapters<'py>(
+        &self,
+        py: Python<'py>,
+        min_chapter_duration: f64,
+        silence_threshold: f64,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let chapters = chapter_start_indices(
+            &self.starts,
+            &self.ends,
+            min_chapter_duration,
+            silence_threshold,
+        );
+        chapter_dict_list(py, &self.starts, &chapters)
+    }
+
+    /// Columnar equivalent of `filter_segments_by_time`. Ids are preserved.
+    ///
+    /// When starts and ends are both non-decreasing (the usual case for a
+    /// transcript), the overlapping segments form one contiguous window. It
+    /// is bracketed by binary search and copied as whole column slices.
+    fn filter_by_time(&self, start_time: f64, end_time: f64) -> Segments {
+        if !self.out_of_order {
+            return self.slice(ordered_overlap_window(
+                &self.starts,
+                &self.ends,
+                start_time,
+                end_time,
+            ));
+        }
+
+        let mut result = Segments::default();
+        for idx in 0..self.len() {
+            if self.ends[idx] >= start_time && self.starts[idx] <= end_time {
+                result.push(
+                    self.ids[idx],
+                    self.starts[idx],
+                    self.ends[idx],
+                    self.text_at(idx),
+                );
+            }
+        }
+        result
+    }
+}
+
+/// Merges consecutive segments with gaps smaller than the threshold.
+///
+/// This is useful for:
+/// - Combining fragmented transcripts
+/// - Reducing the number of cues
+/// - Creating more readable captions
+///
 /// # Arguments
-/// * `seconds` - Time in seconds (float)
-/// * `use_short_format` - If true and hours=0, returns MM:SS.mmm format
+/// * `segments_list` - List of segment dictionaries
+/// * `gap_threshold` - Maximum gap in seconds to merge (segments with gaps <= this are merged)
 ///
 /// # Returns
-/// * Formatted timestamp string (e.g., "00:01:23.456" or "01:23.456")
+/// * List of merged segment dictionaries
 #[pyfunction]
-#[pyo3(signature = (seconds, use_short_format=false))]
-fn seconds_to_timestamp(seconds: f64, use_short_format: bool) -> PyResult<String> {
+#[pyo3(signature = (segments_list, gap_threshold=0.5))]
+fn merge_segments(
+    py: Python<'_>,
+    segments_list: &Bound<'_, PyList>,
+    gap_threshold: f64,
+) -> PyResult<Py<PyList>> {
+    let segments = Segments::from_dict_list(segments_list)?;
+    Ok(segments.merged(gap_threshold).to_dict_list(py)?.unbind())
+}
+
+/// Splits segments that exceed a maximum character length.
+///
+/// This is useful for:
+/// - Ensuring readability of captions
+/// - Meeting platform character limits
+/// - Creating more digestible cue blocks
+///
+/// # Arguments
+/// * `segments_list` - List of segment dictionaries
+/// * `max_chars` - Maximum characters per segment
+///
+/// # Returns
+/// * List of segment dictionaries with long segments split
+#[pyfunction]
+#[pyo3(signature = (segments_list, max_chars=80))]
+fn split_long_segments(
+    py: Python<'_>,
+    segments_list: &Bound<'_, PyList>,
+    max_chars: usize,
+) -> PyResult<Py<PyList>> {
+    let mut segments = Segments::with_capacity(segments_list.len(), 0);
+
+    for segment in segments_list.iter() {
+        let (start, end, text) = extract_segment_content(segment.downcast::<PyDict>()?)?;
+        segments.push(0, start, end, text.to_str()?);
+    }
+
+    Ok(segments.split_long(max_chars).to_dict_list(py)?.unbind())
+}
+
+/// Number of entries in each direct-mapped timestamp conversion cache.
+const TIMESTAMP_CACHE_SLOTS: usize = 4;
+
+/// A `FORMAT_CACHE` slot: key, formatting buffer and the resulting string.
+type FormattedTimestamp = (u64, String, Option<Py<PyString>>);
+
+thread_local! {
+    /// Recently formatted timestamps, keyed by rounded milliseconds and the
+    /// short-format flag. Segment and word boundaries repeat the same values,
+    /// so a hit returns the already-built Python string without formatting or
+    /// allocating. The `String` is scratch space reused across misses.
+    static FORMAT_CACHE: std::cell::RefCell<[FormattedTimestamp; TIMESTAMP_CACHE_SLOTS]> =
+        const { std::cell::RefCell::new([const { (u64::MAX, String::new(), None) }; TIMESTAMP_CACHE_SLOTS]) };
+
+    /// Recently parsed timestamps, keyed by their bytes packed into a `u128`
+    /// plus length. Only successful parses are stored.
+    static PARSE_CACHE: std::cell::RefCell<[(u128, u8, f64); TIMESTAMP_CACHE_SLOTS]> =
+        const { std::cell::RefCell::new([(0, 0, 0.0); TIMESTAMP_CACHE_SLOTS]) };
+}
+
+/// Checks that `seconds` can be written as a WebVTT timestamp.
+fn check_timestamp_seconds(seconds: f64) -> PyResult<()> {
     if seconds < 0.0 {
         return Err(timestamp_error("Seconds cannot be negative"));
     }
@@ -989,7 +2362,97 @@ fn seconds_to_timestamp(seconds: f64, use_short_format: bool) -> PyResult<String
             MAX_TIMESTAMP_SECONDS
         )));
     }
-    Ok(format_timestamp_flexible(seconds, use_short_format))
+    Ok(())
+}
+
+/// Formats seconds to a WebVTT timestamp string.
+///
+/// # Arguments
+/// * `seconds` - Time in seconds (float)
+/// * `use_short_format` - If true and hours=0, returns MM:SS.mmm format
+///
+/// # Returns
+/// * Formatted timestamp string (e.g., "00:01:23.456" or "01:23.456")
+#[pyfunction]
+#[pyo3(signature = (seconds, use_short_format=false))]
+fn seconds_to_timestamp(
+    py: Python<'_>,
+    seconds: f64,
+    use_short_format: bool,
+) -> PyResult<Bound<'_, PyString>> {
+    check_timestamp_seconds(seconds)?;
+
+    let total_millis = (seconds * 1000.0).round() as u64;
+    let key = (total_millis << 1) | use_short_format as u64;
+    FORMAT_CACHE.with(|cache| {
+        let mut cache = cache.borrow_mut();
+        let (cached_key, buffer, cached) =
+            &mut cache[total_millis as usize % TIMESTAMP_CACHE_SLOTS];
+        if let Some(timestamp) = cached.as_ref().filter(|_| *cached_key == key) {
+            return Ok(timestamp.bind(py).clone());
+        }
+
+        buffer.clear();
+        push_timestamp(buffer, seconds, use_short_format);
+        let timestamp = PyString::new(py, buffer);
+        *cached_key = key;
+        *cached = Some(timestamp.clone().unbind());
+        Ok(timestamp)
+    })
+}
+
+/// Formats an array of seconds to WebVTT timestamp strings.
+///
+/// Array counterpart of `seconds_to_timestamp` for callers that keep segment
+/// times in columns (NumPy float64 arrays, `array.array("d")`, or any other
+/// buffer of doubles). The whole column is converted in one call, with the
+/// digits of each timestamp written into a single reused buffer.
+///
+/// # Arguments
+/// * `seconds` - Float64 buffer of times in seconds
+/// * `use_short_format` - If true, times under one hour use MM:SS.mmm format
+///
+/// # Returns
+/// * List of formatted timestamp strings, in input order
+///
+/// # Errors
+/// * `VttTimestampError` if any value is negative or exceeds the maximum
+#[pyfunction]
+#[pyo3(signature = (seconds, use_short_format=false))]
+fn seconds_to_timestamp_array<'py>(
+    py: Python<'py>,
+    seconds: PyBuffer<f64>,
+    use_short_format: bool,
+) -> PyResult<Bound<'py, PyList>> {
+    if seconds.dimensions() != 1 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "'seconds' must be one-dimensional",
+        ));
+    }
+    let values = seconds.to_vec(py)?;
+    for &value in &values {
+        check_timestamp_seconds(value)?;
+    }
+
+    // Adjacent entries often format identically (an end time followed by the
+    // next start, repeated word boundaries), so a run of equal timestamps
+    // shares the string built for its first entry
+    let mut timestamp = String::with_capacity(12);
+    let mut previous: Option<(u64, Bound<'py, PyString>)> = None;
+    let timestamps = values.iter().map(|&value| {
+        let total_millis = (value * 1000.0).round() as u64;
+        match &previous {
+            Some((millis, string)) if *millis == total_millis => string.clone(),
+            _ => {
+                timestamp.clear();
+                push_timestamp(&mut timestamp, value, use_short_format);
+                let string = PyString::new(py, &timestamp);
+                previous = Some((total_millis, string.clone()));
+                string
+            }
+        }
+    });
+    PyList::new(py, timestamps)
 }
 
 /// Parses a WebVTT timestamp string to seconds.
@@ -1005,16 +2468,77 @@ fn seconds_to_timestamp(seconds: f64, use_short_format: bool) -> PyResult<String
 /// * Time in seconds as float
 #[pyfunction]
 fn timestamp_to_seconds(timestamp: &str) -> PyResult<f64> {
-    let parts: Vec<&str> = timestamp.split('.').collect();
-    if parts.len() != 2 {
+    let bytes = timestamp.as_bytes();
+    if bytes.is_empty() || bytes.len() > 16 {
+        return parse_timestamp(timestamp);
+    }
+
+    let mut packed = [0u8; 16];
+    packed[..bytes.len()].copy_from_slice(bytes);
+    let key = u128::from_le_bytes(packed);
+    let len = bytes.len() as u8;
+    let slot = bytes[bytes.len() - 1] as usize % TIMESTAMP_CACHE_SLOTS;
+
+    PARSE_CACHE.with(|cache| {
+        let mut cache = cache.borrow_mut();
+        let (cached_key, cached_len, seconds) = &mut cache[slot];
+        if *cached_key == key && *cached_len == len {
+            return Ok(*seconds);
+        }
+        let parsed = parse_timestamp(timestamp)?;
+        (*cached_key, *cached_len, *seconds) = (key, len, parsed);
+        Ok(parsed)
+    })
+}
+
+/// Parses a list of WebVTT timestamp strings to seconds.
+///
+/// Array counterpart of `timestamp_to_seconds`: the whole list is parsed in
+/// one call and returned as an `array.array("d")`, ready for
+/// `shift_timestamps_array`, `filter_segments_by_time_array` or
+/// `numpy.frombuffer`. Each entry goes straight to the fixed-width fast path,
+/// skipping the per-call cache.
+///
+/// # Arguments
+/// * `timestamps` - List of timestamp strings (HH:MM:SS.mmm or MM:SS.mmm)
+///
+/// # Returns
+/// * `array.array("d")` of times in seconds, in input order
+///
+/// # Errors
+/// * `VttTimestampError` for the first timestamp that fails to parse
+/// * `TypeError` if an entry is not a string
+#[pyfunction]
+fn timestamp_to_seconds_array<'py>(
+    py: Python<'py>,
+    timestamps: &Bound<'py, PyList>,
+) -> PyResult<Bound<'py, PyAny>> {
+    let mut seconds = Vec::with_capacity(timestamps.len());
+    for item in timestamps.iter() {
+        let timestamp = item.downcast::<PyString>()?;
+        seconds.push(parse_timestamp(timestamp.to_str()?)?);
+    }
+    new_double_array(py, &seconds)
+}
+
+/// Parses a WebVTT timestamp string to seconds (uncached).
+///
+/// Fields are sliced out of the string in place, so no intermediate vectors
+/// are allocated on the success path.
+fn parse_timestamp(timestamp: &str) -> PyResult<f64> {
+    if let Some(seconds) = parse_canonical_timestamp(timestamp.as_bytes()) {
+        return Ok(seconds);
+    }
+
+    let Some((time_part, millis_str)) = timestamp
+        .split_once('.')
+        .filter(|(_, millis)| !millis.contains('.'))
+    else {
         return Err(timestamp_error(&format!(
             "Invalid timestamp format (missing milliseconds): '{}'",
             timestamp
         )));
-    }
-
-    let time_part = parts[0];
-    let millis_str = parts[1];
+    };
 
     if millis_str.len() != 3 {
         return Err(timestamp_error(&format!(
@@ -1023,59 +2547,51 @@ fn timestamp_to_seconds(timestamp: &str) -> PyResult<f64> {
         )));
     }
 
-    let millis: f64 = millis_str
-        .parse::<u32>()
-        .map_err(|_| timestamp_error(&format!("Invalid milliseconds value: '{}'", millis_str)))?
-        as f64
-        / 1000.0;
+    let millis = parse_timestamp_field(millis_str, "milliseconds")? as f64 / 1000.0;
 
-    let time_parts: Vec<&str> = time_part.split(':').collect();
+    let mut time_parts = time_part.split(':');
+    let fields = (
+        time_parts.next().unwrap_or(""),
+        time_parts.next(),
+        time_parts.next(),
+        time_parts.next(),
+    );
 
-    let seconds = match time_parts.len() {
-        2 => {
+    let seconds = match fields {
+        (minutes_str, Some(secs_str), None, None) => {
             // MM:SS format
-            let minutes: f64 = time_parts[0].parse::<u32>().map_err(|_| {
-                timestamp_error(&format!("Invalid minutes value: '{}'", time_parts[0]))
-            })? as f64;
-            let secs: f64 = time_parts[1].parse::<u32>().map_err(|_| {
-                timestamp_error(&format!("Invalid seconds value: '{}'", time_parts[1]))
-            })? as f64;
-
-            if secs >= 60.0 {
+            let minutes = parse_timestamp_field(minutes_str, "minutes")? as f64;
+            let secs = parse_timestamp_field(secs_str, "seconds")?;
+
+            if secs >= 60 {
                 return Err(timestamp_error(&format!(
                     "Seconds must be 0-59: '{}'",
-                    time_parts[1]
+                    secs_str
                 )));
             }
 
-            minutes * 60.0 + secs + millis
+            minutes * 60.0 + secs as f64 + millis
         }
-        3 => {
+        (hours_str, Some(minutes_str), Some(secs_str), None) => {
             // HH:MM:SS format
-            let hours: f64 = time_parts[0].parse::<u32>().map_err(|_| {
-                timestamp_error(&format!("Invalid hours value: '{}'", time_parts[0]))
-            })? as f64;
-            let minutes: f64 = time_parts[1].parse::<u32>().map_err(|_| {
-                timestamp_error(&format!("Invalid minutes value: '{}'", time_parts[1]))
-            })? as f64;
-            let secs: f64 = time_parts[2].parse::<u32>().map_err(|_| {
-                timestamp_error(&format!("Invalid seconds value: '{}'", time_parts[2]))
-            })? as f64;
-
-            if minutes >= 60.0 {
+            let hours = parse_timestamp_field(hours_str, "hours")? as f64;
+            let minutes = parse_timestamp_field(minutes_str, "minutes")?;
+            let secs = parse_timestamp_field(secs_str, "seconds")?;
+
+            if minutes >= 60 {
                 return Err(timestamp_error(&format!(
                     "Minutes must be 0-59: '{}'",
-                    time_parts[1]
+                    minutes_str
                 )));
             }
-            if secs >= 60.0 {
+            if secs >= 60 {
                 return Err(timestamp_error(&format!(
                     "Seconds must be 0-59: '{}'",
-                    time_parts[2]
+                    secs_str
                 )));
             }
 
-            hours * 3600.0 + minutes * 60.0 + secs + millis
+            hours * 3600.0 + minutes as f64 * 60.0 + secs as f64 + millis
         }
         _ => {
             return Err(timestamp_error(&format!(
@@ -1088,6 +2604,49 @@ fn timestamp_to_seconds(timestamp: &str) -> PyResult<f64> {
     Ok(seconds)
 }
 
+/// Parses the canonical "HH:MM:SS.mmm" and "MM:SS.mmm" layouts (two-digit
+/// fields, three-digit milliseconds) at fixed byte offsets.
+///
+/// Returns `None` for any other input, including out-of-range fields, so the
+/// general parser can handle or report it. Results are computed with the
+/// same expression as `parse_timestamp`, so both paths agree exactly.
+fn parse_canonical_timestamp(bytes: &[u8]) -> Option<f64> {
+    fn digits(field: &[u8]) -> Option<u32> {
+        field.iter().try_fold(0u32, |value, &b| {
+            b.is_ascii_digit().then(|| value * 10 + u32::from(b - b'0'))
+        })
+    }
+
+    let (hours, rest) = match bytes.len() {
+        12 if bytes[2] == b':' => (Some(digits(&bytes[..2])?), &bytes[3..]),
+        9 => (None, bytes),
+        _ => return None,
+    };
+    if rest[2] != b':' || rest[5] != b'.' {
+        return None;
+    }
+
+    let minutes = digits(&rest[..2])?;
+    let secs = digits(&rest[3..5])?;
+    let millis = digits(&rest[6..])? as f64 / 1000.0;
+    if secs >= 60 {
+        return None;
+    }
+
+    match hours {
+        None => Some(minutes as f64 * 60.0 + secs as f64 + millis),
+        Some(_) if minutes >= 60 => None,
+        Some(hours) => Some(hours as f64 * 3600.0 + minutes as f64 * 60.0 + secs as f64 + millis),
+    }
+}
+
+/// Parses one numeric timestamp field, naming it in the error message.
+fn parse_timestamp_field(field: &str, name: &str) -> PyResult<u32> {
+    field
+        .parse::<u32>()
+        .map_err(|_| timestamp_error(&format!("Invalid {} value: '{}'", name, field)))
+}
+
 /// Calculates statistics for a list of segments.
 ///
 /// Returns a dictionary with:
@@ -1107,67 +2666,102 @@ fn timestamp_to_seconds(timestamp: &str) -> PyResult<f64> {
 /// * Dictionary with statistics
 #[pyfunction]
 fn get_segments_stats(py: Python<'_>, segments_list: &Bound<'_, PyList>) -> PyResult<Py<PyDict>> {
-    let stats = PyDict::new(py);
+    let mut stats = SegmentStats::default();
 
-    if segments_list.is_empty() {
-        stats.set_item("total_duration", 0.0)?;
-        stats.set_item("num_segments", 0)?;
-        stats.set_item("avg_duration", 0.0)?;
-        stats.set_item("total_words", 0)?;
-        stats.set_item("total_chars", 0)?;
-        stats.set_item("avg_words_per_segment", 0.0)?;
-        stats.set_item("avg_chars_per_segment", 0.0)?;
-        stats.set_item("words_per_second", 0.0)?;
-        return Ok(stats.into());
+    for segment in segments_list.iter() {
+        let (start, end, text) = extract_segment_content(segment.downcast::<PyDict>()?)?;
+        stats.add(start, end, text.to_str()?);
     }
 
-    let mut total_duration = 0.0f64;
-    let mut total_words = 0usize;
-    let mut total_chars = 0usize;
-    let num_segments = segments_list.len();
+    Ok(stats.to_dict(py)?.unbind())
+}
 
-    for segment in segments_list.iter() {
-        let segment_dict = segment.downcast::<PyDict>()?;
+/// Running totals behind `get_segments_stats` and `Segments.stats`.
+#[derive(Default)]
+struct SegmentStats {
+    num_segments: usize,
+    total_duration: f64,
+    total_words: usize,
+    total_chars: usize,
+}
 
-        let start: f64 = segment_dict
-            .get_item("start")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
-            .extract()?;
+impl SegmentStats {
+    fn add(&mut self, start: f64, end: f64, text: &str) {
+        self.num_segments += 1;
+        self.total_duration += end - start;
+        self.add_text(text);
+    }
 
-        let end: f64 = segment_dict
-            .get_item("end")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
-            .extract()?;
+    fn add_text(&mut self, text: &str) {
+        let (words, chars) = count_words_and_chars(text);
+        self.total_words += words;
+        self.total_chars += chars;
+    }
 
-        let text: String = segment_dict
-            .get_item("text")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-            .extract()?;
+    fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let per_segment = |total: f64| {
+            if self.num_segments == 0 {
+                0.0
+            } else {
+                total / self.num_segments as f64
+            }
+        };
+        let words_per_second = if self.total_duration > 0.0 {
+            self.total_words as f64 / self.total_duration
+        } else {
+            0.0
+        };
 
-        total_duration += end - start;
-        total_words += text.split_whitespace().count();
-        total_chars += text.trim().len();
+        let stats = PyDict::new(py);
+        stats.set_item("total_duration", self.total_duration)?;
+        stats.set_item("num_segments", self.num_segments)?;
+        stats.set_item("avg_duration", per_segment(self.total_duration))?;
+        stats.set_item("total_words", self.total_words)?;
+        stats.set_item("total_chars", self.total_chars)?;
+        stats.set_item(
+            "avg_words_per_segment",
+            per_segment(self.total_words as f64),
+        )?;
+        stats.set_item(
+            "avg_chars_per_segment",
+            per_segment(self.total_chars as f64),
+        )?;
+        stats.set_item("words_per_second", words_per_second)?;
+        Ok(stats)
     }
+}
 
-    let avg_duration = total_duration / num_segments as f64;
-    let avg_words = total_words as f64 / num_segments as f64;
-    let avg_chars = total_chars as f64 / num_segments as f64;
-    let words_per_second = if total_duration > 0.0 {
-        total_words as f64 / total_duration
-    } else {
-        0.0
-    };
+/// Counts the whitespace-separated words in `text` and the length of its
+/// trimmed form, without allocating.
+///
+/// ASCII text is scanned bytewise: a word starts at every non-space byte that
+/// follows a space (or the start), counted without branching so the loop
+/// vectorises.
+fn count_words_and_chars(text: &str) -> (usize, usize) {
+    if !text.is_ascii() {
+        return (text.split_whitespace().count(), text.trim().len());
+    }
 
-    stats.set_item("total_duration", total_duration)?;
-    stats.set_item("num_segments", num_segments)?;
-    stats.set_item("avg_duration", avg_duration)?;
-    stats.set_item("total_words", total_words)?;
-    stats.set_item("total_chars", total_chars)?;
-    stats.set_item("avg_words_per_segment", avg_words)?;
-    stats.set_item("avg_chars_per_segment", avg_chars)?;
-    stats.set_item("words_per_second", words_per_second)?;
+    // The ASCII characters `char::is_whitespace` accepts: ' ' and '\t'..='\r'
+    let is_space = |byte: u8| (byte == b' ') | (byte.wrapping_sub(b'\t') < 5);
+
+    let bytes = text.as_bytes();
+    let mut words = 0;
+    let mut prev_space = true;
+    for &byte in bytes {
+        let space = is_space(byte);
+        words += (prev_space & !space) as usize;
+        prev_space = space;
+    }
 
-    Ok(stats.into())
+    let chars = match bytes.iter().position(|&byte| !is_space(byte)) {
+        Some(first) => bytes
+            .iter()
+            .rposition(|&byte| !is_space(byte))
+            .map_or(0, |last| last + 1 - first),
+        None => 0,
+    };
+    (words, chars)
 }
 
 /// Shifts all segment timestamps by a given offset.
@@ -1188,11 +2782,12 @@ fn shift_timestamps(
     segments_list: &Bound<'_, PyList>,
     offset_seconds: f64,
 ) -> PyResult<Py<PyList>> {
-    let result = PyList::empty(py);
+    // One output segment per input, so the list is allocated at its final size
+    let mut dicts = Vec::with_capacity(segments_list.len());
 
     for (idx, segment) in segments_list.iter().enumerate() {
         let segment_dict = segment.downcast::<PyDict>()?;
-        let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
+        let (id, start, end, text) = extract_segment_fields(segment_dict, idx)?;
 
         let new_start = start + offset_seconds;
         let new_end = end + offset_seconds;
@@ -1204,15 +2799,11 @@ fn shift_timestamps(
             )));
         }
 
-        let dict = PyDict::new(py);
-        dict.set_item("id", id)?;
-        dict.set_item("start", new_start)?;
-        dict.set_item("end", new_end)?;
-        dict.set_item("text", text.trim())?;
-        result.append(dict)?;
+        let text = trimmed_text(&text)?;
+        dicts.push(new_segment_dict(py, id, new_start, new_end, text)?);
     }
 
-    Ok(result.into())
+    Ok(PyList::new(py, dicts)?.unbind())
 }
 
 /// Filters segments to only include those within a time range.
@@ -1234,46 +2825,392 @@ fn filter_segments_by_time(
 ) -> PyResult<Py<PyList>> {
     let result = PyList::empty(py);
 
-    for (idx, segment) in segments_list.iter().enumerate() {
-        let segment_dict = segment.downcast::<PyDict>()?;
+    for (idx, segment) in segments_list.iter().enumerate() {
+        let segment_dict = segment.downcast::<PyDict>()?;
+
+        let seg_start: f64 = segment_dict
+            .get_item(pyo3::intern!(py, "start"))?
+            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
+            .extract()?;
+
+        let seg_end: f64 = segment_dict
+            .get_item(pyo3::intern!(py, "end"))?
+            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
+            .extract()?;
+
+        // Include segment if it overlaps with the range
+        if seg_end >= start_time && seg_start <= end_time {
+            let id: u32 = segment_dict
+                .get_item(pyo3::intern!(py, "id"))?
+                .map(|v| v.extract().unwrap_or((idx + 1) as u32))
+                .unwrap_or((idx + 1) as u32);
+
+            let text = segment_dict
+                .get_item(pyo3::intern!(py, "text"))?
+                .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?;
+            let text = trimmed_text(text.downcast::<PyString>()?)?;
+
+            result.append(new_segment_dict(py, id, seg_start, seg_end, text)?)?;
+        }
+    }
+
+    Ok(result.into())
+}
+
+/// Creates an `array.array("d")` holding `values`.
+fn new_double_array<'py>(py: Python<'py>, values: &[f64]) -> PyResult<Bound<'py, PyAny>> {
+    let bytes: Vec<u8> = values
+        .iter()
+        .flat_map(|value| value.to_ne_bytes())
+        .collect();
+    py.import(pyo3::intern!(py, "array"))?
+        .getattr(pyo3::intern!(py, "array"))?
+        .call1((pyo3::intern!(py, "d"), PyBytes::new(py, &bytes)))
+}
+
+/// Copies a pair of start/end buffers into vectors, checking their shapes.
+fn read_time_columns(
+    py: Python<'_>,
+    starts: &PyBuffer<f64>,
+    ends: &PyBuffer<f64>,
+) -> PyResult<(Vec<f64>, Vec<f64>)> {
+    if starts.dimensions() != 1 || ends.dimensions() != 1 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "'starts' and 'ends' must be one-dimensional",
+        ));
+    }
+    if starts.item_count() != ends.item_count() {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "'starts' and 'ends' must have the same length (got {} and {})",
+            starts.item_count(),
+            ends.item_count()
+        )));
+    }
+    Ok((starts.to_vec(py)?, ends.to_vec(py)?))
+}
+
+/// Shifts start/end timestamp arrays by a given offset, in place.
+///
+/// Array counterpart of `shift_timestamps` for callers that keep segment
+/// times in columns (NumPy float64 arrays, `array.array("d")`, or any other
+/// writable buffer of doubles). No per-segment Python objects are created.
+///
+/// # Arguments
+/// * `starts` - Writable float64 buffer of segment start times
+/// * `ends` - Writable float64 buffer of segment end times (same length)
+/// * `offset_seconds` - Time offset in seconds (can be negative)
+///
+/// # Errors
+/// * `VttTimestampError` if any shifted timestamp would be negative. The
+///   buffers are left unmodified in that case.
+#[pyfunction]
+fn shift_timestamps_array(
+    py: Python<'_>,
+    starts: PyBuffer<f64>,
+    ends: PyBuffer<f64>,
+    offset_seconds: f64,
+) -> PyResult<()> {
+    let (mut new_starts, mut new_ends) = read_time_columns(py, &starts, &ends)?;
+
+    for value in new_starts.iter_mut().chain(new_ends.iter_mut()) {
+        *value += offset_seconds;
+    }
+
+    let negative = new_starts
+        .iter()
+        .zip(&new_ends)
+        .position(|(&start, &end)| start < 0.0 || end < 0.0);
+    if let Some(idx) = negative {
+        return Err(timestamp_error(&format!(
+            "Segment at index {}: shifting by {} would result in negative timestamp",
+            idx, offset_seconds
+        )));
+    }
+
+    starts.copy_from_slice(py, &new_starts)?;
+    ends.copy_from_slice(py, &new_ends)?;
+    Ok(())
+}
+
+/// Returns true when `starts` and `ends` are both non-decreasing.
+///
+/// NaN never compares as ordered, wherever it appears, so such columns
+/// fall back to a full scan. The check is reduced without branching, so
+/// it vectorises.
+fn time_columns_ordered(starts: &[f64], ends: &[f64]) -> bool {
+    let first_ok = match (starts.first(), ends.first()) {
+        (Some(start), Some(end)) => !start.is_nan() && !end.is_nan(),
+        _ => true,
+    };
+    first_ok
+        && starts
+            .windows(2)
+            .zip(ends.windows(2))
+            .fold(true, |ordered, (s, e)| {
+                ordered & (s[1] >= s[0]) & (e[1] >= e[0])
+            })
+}
+
+/// Positions of the segments overlapping `[start_time, end_time]`, for
+/// columns that are both non-decreasing.
+///
+/// Starts at or before `end_time` form a prefix and ends at or after
+/// `start_time` form a suffix, so the overlap is one window bracketed by
+/// two binary searches. A NaN bound matches nothing, as in a linear scan.
+fn ordered_overlap_window(
+    starts: &[f64],
+    ends: &[f64],
+    start_time: f64,
+    end_time: f64,
+) -> std::ops::Range<usize> {
+    if start_time.is_nan() || end_time.is_nan() {
+        return 0..0;
+    }
+    let hi = starts.partition_point(|&start| start <= end_time);
+    let lo = ends[..hi].partition_point(|&end| end < start_time);
+    lo..hi
+}
+
+/// Finds the segments that overlap a time range, given start/end arrays.
+///
+/// Array counterpart of `filter_segments_by_time`. Instead of building new
+/// segment dictionaries it returns the positions of the matching segments,
+/// which can be used to index the original data (e.g. `starts[indices]`
+/// with NumPy). Sorted columns, the usual case, are searched by bisection
+/// after one ordering pass; others are scanned in full.
+///
+/// # Arguments
+/// * `starts` - Float64 buffer of segment start times
+/// * `ends` - Float64 buffer of segment end times (same length)
+/// * `start_time` - Start of time range (inclusive)
+/// * `end_time` - End of time range (inclusive)
+///
+/// # Returns
+/// * Ascending list of indices of segments that overlap with the time range
+#[pyfunction]
+fn filter_segments_by_time_array(
+    py: Python<'_>,
+    starts: PyBuffer<f64>,
+    ends: PyBuffer<f64>,
+    start_time: f64,
+    end_time: f64,
+) -> PyResult<Vec<usize>> {
+    let (seg_starts, seg_ends) = read_time_columns(py, &starts, &ends)?;
+    if time_columns_ordered(&seg_starts, &seg_ends) {
+        return Ok(ordered_overlap_window(&seg_starts, &seg_ends, start_time, end_time).collect());
+    }
+
+    Ok(seg_starts
+        .iter()
+        .zip(&seg_ends)
+        .enumerate()
+        .filter(|(_, (&start, &end))| end >= start_time && start <= end_time)
+        .map(|(idx, _)| idx)
+        .collect())
+}
+
+/// Finds the segments that meet a confidence threshold, given a confidence array.
+///
+/// Array counterpart of `filter_by_confidence` in "remove" mode. The scan
+/// is a straight comparison over the column, with no per-segment Python
+/// objects, and returns the positions of the segments to keep.
+///
+/// # Arguments
+/// * `confidences` - Float64 buffer of per-segment confidence scores
+/// * `min_confidence` - Minimum confidence threshold (default 0.8)
+///
+/// # Returns
+/// * Ascending list of indices of segments with confidence >= `min_confidence`
+#[pyfunction]
+#[pyo3(signature = (confidences, min_confidence=0.8))]
+fn filter_by_confidence_array(
+    py: Python<'_>,
+    confidences: PyBuffer<f64>,
+    min_confidence: f64,
+) -> PyResult<Vec<usize>> {
+    if confidences.dimensions() != 1 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "'confidences' must be one-dimensional",
+        ));
+    }
+
+    Ok(confidences
+        .to_vec(py)?
+        .iter()
+        .enumerate()
+        // Same rule as `filter_by_confidence`: only scores below the threshold
+        // are dropped, so NaN confidences are kept
+        .filter(|(_, confidence)| {
+            confidence.partial_cmp(&min_confidence) != Some(std::cmp::Ordering::Less)
+        })
+        .map(|(idx, _)| idx)
+        .collect())
+}
+
+// ============================================================================
+// Podcast Processing Functions
+// ============================================================================
 
-        let seg_start: f64 = segment_dict
-            .get_item("start")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
-            .extract()?;
+/// Filler words removed by `remove_filler_words` when no list is given.
+const DEFAULT_FILLERS: &[&str] = &[
+    "um",
+    "uh",
+    "uhh",
+    "umm",
+    "er",
+    "err",
+    "ah",
+    "ahh",
+    "eh",
+    "like",
+    "you know",
+    "i mean",
+    "sort of",
+    "kind of",
+    "basically",
+    "actually",
+    "literally",
+    "right",
+    "okay so",
+    "so like",
+];
+
+/// Returns true if `pos` is a word boundary in `text` (as `\b` in regex).
+fn is_word_boundary(text: &str, pos: usize) -> bool {
+    let before = text[..pos]
+        .chars()
+        .next_back()
+        .is_some_and(regex_syntax::is_word_character);
+    let after = text[pos..]
+        .chars()
+        .next()
+        .is_some_and(regex_syntax::is_word_character);
+    before != after
+}
 
-        let seg_end: f64 = segment_dict
-            .get_item("end")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
-            .extract()?;
+/// Matcher that deletes whole-word filler phrases from text.
+///
+/// Fillers are removed as if each one were applied in list order as a
+/// case-insensitive `\bfiller\b` regex over the output of the previous one.
+/// For ASCII filler lists this is done in a single Aho-Corasick pass: all
+/// whole-word occurrences are found at once, and where occurrences overlap
+/// the filler listed first wins (so with the default list, "so like" only
+/// loses "like"). Lists containing non-ASCII fillers need Unicode case
+/// folding and fall back to one regex per filler.
+enum FillerMatcher {
+    Automaton(aho_corasick::AhoCorasick),
+    Regexes(Vec<regex::Regex>),
+}
 
-        // Include segment if it overlaps with the range
-        if seg_end >= start_time && seg_start <= end_time {
-            let id: u32 = segment_dict
-                .get_item("id")?
-                .map(|v| v.extract().unwrap_or((idx + 1) as u32))
-                .unwrap_or((idx + 1) as u32);
+impl FillerMatcher {
+    fn new<S: AsRef<str>>(fillers: &[S]) -> Self {
+        let fillers: Vec<&str> = fillers
+            .iter()
+            .map(|f| f.as_ref())
+            .filter(|f| !f.is_empty())
+            .collect();
+
+        if fillers.iter().all(|f| f.is_ascii()) {
+            let automaton = aho_corasick::AhoCorasick::builder()
+                .ascii_case_insensitive(true)
+                .build(&fillers);
+            if let Ok(automaton) = automaton {
+                return FillerMatcher::Automaton(automaton);
+            }
+        }
+
+        FillerMatcher::Regexes(
+            fillers
+                .iter()
+                .filter_map(|filler| {
+                    let pattern = format!(r"(?i)\b{}\b", regex::escape(filler));
+                    regex::Regex::new(&pattern).ok()
+                })
+                .collect(),
+        )
+    }
 
-            let text: String = segment_dict
-                .get_item("text")?
-                .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-                .extract()?;
+    /// Matcher for `DEFAULT_FILLERS`, built on first use.
+    fn default_fillers() -> &'static FillerMatcher {
+        static DEFAULT: std::sync::OnceLock<FillerMatcher> = std::sync::OnceLock::new();
+        DEFAULT.get_or_init(|| FillerMatcher::new(DEFAULT_FILLERS))
+    }
 
-            let dict = PyDict::new(py);
-            dict.set_item("id", id)?;
-            dict.set_item("start", seg_start)?;
-            dict.set_item("end", seg_end)?;
-            dict.set_item("text", text.trim())?;
-            result.append(dict)?;
+    /// Matcher for a custom filler list, reusing the previous one on this
+    /// thread when the list is unchanged so repeated calls skip compilation.
+    fn custom_fillers(fillers: Vec<String>) -> std::rc::Rc<FillerMatcher> {
+        thread_local! {
+            static CUSTOM: std::cell::RefCell<Option<(Vec<String>, std::rc::Rc<FillerMatcher>)>> =
+                const { std::cell::RefCell::new(None) };
         }
+
+        CUSTOM.with_borrow_mut(|cached| match cached {
+            Some((list, matcher)) if *list == fillers => matcher.clone(),
+            _ => {
+                let matcher = std::rc::Rc::new(FillerMatcher::new(&fillers));
+                *cached = Some((fillers, matcher.clone()));
+                matcher
+            }
+        })
     }
 
-    Ok(result.into())
-}
+    /// Removes fillers from `text` and collapses the remaining whitespace.
+    fn clean(&self, text: &str) -> String {
+        let kept = match self {
+            FillerMatcher::Automaton(automaton) => {
+                // Whole-word occurrences ordered by filler priority, then position
+                let mut candidates: Vec<(usize, usize, usize)> = automaton
+                    .find_overlapping_iter(text)
+                    .filter(|m| {
+                        is_word_boundary(text, m.start()) && is_word_boundary(text, m.end())
+                    })
+                    .map(|m| (m.pattern().as_usize(), m.start(), m.end()))
+                    .collect();
+                candidates.sort_unstable();
+
+                let mut removed: Vec<(usize, usize)> = Vec::new();
+                for (_, start, end) in candidates {
+                    if removed.iter().all(|&(s, e)| end <= s || start >= e) {
+                        removed.push((start, end));
+                    }
+                }
 
-// ============================================================================
-// Podcast Processing Functions
-// ============================================================================
+                if removed.is_empty() {
+                    Cow::Borrowed(text)
+                } else {
+                    removed.sort_unstable();
+                    let mut kept = String::with_capacity(text.len());
+                    let mut last = 0;
+                    for (start, end) in removed {
+                        kept.push_str(&text[last..start]);
+                        last = end;
+                    }
+                    kept.push_str(&text[last..]);
+                    Cow::Owned(kept)
+                }
+            }
+            FillerMatcher::Regexes(regexes) => {
+                let mut kept = Cow::Borrowed(text);
+                for re in regexes {
+                    if let Cow::Owned(replaced) = re.replace_all(&kept, "") {
+                        kept = Cow::Owned(replaced);
+                    }
+                }
+                kept
+            }
+        };
+
+        // Clean up multiple spaces
+        let mut cleaned = String::with_capacity(kept.len());
+        for word in kept.split_whitespace() {
+            if !cleaned.is_empty() {
+                cleaned.push(' ');
+            }
+            cleaned.push_str(word);
+        }
+        cleaned
+    }
+}
 
 /// Removes common filler words from segment text.
 ///
@@ -1295,40 +3232,10 @@ fn remove_filler_words(
     fillers: Option<Vec<String>>,
     preserve_timing: bool,
 ) -> PyResult<Py<PyList>> {
-    let default_fillers = vec![
-        "um",
-        "uh",
-        "uhh",
-        "umm",
-        "er",
-        "err",
-        "ah",
-        "ahh",
-        "eh",
-        "like",
-        "you know",
-        "i mean",
-        "sort of",
-        "kind of",
-        "basically",
-        "actually",
-        "literally",
-        "right",
-        "okay so",
-        "so like",
-    ];
-
-    let filler_list: Vec<String> =
-        fillers.unwrap_or_else(|| default_fillers.iter().map(|s| s.to_string()).collect());
-
-    // Pre-compile all regex patterns once for better performance
-    let compiled_filters: Vec<regex::Regex> = filler_list
-        .iter()
-        .filter_map(|filler| {
-            let pattern = format!(r"(?i)\b{}\b", regex::escape(filler));
-            regex::Regex::new(&pattern).ok()
-        })
-        .collect();
+    let custom_matcher = fillers.map(FillerMatcher::custom_fillers);
+    let matcher = custom_matcher
+        .as_deref()
+        .unwrap_or_else(FillerMatcher::default_fillers);
 
     let result = PyList::empty(py);
 
@@ -1336,39 +3243,24 @@ fn remove_filler_words(
         let segment_dict = segment.downcast::<PyDict>()?;
         let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
 
-        // Remove filler words using pre-compiled regexes
-        let mut cleaned_text = text.clone();
-        for re in &compiled_filters {
-            cleaned_text = re.replace_all(&cleaned_text, "").to_string();
-        }
-
-        // Clean up multiple spaces
-        let cleaned_text = cleaned_text
-            .split_whitespace()
-            .collect::<Vec<_>>()
-            .join(" ");
+        let cleaned_text = matcher.clean(&text);
 
         // Skip empty segments unless preserving timing
         if cleaned_text.is_empty() && !preserve_timing {
             continue;
         }
 
-        let dict = PyDict::new(py);
-        dict.set_item(
-            "id",
-            if preserve_timing {
-                id
-            } else {
-                (result.len() + 1) as u32
-            },
-        )?;
-        dict.set_item("start", start)?;
-        dict.set_item("end", end)?;
-        dict.set_item("text", cleaned_text)?;
+        let id = if preserve_timing {
+            id
+        } else {
+            (result.len() + 1) as u32
+        };
+        let dict = new_segment_dict(py, id, start, end, cleaned_text)?;
 
         // Preserve speaker info if present
-        if let Ok(Some(speaker)) = segment_dict.get_item("speaker") {
-            dict.set_item("speaker", speaker)?;
+        let speaker_key = pyo3::intern!(py, "speaker");
+        if let Ok(Some(speaker)) = segment_dict.get_item(speaker_key) {
+            dict.set_item(speaker_key, speaker)?;
         }
 
         result.append(dict)?;
@@ -1391,109 +3283,102 @@ fn remove_filler_words(
 /// * List of grouped segments with speaker information
 #[pyfunction]
 #[pyo3(signature = (segments_list, max_gap=2.0, format_speaker=true))]
-fn group_by_speaker(
-    py: Python<'_>,
-    segments_list: &Bound<'_, PyList>,
+fn group_by_speaker<'py>(
+    py: Python<'py>,
+    segments_list: &Bound<'py, PyList>,
     max_gap: f64,
     format_speaker: bool,
 ) -> PyResult<Py<PyList>> {
-    if segments_list.is_empty() {
-        return Ok(PyList::empty(py).into());
+    /// Appends one grouped cue to the result list.
+    fn push_group(
+        result: &Bound<'_, PyList>,
+        start: f64,
+        end: f64,
+        text: &str,
+        speaker: &Bound<'_, PyString>,
+    ) -> PyResult<()> {
+        let py = result.py();
+        let dict = new_segment_dict(py, (result.len() + 1) as u32, start, end, text)?;
+        dict.set_item(pyo3::intern!(py, "speaker"), speaker)?;
+        result.append(dict)
     }
 
     let result = PyList::empty(py);
-    let mut current_speaker: Option<String> = None;
+    let unknown_speaker = pyo3::intern!(py, "Unknown");
+
+    // The open group. Its speaker is the caller's own str object, so groups
+    // share the input strings rather than each holding a copy, and runs of
+    // segments carrying the same object compare by identity. The text (with
+    // the voice tag already written, when formatting) is built in a buffer
+    // reused across groups.
+    let mut current_speaker: Option<Bound<'py, PyString>> = None;
+    let mut current_text = String::new();
     let mut current_start = 0.0f64;
     let mut current_end = 0.0f64;
-    let mut current_texts: Vec<String> = vec![];
 
     for segment in segments_list.iter() {
         let segment_dict = segment.downcast::<PyDict>()?;
 
         let start: f64 = segment_dict
-            .get_item("start")?
+            .get_item(pyo3::intern!(py, "start"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
             .extract()?;
 
         let end: f64 = segment_dict
-            .get_item("end")?
+            .get_item(pyo3::intern!(py, "end"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
             .extract()?;
 
-        let text: String = segment_dict
-            .get_item("text")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-            .extract()?;
+        let text_item = segment_dict
+            .get_item(pyo3::intern!(py, "text"))?
+            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?;
+        let text = text_item.downcast::<PyString>()?.to_str()?;
 
-        let speaker: String = segment_dict
-            .get_item("speaker")?
-            .map(|v| v.extract().unwrap_or_else(|_| "Unknown".to_string()))
-            .unwrap_or_else(|| "Unknown".to_string());
+        // Missing, non-str or undecodable speakers are all grouped as "Unknown"
+        let speaker_obj = match segment_dict
+            .get_item(pyo3::intern!(py, "speaker"))?
+            .and_then(|v| v.downcast_into::<PyString>().ok())
+        {
+            Some(obj) if obj.to_str().is_ok() => obj,
+            _ => unknown_speaker.clone(),
+        };
+        let speaker = speaker_obj.to_str()?;
 
-        let should_merge =
-            current_speaker.as_ref() == Some(&speaker) && (start - current_end) <= max_gap;
+        let same_speaker = match &current_speaker {
+            Some(current) => {
+                current.as_ptr() == speaker_obj.as_ptr() || current.to_str()? == speaker
+            }
+            None => false,
+        };
 
-        if should_merge {
+        if same_speaker && (start - current_end) <= max_gap {
             // Continue accumulating for same speaker
             current_end = end;
-            current_texts.push(text);
+            current_text.push(' ');
+            current_text.push_str(text);
         } else {
             // Output previous speaker's segment (if any)
-            if !current_texts.is_empty() {
-                let dict = PyDict::new(py);
-                dict.set_item("id", (result.len() + 1) as u32)?;
-                dict.set_item("start", current_start)?;
-                dict.set_item("end", current_end)?;
-
-                let combined_text = current_texts.join(" ");
-                if format_speaker {
-                    if let Some(ref spk) = current_speaker {
-                        dict.set_item("text", format!("<v {}>{}", spk, combined_text))?;
-                    } else {
-                        dict.set_item("text", combined_text)?;
-                    }
-                } else {
-                    dict.set_item("text", combined_text)?;
-                }
-
-                if let Some(ref spk) = current_speaker {
-                    dict.set_item("speaker", spk.clone())?;
-                }
-
-                result.append(dict)?;
+            if let Some(current) = &current_speaker {
+                push_group(&result, current_start, current_end, &current_text, current)?;
             }
 
             // Start new speaker segment
-            current_speaker = Some(speaker);
             current_start = start;
             current_end = end;
-            current_texts = vec![text];
+            current_text.clear();
+            if format_speaker {
+                current_text.push_str("<v ");
+                current_text.push_str(speaker);
+                current_text.push('>');
+            }
+            current_text.push_str(text);
+            current_speaker = Some(speaker_obj);
         }
     }
 
     // Output final segment
-    if !current_texts.is_empty() {
-        let dict = PyDict::new(py);
-        dict.set_item("id", (result.len() + 1) as u32)?;
-        dict.set_item("start", current_start)?;
-        dict.set_item("end", current_end)?;
-
-        let combined_text = current_texts.join(" ");
-        if format_speaker {
-            if let Some(ref spk) = current_speaker {
-                dict.set_item("text", format!("<v {}>{}", spk, combined_text))?;
-            } else {
-                dict.set_item("text", combined_text)?;
-            }
-        } else {
-            dict.set_item("text", combined_text)?;
-        }
-
-        if let Some(ref spk) = current_speaker {
-            dict.set_item("speaker", spk.clone())?;
-        }
-
-        result.append(dict)?;
+    if let Some(current) = &current_speaker {
+        push_group(&result, current_start, current_end, &current_text, current)?;
     }
 
     Ok(result.into())
@@ -1526,55 +3411,51 @@ fn filter_by_confidence(
         let segment_dict = segment.downcast::<PyDict>()?;
 
         let confidence: f64 = segment_dict
-            .get_item("confidence")?
+            .get_item(pyo3::intern!(py, "confidence"))?
             .map(|v| v.extract().unwrap_or(1.0))
             .unwrap_or(1.0); // Assume high confidence if not provided
 
         let id: u32 = segment_dict
-            .get_item("id")?
+            .get_item(pyo3::intern!(py, "id"))?
             .map(|v| v.extract().unwrap_or((idx + 1) as u32))
             .unwrap_or((idx + 1) as u32);
 
         let start: f64 = segment_dict
-            .get_item("start")?
+            .get_item(pyo3::intern!(py, "start"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
             .extract()?;
 
         let end: f64 = segment_dict
-            .get_item("end")?
+            .get_item(pyo3::intern!(py, "end"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
             .extract()?;
 
-        let text: String = segment_dict
-            .get_item("text")?
+        // The text is passed through as the caller's own str object
+        let text = segment_dict
+            .get_item(pyo3::intern!(py, "text"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'text' field"))?
-            .extract()?;
+            .downcast_into::<PyString>()?;
 
         if should_remove && confidence < min_confidence {
             continue;
         }
 
-        let dict = PyDict::new(py);
-        dict.set_item(
-            "id",
-            if should_remove {
-                (result.len() + 1) as u32
-            } else {
-                id
-            },
-        )?;
-        dict.set_item("start", start)?;
-        dict.set_item("end", end)?;
-        dict.set_item("text", text)?;
-        dict.set_item("confidence", confidence)?;
+        let id = if should_remove {
+            (result.len() + 1) as u32
+        } else {
+            id
+        };
+        let dict = new_segment_dict(py, id, start, end, text)?;
+        dict.set_item(pyo3::intern!(py, "confidence"), confidence)?;
 
         if !should_remove && confidence < min_confidence {
-            dict.set_item("low_confidence", true)?;
+            dict.set_item(pyo3::intern!(py, "low_confidence"), true)?;
         }
 
         // Preserve speaker info if present
-        if let Ok(Some(speaker)) = segment_dict.get_item("speaker") {
-            dict.set_item("speaker", speaker)?;
+        let speaker_key = pyo3::intern!(py, "speaker");
+        if let Ok(Some(speaker)) = segment_dict.get_item(speaker_key) {
+            dict.set_item(speaker_key, speaker)?;
         }
 
         result.append(dict)?;
@@ -1603,99 +3484,125 @@ fn words_to_segments(
     max_segment_duration: f64,
     pause_threshold: f64,
 ) -> PyResult<Py<PyList>> {
-    if words_list.is_empty() {
-        return Ok(PyList::empty(py).into());
-    }
-
-    let result = PyList::empty(py);
-    let mut segment_words: Vec<String> = vec![];
-    let mut segment_start = 0.0f64;
-    let mut segment_end = 0.0f64;
-    let mut last_end = 0.0f64;
+    let mut words = Segments::with_capacity(words_list.len(), 0);
 
     for word_item in words_list.iter() {
         let word_dict = word_item.downcast::<PyDict>()?;
 
-        let word: String = word_dict
-            .get_item("word")?
-            .or_else(|| word_dict.get_item("text").ok().flatten())
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'word' or 'text' field"))?
-            .extract()?;
+        let word = word_dict
+            .get_item(pyo3::intern!(py, "word"))?
+            .or_else(|| word_dict.get_item(pyo3::intern!(py, "text")).ok().flatten())
+            .ok_or_else(|| {
+                pyo3::exceptions::PyKeyError::new_err("Missing 'word' or 'text' field")
+            })?;
+        let word = word.downcast::<PyString>()?.to_str()?;
 
         let word_start: f64 = word_dict
-            .get_item("start")?
+            .get_item(pyo3::intern!(py, "start"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
             .extract()?;
 
         let word_end: f64 = word_dict
-            .get_item("end")?
+            .get_item(pyo3::intern!(py, "end"))?
             .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
             .extract()?;
 
-        let pause = if segment_words.is_empty() {
-            0.0
-        } else {
-            word_start - last_end
-        };
+        words.push(0, word_start, word_end, word);
+    }
 
-        let current_duration = if segment_words.is_empty() {
-            0.0
-        } else {
-            word_end - segment_start
-        };
+    Ok(words
+        .group_words(max_segment_duration, pause_threshold)
+        .to_dict_list(py)?
+        .unbind())
+}
 
-        // Check if we should start a new segment
-        let should_break = !segment_words.is_empty()
-            && (pause >= pause_threshold
-                || current_duration > max_segment_duration
-                || word.ends_with('.')
-                || word.ends_with('?')
-                || word.ends_with('!'));
+/// FNV-1a hash of `bytes`.
+fn fnv1a(bytes: &[u8]) -> u64 {
+    let mut hash: u64 = 0xcbf2_9ce4_8422_2325;
+    for &byte in bytes {
+        hash ^= byte as u64;
+        hash = hash.wrapping_mul(0x0000_0100_0000_01b3);
+    }
+    hash
+}
 
-        // If the last word had sentence-ending punctuation, break after it
-        let last_word_ends_sentence = segment_words
-            .last()
-            .map(|w| w.ends_with('.') || w.ends_with('?') || w.ends_with('!'))
-            .unwrap_or(false);
-
-        if should_break || (last_word_ends_sentence && !segment_words.is_empty()) {
-            // Save current segment
-            let dict = PyDict::new(py);
-            dict.set_item("id", (result.len() + 1) as u32)?;
-            dict.set_item("start", segment_start)?;
-            dict.set_item("end", segment_end)?;
-            dict.set_item("text", segment_words.join(" "))?;
-            result.append(dict)?;
-
-            // Start new segment
-            segment_words = vec![word];
-            segment_start = word_start;
-            segment_end = word_end;
-        } else if segment_words.is_empty() {
-            // First word
-            segment_words.push(word);
-            segment_start = word_start;
-            segment_end = word_end;
-        } else {
-            // Continue current segment
-            segment_words.push(word);
-            segment_end = word_end;
+/// Collapses immediately repeated phrases in `text` to a single instance.
+///
+/// At each word, phrase lengths from `max_phrase_words` down to 1 are tried
+/// and the first one repeated at least `min_repetitions` times in a row wins.
+/// Words compare case-insensitively; each word is lowercased and hashed once
+/// up front so the scan compares integers and only re-checks the lowered
+/// text when hashes agree. Kept words retain their original casing and are
+/// joined by single spaces.
+fn collapse_repeated_phrases(
+    text: &str,
+    min_repetitions: usize,
+    max_phrase_words: usize,
+) -> String {
+    let words: Vec<&str> = text.split_whitespace().collect();
+    let lowered: Vec<Cow<'_, str>> = words
+        .iter()
+        .map(|word| {
+            if word
+                .bytes()
+                .any(|b| b.is_ascii_uppercase() || !b.is_ascii())
+            {
+                Cow::Owned(word.to_lowercase())
+            } else {
+                Cow::Borrowed(*word)
+            }
+        })
+        .collect();
+    let hashes: Vec<u64> = lowered.iter().map(|word| fnv1a(word.as_bytes())).collect();
+
+    let same_phrase = |a: usize, b: usize, len: usize| {
+        hashes[a..a + len] == hashes[b..b + len] && lowered[a..a + len] == lowered[b..b + len]
+    };
+
+    let mut cleaned = String::with_capacity(text.len());
+    let mut push_word = |word: &str| {
+        if !cleaned.is_empty() {
+            cleaned.push(' ');
         }
+        cleaned.push_str(word);
+    };
 
-        last_end = word_end;
-    }
+    let mut i = 0;
+    while i < words.len() {
+        let mut found_repetition = false;
 
-    // Output final segment
-    if !segment_words.is_empty() {
-        let dict = PyDict::new(py);
-        dict.set_item("id", (result.len() + 1) as u32)?;
-        dict.set_item("start", segment_start)?;
-        dict.set_item("end", segment_end)?;
-        dict.set_item("text", segment_words.join(" "))?;
-        result.append(dict)?;
+        // Check for repeated phrases of different lengths
+        for phrase_len in (1..=max_phrase_words).rev() {
+            if i + phrase_len * min_repetitions > words.len() {
+                continue;
+            }
+
+            // Count consecutive repetitions
+            let mut repetition_count = 1;
+            let mut j = i + phrase_len;
+            while j + phrase_len <= words.len() && same_phrase(i, j, phrase_len) {
+                repetition_count += 1;
+                j += phrase_len;
+            }
+
+            if repetition_count >= min_repetitions {
+                // Keep only one instance of the repeated phrase
+                for word in &words[i..i + phrase_len] {
+                    push_word(word);
+                }
+                i = j;
+                found_repetition = true;
+                break;
+            }
+        }
+
+        if !found_repetition {
+            push_word(words[i]);
+            i += 1;
+        }
     }
 
-    Ok(result.into())
+    cleaned
 }
 
 /// Detects and removes repeated phrases that often occur in podcast transcriptions.
@@ -1724,65 +3631,13 @@ fn remove_repeated_phrases(
         let segment_dict = segment.downcast::<PyDict>()?;
         let (id, start, end, text) = extract_segment_data(segment_dict, idx)?;
 
-        // Remove repeated phrases
-        let words: Vec<&str> = text.split_whitespace().collect();
-        let mut cleaned_words: Vec<String> = vec![];
-        let mut i = 0;
-
-        while i < words.len() {
-            let mut found_repetition = false;
-
-            // Check for repeated phrases of different lengths
-            for phrase_len in (1..=max_phrase_words).rev() {
-                if i + phrase_len * min_repetitions > words.len() {
-                    continue;
-                }
-
-                let phrase: Vec<&str> = words[i..i + phrase_len].to_vec();
-                let mut repetition_count = 1;
-
-                // Count consecutive repetitions
-                let mut j = i + phrase_len;
-                while j + phrase_len <= words.len() {
-                    let next_phrase: Vec<&str> = words[j..j + phrase_len].to_vec();
-                    if phrase
-                        .iter()
-                        .zip(next_phrase.iter())
-                        .all(|(a, b)| a.to_lowercase() == b.to_lowercase())
-                    {
-                        repetition_count += 1;
-                        j += phrase_len;
-                    } else {
-                        break;
-                    }
-                }
-
-                if repetition_count >= min_repetitions {
-                    // Keep only one instance of the repeated phrase
-                    for word in phrase {
-                        cleaned_words.push(word.to_string());
-                    }
-                    i = j;
-                    found_repetition = true;
-                    break;
-                }
-            }
-
-            if !found_repetition {
-                cleaned_words.push(words[i].to_string());
-                i += 1;
-            }
-        }
-
-        let dict = PyDict::new(py);
-        dict.set_item("id", id)?;
-        dict.set_item("start", start)?;
-        dict.set_item("end", end)?;
-        dict.set_item("text", cleaned_words.join(" "))?;
+        let cleaned = collapse_repeated_phrases(&text, min_repetitions, max_phrase_words);
+        let dict = new_segment_dict(py, id, start, end, cleaned)?;
 
         // Preserve speaker info if present
-        if let Ok(Some(speaker)) = segment_dict.get_item("speaker") {
-            dict.set_item("speaker", speaker)?;
+        let speaker_key = pyo3::intern!(py, "speaker");
+        if let Ok(Some(speaker)) = segment_dict.get_item(speaker_key) {
+            dict.set_item(speaker_key, speaker)?;
         }
 
         result.append(dict)?;
@@ -1811,74 +3666,142 @@ fn detect_chapters(
     min_chapter_duration: f64,
     silence_threshold: f64,
 ) -> PyResult<Py<PyList>> {
-    if segments_list.is_empty() {
-        return Ok(PyList::empty(py).into());
-    }
+    let mut starts = Vec::with_capacity(segments_list.len());
+    let mut ends = Vec::with_capacity(segments_list.len());
 
-    let result = PyList::empty(py);
+    for (idx, segment) in segments_list.iter().enumerate() {
+        let segment = segment.downcast::<PyDict>()?;
 
-    // First chapter always starts at the beginning
-    let first_item = segments_list.get_item(0)?;
-    let first_segment = first_item.downcast::<PyDict>()?;
-    let first_start: f64 = first_segment
-        .get_item("start")?
-        .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
-        .extract()?;
+        let start: f64 = segment
+            .get_item(pyo3::intern!(py, "start"))?
+            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
+            .extract()?;
 
-    let mut chapter_start = first_start;
-    let mut last_end = first_start;
+        // The first segment's end is never read, so it need not be present
+        let end: f64 = if idx == 0 {
+            start
+        } else {
+            segment
+                .get_item(pyo3::intern!(py, "end"))?
+                .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
+                .extract()?
+        };
 
-    let dict = PyDict::new(py);
-    dict.set_item("chapter", 1)?;
-    dict.set_item("start", chapter_start)?;
-    dict.set_item("timestamp", format_timestamp_internal(chapter_start))?;
-    result.append(dict)?;
+        starts.push(start);
+        ends.push(end);
+    }
 
-    for i in 1..segments_list.len() {
-        let seg_item = segments_list.get_item(i)?;
-        let segment = seg_item.downcast::<PyDict>()?;
+    let chapters = chapter_start_indices(&starts, &ends, min_chapter_duration, silence_threshold);
+    Ok(chapter_dict_list(py, &starts, &chapters)?.unbind())
+}
 
-        let seg_start: f64 = segment
-            .get_item("start")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'start' field"))?
-            .extract()?;
+/// Builds the chapter markers returned by `detect_chapters` from the
+/// positions found by `chapter_start_indices`.
+fn chapter_dict_list<'py>(
+    py: Python<'py>,
+    starts: &[f64],
+    chapters: &[usize],
+) -> PyResult<Bound<'py, PyList>> {
+    // Built up front so the list is allocated at its final size
+    let mut dicts = Vec::with_capacity(chapters.len());
+    for (number, &idx) in chapters.iter().enumerate() {
+        let dict = PyDict::new(py);
+        dict.set_item(pyo3::intern!(py, "chapter"), number + 1)?;
+        dict.set_item(pyo3::intern!(py, "start"), starts[idx])?;
+        let timestamp = format_timestamp_internal(starts[idx]);
+        dict.set_item(pyo3::intern!(py, "timestamp"), timestamp)?;
+        dicts.push(dict);
+    }
+    PyList::new(py, dicts)
+}
 
-        let seg_end: f64 = segment
-            .get_item("end")?
-            .ok_or_else(|| pyo3::exceptions::PyKeyError::new_err("Missing 'end' field"))?
-            .extract()?;
+/// Finds chapter breaks in start/end time arrays.
+///
+/// Array counterpart of `detect_chapters`. Instead of building chapter
+/// dictionaries it returns the positions of the segments that open each
+/// chapter, which can be used to index the original data.
+///
+/// # Arguments
+/// * `starts` - float64 buffer of segment start times
+/// * `ends` - float64 buffer of segment end times (same length)
+/// * `min_chapter_duration` - Minimum duration for a chapter (default 60.0s)
+/// * `silence_threshold` - Gap duration that indicates chapter break (default 3.0s)
+///
+/// # Returns
+/// * Ascending list of segment indices; starts with 0 unless the arrays are empty
+#[pyfunction]
+#[pyo3(signature = (starts, ends, min_chapter_duration=60.0, silence_threshold=3.0))]
+fn detect_chapters_array(
+    py: Python<'_>,
+    starts: PyBuffer<f64>,
+    ends: PyBuffer<f64>,
+    min_chapter_duration: f64,
+    silence_threshold: f64,
+) -> PyResult<Vec<usize>> {
+    let (starts, ends) = read_time_columns(py, &starts, &ends)?;
+    Ok(chapter_start_indices(
+        &starts,
+        &ends,
+        min_chapter_duration,
+        silence_threshold,
+    ))
+}
 
-        let gap = seg_start - last_end;
-        let chapter_duration = seg_start - chapter_start;
+/// Positions of the segments that open a chapter.
+///
+/// The first segment always opens one. A later segment opens a new chapter
+/// when it starts at least `silence_threshold` after the previous segment
+/// ends and at least `min_chapter_duration` after the current chapter
+/// began. The gap before the second segment is measured from the first
+/// segment's start, so `ends[0]` is not read.
+fn chapter_start_indices(
+    starts: &[f64],
+    ends: &[f64],
+    min_chapter_duration: f64,
+    silence_threshold: f64,
+) -> Vec<usize> {
+    let Some(&first_start) = starts.first() else {
+        return Vec::new();
+    };
 
-        // Check for chapter break
-        if gap >= silence_threshold && chapter_duration >= min_chapter_duration {
-            let dict = PyDict::new(py);
-            dict.set_item("chapter", result.len() + 1)?;
-            dict.set_item("start", seg_start)?;
-            dict.set_item("timestamp", format_timestamp_internal(seg_start))?;
-            result.append(dict)?;
+    let mut chapters = vec![0];
+    let mut chapter_start = first_start;
+    let mut last_end = first_start;
 
-            chapter_start = seg_start;
+    for (idx, (&start, &end)) in starts.iter().zip(ends).enumerate().skip(1) {
+        let gap = start - last_end;
+        let chapter_duration = start - chapter_start;
+
+        if gap >= silence_threshold && chapter_duration >= min_chapter_duration {
+            chapters.push(idx);
+            chapter_start = start;
         }
 
-        last_end = seg_end;
+        last_end = end;
     }
 
-    Ok(result.into())
+    chapters
 }
 
 /// Formats timestamps for display (helper function)
+///
+/// Whole seconds are split with integer arithmetic and written with
+/// `push_padded`, as the cue timestamps are.
 fn format_timestamp_internal(seconds: f64) -> String {
-    let hours = (seconds / 3600.0).floor() as u32;
-    let mins = ((seconds % 3600.0) / 60.0).floor() as u32;
-    let secs = (seconds % 60.0).floor() as u32;
+    let total_secs = seconds.floor() as u64;
+    let hours = total_secs / 3600;
+    let mins = (total_secs / 60) % 60;
+    let secs = total_secs % 60;
 
+    let mut timestamp = String::with_capacity(8);
     if hours > 0 {
-        format!("{:02}:{:02}:{:02}", hours, mins, secs)
-    } else {
-        format!("{:02}:{:02}", mins, secs)
+        push_padded(&mut timestamp, hours, 2);
+        timestamp.push(':');
     }
+    push_padded(&mut timestamp, mins, 2);
+    timestamp.push(':');
+    push_padded(&mut timestamp, secs, 2);
+    timestamp
 }
 
 #[pymodule]
@@ -1894,6 +3817,9 @@ fn _lowlevel(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("VttCueError", m.py().get_type::<VttCueError>())?;
     m.add("VttEscapingError", m.py().get_type::<VttEscapingError>())?;
 
+    // Add columnar segment container
+    m.add_class::<Segments>()?;
+
     // Add main builder functions
     m.add_function(wrap_pyfunction!(build_transcript_from_json_files, m)?)?;
     m.add_function(wrap_pyfunction!(build_vtt_from_json_files, m)?)?;
@@ -1902,20 +3828,27 @@ fn _lowlevel(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Add validation functions
     m.add_function(wrap_pyfunction!(validate_vtt_file, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_vtt_string, m)?)?;
     m.add_function(wrap_pyfunction!(validate_segments, m)?)?;
 
     // Add utility functions
     m.add_function(wrap_pyfunction!(escape_vtt_text_py, m)?)?;
-    m.add_function(wrap_pyfunction!(unescape_vtt_text, m)?)?;
+    m.add_function(wrap_pyfunction!(unescape_vtt_text_py, m)?)?;
+    m.add_function(wrap_pyfunction!(escape_vtt_text_many, m)?)?;
+    m.add_function(wrap_pyfunction!(unescape_vtt_text_many, m)?)?;
 
     // Add transformation functions
     m.add_function(wrap_pyfunction!(merge_segments, m)?)?;
     m.add_function(wrap_pyfunction!(split_long_segments, m)?)?;
     m.add_function(wrap_pyfunction!(shift_timestamps, m)?)?;
     m.add_function(wrap_pyfunction!(filter_segments_by_time, m)?)?;
+    m.add_function(wrap_pyfunction!(shift_timestamps_array, m)?)?;
+    m.add_function(wrap_pyfunction!(filter_segments_by_time_array, m)?)?;
 
     // Add timestamp conversion functions
     m.add_function(wrap_pyfunction!(seconds_to_timestamp, m)?)?;
+    m.add_function(wrap_pyfunction!(seconds_to_timestamp_array, m)?)?;
+    m.add_function(wrap_pyfunction!(timestamp_to_seconds_array, m)?)?;
     m.add_function(wrap_pyfunction!(timestamp_to_seconds, m)?)?;
 
     // Add statistics functions
@@ -1925,9 +3858,16 @@ fn _lowlevel(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(remove_filler_words, m)?)?;
     m.add_function(wrap_pyfunction!(group_by_speaker, m)?)?;
     m.add_function(wrap_pyfunction!(filter_by_confidence, m)?)?;
+    m.add_function(wrap_pyfunction!(filter_by_confidence_array, m)?)?;
     m.add_function(wrap_pyfunction!(words_to_segments, m)?)?;
     m.add_function(wrap_pyfunction!(remove_repeated_phrases, m)?)?;
     m.add_function(wrap_pyfunction!(detect_chapters, m)?)?;
+    m.add_function(wrap_pyfunction!(detect_chapters_array, m)?)?;
+
+    // Resolve one-time runtime state now rather than on the first call: the
+    // worker thread count and memchr's CPU feature dispatch
+    worker_threads();
+    std::hint::black_box(memchr::memchr3(b'&', b'<', b'>', &[0u8; 64]));
 
     Ok(())
 }
@@ -1936,6 +3876,21 @@ fn _lowlevel(m: &Bound<'_, PyModule>) -> PyResult<()> {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_ordered_overlap_window() {
+        let starts = [0.0, 3.0, 5.0, 10.0];
+        let ends = [2.0, 5.0, 7.0, 12.0];
+        assert!(time_columns_ordered(&starts, &ends));
+        assert_eq!(ordered_overlap_window(&starts, &ends, 4.0, 8.0), 1..3);
+        assert_eq!(ordered_overlap_window(&starts, &ends, 13.0, 20.0), 4..4);
+        assert!(ordered_overlap_window(&starts, &ends, f64::NAN, 8.0).is_empty());
+
+        assert!(!time_columns_ordered(&[5.0, 0.0], &[7.0, 2.0]));
+        assert!(!time_columns_ordered(&[f64::NAN], &[2.0]));
+        assert!(!time_columns_ordered(&[0.0, 1.0], &[2.0, f64::NAN]));
+        assert!(time_columns_ordered(&[], &[]));
+    }
+
     #[test]
     fn test_escape_vtt_text() {
         assert_eq!(escape_vtt_text("plain text"), "plain text");
@@ -1946,6 +3901,26 @@ mod tests {
         assert_eq!(escape_vtt_text("Tom & Jerry <3"), "Tom &amp; Jerry &lt;3");
     }
 
+    #[test]
+    fn test_escape_vtt_text_long_input() {
+        // Dense enough that the reserved slack runs out and the string grows
+        for text in ["x".repeat(40) + "&", "&<>".repeat(100), "a<b ".repeat(500)] {
+            let expected = text
+                .replace('&', "&amp;")
+                .replace('<', "&lt;")
+                .replace('>', "&gt;");
+            assert_eq!(escape_vtt_text(&text), expected);
+        }
+    }
+
+    #[test]
+    fn test_escape_vtt_text_borrows_clean_input() {
+        assert!(matches!(escape_vtt_text("plain text"), Cow::Borrowed(_)));
+        assert!(matches!(escape_vtt_text("El niño comió"), Cow::Borrowed(_)));
+        assert!(matches!(escape_vtt_text(""), Cow::Borrowed(_)));
+        assert!(matches!(escape_vtt_text("a & b"), Cow::Owned(_)));
+    }
+
     #[test]
     fn test_unescape_vtt_text() {
         assert_eq!(unescape_vtt_text("plain text"), "plain text");
@@ -1957,6 +3932,41 @@ mod tests {
         assert_eq!(unescape_vtt_text("&rlm;"), "\u{200F}");
     }
 
+    #[test]
+    fn test_unescape_vtt_text_single_pass() {
+        assert!(matches!(unescape_vtt_text("plain text"), Cow::Borrowed(_)));
+        assert_eq!(unescape_vtt_text("&amp;lt;"), "&lt;");
+        assert_eq!(unescape_vtt_text("a & b &unknown; c"), "a & b &unknown; c");
+        assert!(matches!(
+            unescape_vtt_text("a & b &unknown; c"),
+            Cow::Borrowed(_)
+        ));
+        assert_eq!(unescape_vtt_text("&&lt;&"), "&<&");
+        assert_eq!(unescape_vtt_text("&l"), "&l");
+        assert_eq!(unescape_vtt_text("x&gt;&lrm;"), "x>\u{200E}");
+    }
+
+    #[test]
+    fn test_unescape_decimal_references() {
+        assert_eq!(unescape_vtt_text("Tom &#38; Jerry"), "Tom & Jerry");
+        assert_eq!(unescape_vtt_text("&#60;b&#62;"), "<b>");
+        assert_eq!(unescape_vtt_text("&#233;t&#233;"), "été");
+        assert_eq!(unescape_vtt_text("&#1114111;"), "\u{10FFFF}");
+        // Literal "&#38;" survives an escape/unescape round trip
+        assert_eq!(unescape_vtt_text("&amp;#38;"), "&#38;");
+        for unknown in [
+            "&#;",
+            "&#38",
+            "&#0;",
+            "&#55296;",
+            "&#1114112;",
+            "&#00000038;",
+            "&#x26;",
+        ] {
+            assert_eq!(unescape_vtt_text(unknown), unknown);
+        }
+    }
+
     #[test]
     fn test_format_timestamp_flexible_long_format() {
         assert_eq!(format_timestamp_flexible(0.0, false), "00:00:00.000");
@@ -2006,6 +4016,26 @@ mod tests {
 
         // Invalid: wrong separator
         assert!(!is_valid_timestamp("00-00-00.000"));
+
+        // Long hours are allowed, single-digit fields and extra parts are not
+        assert!(is_valid_timestamp("123:00:00.000"));
+        assert!(!is_valid_timestamp("0:00:00.000"));
+        assert!(!is_valid_timestamp("00:0:00.000"));
+        assert!(!is_valid_timestamp("00:00:00:00.000"));
+        assert!(!is_valid_timestamp("00:00.00.000"));
+        assert!(!is_valid_timestamp(""));
+    }
+
+    #[test]
+    fn test_is_valid_timing() {
+        assert!(is_valid_timing("00:00:00.000 --> 00:00:05.000"));
+        assert!(is_valid_timing("00:00.000-->00:05.000"));
+        assert!(is_valid_timing(
+            "00:00.000 --> 00:05.000 position:50% align:start"
+        ));
+        assert!(!is_valid_timing("00:00.000 00:05.000"));
+        assert!(!is_valid_timing("00:00.000 --> 00:05.000 --> 00:06.000"));
+        assert!(!is_valid_timing("00:00.000 --> "));
     }
 
     #[test]
@@ -2093,6 +4123,16 @@ mod tests {
         assert!(validate_segment(&segment).is_err());
     }
 
+    #[test]
+    fn test_cue_times_valid() {
+        assert!(cue_times_valid(&[0.0, 1.0], &[1.0, 1.0]));
+        assert!(cue_times_valid(&[], &[]));
+        assert!(!cue_times_valid(&[0.0, 2.0], &[1.0, 1.5]));
+        assert!(!cue_times_valid(&[-0.5], &[1.0]));
+        assert!(!cue_times_valid(&[0.0], &[MAX_TIMESTAMP_SECONDS + 1.0]));
+        assert!(!cue_times_valid(&[f64::NAN], &[1.0]));
+    }
+
     #[test]
     fn test_prepare_cue_text_flatten_newlines() {
         let config = VttConfig {
@@ -2138,6 +4178,40 @@ mod tests {
         assert_eq!(prepare_cue_text("Tom & Jerry", &config), "Tom & Jerry");
     }
 
+    #[test]
+    fn test_push_cue_layout() {
+        let mut out = String::new();
+        let config = VttConfig::default();
+        push_cue(&mut out, 7, 3661.5, 3723.25, " a  <b> ", &config);
+        assert_eq!(out, "7\n01:01:01.500 --> 01:02:03.250\na &lt;b&gt;\n\n");
+
+        let short = VttConfig {
+            use_short_timestamps: true,
+            escape_special_chars: false,
+            ..Default::default()
+        };
+        out.clear();
+        push_cue(&mut out, 12, 59.9996, 3600.0, "<i>x</i>", &short);
+        assert_eq!(out, "12\n01:00.000 --> 01:00:00.000\n<i>x</i>\n\n");
+    }
+
+    #[test]
+    fn test_with_output_buffer_reentrant() {
+        let (outer, inner) = with_output_buffer(16, |outer| {
+            outer.push_str("outer");
+            let inner = with_output_buffer(16, |inner| {
+                inner.push_str("inner");
+                inner.clone()
+            });
+            outer.push_str(" done");
+            (outer.clone(), inner)
+        });
+        assert_eq!(outer, "outer done");
+        assert_eq!(inner, "inner");
+        // The shared buffer is released again, so the next build can take it
+        assert_eq!(with_output_buffer(16, |buffer| buffer.len()), 0);
+    }
+
     #[test]
     fn test_format_timestamp_internal() {
         assert_eq!(format_timestamp_internal(0.0), "00:00");
@@ -2145,4 +4219,69 @@ mod tests {
         assert_eq!(format_timestamp_internal(3661.0), "01:01:01");
         assert_eq!(format_timestamp_internal(59.0), "00:59");
     }
+
+    #[test]
+    fn test_filler_matcher_matches_sequential_removal() {
+        let defaults = FillerMatcher::default_fillers();
+        assert!(matches!(defaults, FillerMatcher::Automaton(_)));
+        assert_eq!(defaults.clean("Um so basically I think"), "so I think");
+        assert_eq!(defaults.clean("so like, okay so UH yes"), "so , yes");
+        assert_eq!(
+            defaults.clean("umbrella um_x likely"),
+            "umbrella um_x likely"
+        );
+
+        let custom = FillerMatcher::new(&["so like", "like", ""]);
+        assert_eq!(custom.clean("so like like it"), "it");
+
+        let unicode = FillerMatcher::new(&["ähm"]);
+        assert!(matches!(unicode, FillerMatcher::Regexes(_)));
+        assert_eq!(unicode.clean("ÄHM ja"), "ja");
+    }
+
+    #[test]
+    fn test_count_words_and_chars() {
+        assert_eq!(count_words_and_chars("  Hello   world \t"), (2, 13));
+        assert_eq!(count_words_and_chars("a\x0bb\x1cc"), (2, 5));
+        assert_eq!(count_words_and_chars(" \n "), (0, 0));
+        assert_eq!(count_words_and_chars(""), (0, 0));
+        assert_eq!(count_words_and_chars("\u{a0}été ok\u{3000}"), (2, 8));
+    }
+
+    #[test]
+    fn test_chapter_start_indices() {
+        let starts = [0.0, 31.0, 100.0, 131.0, 210.0];
+        let ends = [30.0, 90.0, 130.0, 200.0, 220.0];
+        assert_eq!(chapter_start_indices(&starts, &ends, 60.0, 5.0), [0, 2, 4]);
+        assert_eq!(chapter_start_indices(&starts, &ends, 200.0, 5.0), [0, 4]);
+        assert_eq!(chapter_start_indices(&[3661.0], &[3700.0], 60.0, 3.0), [0]);
+        assert!(chapter_start_indices(&[], &[], 60.0, 3.0).is_empty());
+    }
+
+    #[test]
+    fn test_split_point() {
+        assert_eq!(split_point(b"Hello world this", 12), Some(11));
+        assert_eq!(split_point(b"Hello world", 5), Some(5));
+        assert_eq!(split_point(b"Supercalifragilistic word", 8), Some(20));
+        assert_eq!(split_point(b"Unsplittable", 4), None);
+        assert_eq!(split_point(b"fits", 4), None);
+
+        assert!(is_single_spaced_ascii("one two three"));
+        assert!(!is_single_spaced_ascii("one  two"));
+        assert!(!is_single_spaced_ascii("one\ttwo"));
+        assert!(!is_single_spaced_ascii("niño come"));
+    }
+
+    #[test]
+    fn test_collapse_repeated_phrases() {
+        assert_eq!(collapse_repeated_phrases("I I think", 2, 5), "I think");
+        assert_eq!(
+            collapse_repeated_phrases("you know You Know  it", 2, 5),
+            "you know it"
+        );
+        assert_eq!(collapse_repeated_phrases("a b a b a", 2, 5), "a b a");
+        assert_eq!(collapse_repeated_phrases("go go stop", 3, 5), "go go stop");
+        assert_eq!(collapse_repeated_phrases("ÉTÉ été", 2, 1), "ÉTÉ");
+        assert_eq!(collapse_repeated_phrases("", 2, 5), "");
+    }
 }
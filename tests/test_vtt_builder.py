@@ -1,11 +1,16 @@
 import json
 import os
-import tempfile
+import uuid
+from array import array
+from pathlib import Path
 
 import pytest
+import vtt_builder
 from vtt_builder import (
+    Segments,
     VttCueError,
     VttError,
+    VttEscapingError,
     VttHeaderError,
     VttTimestampError,
     VttValidationError,
@@ -14,238 +19,112 @@ from vtt_builder import (
     build_vtt_from_records,
     build_vtt_string,
     detect_chapters,
+    detect_chapters_array,
     escape_vtt_text,
+    escape_vtt_text_many,
     filter_by_confidence,
+    filter_by_confidence_array,
     filter_segments_by_time,
+    filter_segments_by_time_array,
     get_segments_stats,
     group_by_speaker,
     merge_segments,
     remove_filler_words,
     remove_repeated_phrases,
     seconds_to_timestamp,
+    seconds_to_timestamp_array,
     shift_timestamps,
+    shift_timestamps_array,
     split_long_segments,
     timestamp_to_seconds,
+    timestamp_to_seconds_array,
     unescape_vtt_text,
+    unescape_vtt_text_many,
     validate_segments,
     validate_vtt_file,
+    validate_vtt_string,
     words_to_segments,
 )
 
-
-@pytest.fixture
-def sample_transcript_data():
-    """Sample transcript data for testing."""
-    return {
+# Sample transcripts, serialized once at import since their content never changes
+SAMPLE_JSON_1 = json.dumps(
+    {
         "transcript": "Hello world. This is a test.",
         "segments": [
             {"id": 1, "start": 0.0, "end": 2.5, "text": "Hello world"},
             {"id": 2, "start": 2.5, "end": 5.0, "text": "This is a test"},
         ],
     }
+)
 
-
-@pytest.fixture
-def sample_transcript_data_2():
-    """Second sample for multi-file tests."""
-    return {
+SAMPLE_JSON_2 = json.dumps(
+    {
         "transcript": "Second transcript file.",
         "segments": [
             {"id": 3, "start": 0.0, "end": 1.5, "text": "Second transcript"},
             {"id": 4, "start": 1.5, "end": 3.0, "text": "file"},
         ],
     }
+)
 
-
-@pytest.fixture
-def sample_transcript_data_3():
-    """Second sample for multi-file tests."""
-    return {
+SAMPLE_JSON_3 = json.dumps(
+    {
         "transcript": "Third transcript file.",
         "segments": [
             {"id": 3, "start": 0.0, "end": 1.5, "text": "Third\n\n\n transcript"},
             {"id": 4, "start": 1.5, "end": 3.0, "text": "file"},
         ],
     }
+)
 
 
-@pytest.fixture
-def temp_json_file(sample_transcript_data):
-    """Create a temporary JSON file with sample data."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(sample_transcript_data, f)
-        temp_path = f.name
-    yield temp_path
-    os.unlink(temp_path)
-
-
-@pytest.fixture
-def temp_output_file():
-    """Create a temporary output file path."""
-    with tempfile.NamedTemporaryFile(suffix=".vtt", delete=False) as f:
-        temp_path = f.name
-    os.unlink(temp_path)  # Delete immediately, we just need the path
-    yield temp_path
-    # Cleanup after test
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
-
-
-class TestVTTBuilder:
-    """Test suite for VTT builder functions."""
-
-    def test_build_vtt_from_json_files_single_file(self, temp_json_file, temp_output_file):
-        """Test building VTT from a single JSON file."""
-        build_vtt_from_json_files([temp_json_file], temp_output_file)
-
-        # Verify output file exists
-        assert os.path.exists(temp_output_file)
-
-        # Read and verify content
-        with open(temp_output_file) as f:
-            content = f.read()
-
-        assert content.startswith("WEBVTT\n")
-        assert "1\n00:00:00.000 --> 00:00:02.500\nHello world" in content
-        assert "2\n00:00:02.500 --> 00:00:05.000\nThis is a test" in content
-
-    def test_build_vtt_from_json_files_multiple_files(
-        self, sample_transcript_data, sample_transcript_data_2, temp_output_file
-    ):
-        """Test building VTT from multiple JSON files."""
-        # Create two temp files
-        temp_files = []
-        for data in [sample_transcript_data, sample_transcript_data_2]:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-                json.dump(data, f)
-                temp_files.append(f.name)
-
-        try:
-            build_vtt_from_json_files(temp_files, temp_output_file)
-
-            with open(temp_output_file) as f:
-                content = f.read()
-
-            assert content.startswith("WEBVTT\n")
-            # Check that segments are properly offset
-            assert "1\n00:00:00.000 --> 00:00:02.500\nHello world" in content
-            assert "2\n00:00:02.500 --> 00:00:05.000\nThis is a test" in content
-            # Second file segments should be offset by 5.0 seconds
-            assert "3\n00:00:05.000 --> 00:00:06.500\nSecond transcript" in content
-            assert "4\n00:00:06.500 --> 00:00:08.000\nfile" in content
-
-        finally:
-            # Cleanup temp files
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-
-    def test_build_vtt_from_json_files_nonexistent_file(self, temp_output_file):
-        """Test error handling for nonexistent input file."""
-        with pytest.raises(IOError):
-            build_vtt_from_json_files(["/nonexistent/file.json"], temp_output_file)
-
-    def test_build_vtt_from_json_files_invalid_json(self, temp_output_file):
-        """Test error handling for invalid JSON."""
-        # Create temp file with invalid JSON
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{ invalid json }")
-            temp_invalid = f.name
-
-        try:
-            with pytest.raises(ValueError):
-                build_vtt_from_json_files([temp_invalid], temp_output_file)
-        finally:
-            os.unlink(temp_invalid)
-
-    def test_build_transcript_from_json_files_single_file(self, temp_json_file, temp_output_file):
-        """Test building transcript from a single JSON file."""
-        build_transcript_from_json_files([temp_json_file], temp_output_file)
-
-        assert os.path.exists(temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read().strip()
-
-        assert content == "Hello world. This is a test."
-
-    def test_build_transcript_from_json_files_multiple_files(
-        self, sample_transcript_data, sample_transcript_data_2, temp_output_file
-    ):
-        """Test building transcript from multiple JSON files."""
-        temp_files = []
-        for data in [sample_transcript_data, sample_transcript_data_2]:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-                json.dump(data, f)
-                temp_files.append(f.name)
-
-        try:
-            build_transcript_from_json_files(temp_files, temp_output_file)
-
-            with open(temp_output_file) as f:
-                content = f.read()
+# Transcript files larger than this are parsed from a stream instead of read whole
+STREAMED_FILE_BYTES = 16 * 1024 * 1024
 
-            expected = "Hello world. This is a test.\n\nSecond transcript file.\n"
-            assert content == expected
 
-        finally:
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+def write_json_files(directory, *documents):
+    """Write each serialized JSON document to its own file in `directory`, returning the paths."""
+    paths = []
+    for i, document in enumerate(documents):
+        path = directory / f"input_{i}.json"
+        path.write_text(document)
+        paths.append(str(path))
+    return paths
 
-    def test_build_vtt_from_records(self, temp_output_file):
-        """Test building VTT from Python dictionary records."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "First segment"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "Second segment"},
-            {"id": 3, "start": 4.0, "end": 6.0, "text": "Third segment"},
-        ]
 
-        build_vtt_from_records(segments, temp_output_file)
+def read_output(path):
+    """Read a generated output file as UTF-8 text."""
+    return Path(path).read_text(encoding="utf-8")
 
-        assert os.path.exists(temp_output_file)
 
-        with open(temp_output_file) as f:
-            content = f.read()
+def assert_all_in(content, *needles):
+    """Assert every needle occurs in `content`, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in content]
+    assert not missing, f"missing from output: {missing!r}"
 
-        assert content.startswith("WEBVTT\n")
-        assert "1\n00:00:00.000 --> 00:00:02.000\nFirst segment" in content
-        assert "2\n00:00:02.000 --> 00:00:04.000\nSecond segment" in content
-        assert "3\n00:00:04.000 --> 00:00:06.000\nThird segment" in content
 
-    def test_build_vtt_from_records_missing_fields(self, temp_output_file):
-        """Test error handling for missing required fields."""
-        incomplete_segments = [
-            {"id": 1, "start": 0.0},  # Missing 'end' and 'text'
-        ]
+@pytest.fixture(scope="session")
+def temp_json_file(tmp_path_factory):
+    """Path to a JSON file with sample data, written once and shared by every test."""
+    return write_json_files(tmp_path_factory.mktemp("data"), SAMPLE_JSON_1)[0]
 
-        with pytest.raises(KeyError):
-            build_vtt_from_records(incomplete_segments, temp_output_file)
 
-    def test_build_vtt_from_records_text_cleaning(self, temp_output_file):
-        """Test that newlines in text are properly handled."""
-        segments = [
-            {
-                "id": 1,
-                "start": 0.0,
-                "end": 2.0,
-                "text": "Text with\n\n\nnewlines\nhere",
-            },
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "  Whitespace text  "},
-        ]
+@pytest.fixture(scope="session")
+def output_dir(tmp_path_factory):
+    """One directory for every test's output file, created once per session."""
+    return tmp_path_factory.mktemp("output")
 
-        build_vtt_from_records(segments, temp_output_file)
 
-        with open(temp_output_file) as f:
-            content = f.read()
+@pytest.fixture
+def temp_output_file(output_dir):
+    """Unique output file path (not yet created); pytest removes its directory."""
+    return str(output_dir / f"{uuid.uuid4().hex}.vtt")
 
-        # Newlines should be replaced with spaces, text should be trimmed
-        assert "Text with newlines here" in content
-        assert "Whitespace text" in content
 
-    def test_validate_vtt_file_valid(self, temp_output_file):
-        """Test validation of a valid VTT file."""
-        valid_vtt = """WEBVTT
+# (content, expected error) pairs for validate_vtt_file; None means the file is valid
+VTT_VALIDATION_CASES = [
+    pytest.param(
+        """WEBVTT
 
 1
 00:00:00.000 --> 00:00:02.500
@@ -254,16 +133,12 @@ Hello world
 2
 00:00:02.500 --> 00:00:05.000
 This is a test
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_valid_with_cue_identifiers(self, temp_output_file):
-        """Test validation of VTT with cue identifiers."""
-        valid_vtt = """WEBVTT
+""",
+        None,
+        id="valid",
+    ),
+    pytest.param(
+        """WEBVTT
 
 cue1
 00:00:00.000 --> 00:00:02.500
@@ -272,16 +147,12 @@ Hello world
 cue2
 00:00:02.500 --> 00:00:05.000
 This is a test
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_valid_with_metadata(self, temp_output_file):
-        """Test validation of VTT with metadata headers."""
-        valid_vtt = """WEBVTT
+""",
+        None,
+        id="valid_with_cue_identifiers",
+    ),
+    pytest.param(
+        """WEBVTT
 Kind: captions
 Language: en
 
@@ -295,42 +166,30 @@ This is a comment
 2
 00:00:02.500 --> 00:00:05.000
 This is a test
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_missing_header(self, temp_output_file):
-        """Test validation fails for missing WEBVTT header."""
-        invalid_vtt = """1
+""",
+        None,
+        id="valid_with_metadata",
+    ),
+    pytest.param(
+        """1
 00:00:00.000 --> 00:00:02.500
 Hello world
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttHeaderError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_wrong_header(self, temp_output_file):
-        """Test validation fails for incorrect header."""
-        invalid_vtt = """WEBVTT-WRONG
+""",
+        VttHeaderError,
+        id="missing_header",
+    ),
+    pytest.param(
+        """WEBVTT-WRONG
 
 1
 00:00:00.000 --> 00:00:02.500
 Hello world
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttHeaderError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_split_cue(self, temp_output_file):
-        """Test validation fails for incorrect header."""
-        invalid_vtt = """WEBVTT
+""",
+        VttHeaderError,
+        id="wrong_header",
+    ),
+    pytest.param(
+        """WEBVTT
 
 1
 00:00:00.000 --> 00:00:02.500
@@ -341,16 +200,12 @@ world
 2
 00:00:03.000 --> 00:00:04.500
 Hello world
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttTimestampError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_mixed_cue_ids(self, temp_output_file):
-        """Test validation of a valid VTT file."""
-        valid_vtt = """WEBVTT
+""",
+        VttTimestampError,
+        id="split_cue",
+    ),
+    pytest.param(
+        """WEBVTT
 
 00:00:00.000 --> 00:00:02.500
 Hello world
@@ -358,52 +213,37 @@ Hello world
 2
 00:00:02.500 --> 00:00:05.000
 This is a test
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_empty(self, temp_output_file):
-        """Test validation fails for empty file."""
-        with open(temp_output_file, "w") as f:
-            f.write("")
-
-        with pytest.raises(VttHeaderError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_invalid_timing_format(self, temp_output_file):
-        """Test validation fails for invalid timing format."""
-        invalid_vtt = """WEBVTT
+""",
+        None,
+        id="mixed_cue_ids",
+    ),
+    pytest.param(
+        "",
+        VttHeaderError,
+        id="empty",
+    ),
+    pytest.param(
+        """WEBVTT
 
 1
 00:00:00 --> 00:00:02.500
 Hello world
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttTimestampError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_invalid_timing_arrow(self, temp_output_file):
-        """Test validation fails for invalid timing arrow."""
-        invalid_vtt = """WEBVTT
+""",
+        VttTimestampError,
+        id="invalid_timing_format",
+    ),
+    pytest.param(
+        """WEBVTT
 
 1
 00:00:00.000 -> 00:00:02.500
 Hello world
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttTimestampError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_missing_cue_text(self, temp_output_file):
-        """Test validation fails for cues without text."""
-        invalid_vtt = """WEBVTT
+""",
+        VttTimestampError,
+        id="invalid_timing_arrow",
+    ),
+    pytest.param(
+        """WEBVTT
 
 1
 00:00:00.000 --> 00:00:02.500
@@ -411,88 +251,69 @@ Hello world
 2
 00:00:02.500 --> 00:00:05.000
 This has text
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttCueError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_missing_timing_after_identifier(self, temp_output_file):
-        """Test validation fails when cue identifier is not followed by timing."""
-        invalid_vtt = """WEBVTT
+""",
+        VttCueError,
+        id="missing_cue_text",
+    ),
+    pytest.param(
+        """WEBVTT
 
 cue1
 Hello world without timing
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(invalid_vtt)
-
-        with pytest.raises(VttTimestampError):
-            validate_vtt_file(temp_output_file)
-
-    def test_validate_vtt_file_nonexistent(self):
-        """Test validation fails for nonexistent file."""
-        with pytest.raises(IOError):
-            validate_vtt_file("/nonexistent/file.vtt")
-
-    def test_validate_vtt_file_short_timestamps(self, temp_output_file):
-        """Test validation accepts short timestamp format (MM:SS.mmm)."""
-        valid_vtt = """WEBVTT
+""",
+        VttTimestampError,
+        id="missing_timing_after_identifier",
+    ),
+    pytest.param(
+        """WEBVTT
 
 00:05.000 --> 00:10.000
 Short format timestamps
 
 01:30.500 --> 02:00.000
 Another cue
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_with_bom(self, temp_output_file):
-        """Test validation handles UTF-8 BOM correctly."""
-        # Write file with BOM
-        with open(temp_output_file, "wb") as f:
-            f.write(b"\xef\xbb\xbfWEBVTT\n\n00:00:00.000 --> 00:00:05.000\nText\n")
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_with_header_text(self, temp_output_file):
-        """Test validation accepts header with description text."""
-        valid_vtt = """WEBVTT - My Video Captions
+""",
+        None,
+        id="short_timestamps",
+    ),
+    pytest.param(
+        b"\xef\xbb\xbfWEBVTT\n\n00:00:00.000 --> 00:00:05.000\nText\n",
+        None,
+        id="with_bom",
+    ),
+    pytest.param(
+        b"WEBVTT\r\n\r\n1\r\n00:00:00.000 --> 00:00:05.000\r\nText\r\n\r\nNOTE x\r\n\r\n",
+        None,
+        id="with_crlf",
+    ),
+    pytest.param(
+        b"WEBVTT\n\n00:00:00.000 --> 00:00:05.000\n\xff\xfe\n",
+        IOError,
+        id="invalid_utf8",
+    ),
+    pytest.param(
+        """WEBVTT - My Video Captions
 
 00:00:00.000 --> 00:00:05.000
 Cue text
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_with_cue_settings(self, temp_output_file):
-        """Test validation accepts cue settings after timestamp."""
-        valid_vtt = """WEBVTT
+""",
+        None,
+        id="with_header_text",
+    ),
+    pytest.param(
+        """WEBVTT
 
 00:00:00.000 --> 00:00:05.000 position:50% align:center
 Centered text
 
 00:00:05.000 --> 00:00:10.000 vertical:rl line:0
 Vertical text
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
-
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
-
-    def test_validate_vtt_file_with_region_block(self, temp_output_file):
-        """Test validation skips REGION blocks correctly."""
-        valid_vtt = """WEBVTT
+""",
+        None,
+        id="with_cue_settings",
+    ),
+    pytest.param(
+        """WEBVTT
 
 REGION
 id:region1
@@ -501,12 +322,239 @@ lines:3
 
 00:00:00.000 --> 00:00:05.000
 Cue text
-"""
-        with open(temp_output_file, "w") as f:
-            f.write(valid_vtt)
+""",
+        None,
+        id="with_region_block",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def vtt_corpus(tmp_path_factory):
+    """Paths of the VTT_VALIDATION_CASES files keyed by content, written once per session.
+
+    tmp_path_factory gives each pytest-xdist worker its own base directory, so the
+    validation cases can run in parallel without sharing files.
+    """
+    directory = tmp_path_factory.mktemp("vtt_corpus")
+    paths = {}
+    for case in VTT_VALIDATION_CASES:
+        content = case.values[0]
+        path = directory / f"{case.id}.vtt"
+        path.write_bytes(content if isinstance(content, bytes) else content.encode())
+        paths[content] = str(path)
+    return paths
 
-        result = validate_vtt_file(temp_output_file)
-        assert result is True
+
+class TestVTTBuilder:
+    """Test suite for VTT builder functions."""
+
+    def test_build_vtt_from_json_files_single_file(self, temp_json_file, temp_output_file):
+        """Test building VTT from a single JSON file."""
+        build_vtt_from_json_files([temp_json_file], temp_output_file)
+
+        # Reading fails if the output file was not created
+        content = read_output(temp_output_file)
+
+        assert content.startswith("WEBVTT\n")
+        assert "1\n00:00:00.000 --> 00:00:02.500\nHello world" in content
+        assert "2\n00:00:02.500 --> 00:00:05.000\nThis is a test" in content
+
+    def test_build_vtt_from_json_files_multiple_files(self, tmp_path, temp_output_file):
+        """Test building VTT from multiple JSON files."""
+        temp_files = write_json_files(tmp_path, SAMPLE_JSON_1, SAMPLE_JSON_2)
+        build_vtt_from_json_files(temp_files, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        assert content.startswith("WEBVTT\n")
+        # Check that segments are properly offset; the second file's by 5.0 seconds
+        assert_all_in(
+            content,
+            "1\n00:00:00.000 --> 00:00:02.500\nHello world",
+            "2\n00:00:02.500 --> 00:00:05.000\nThis is a test",
+            "3\n00:00:05.000 --> 00:00:06.500\nSecond transcript",
+            "4\n00:00:06.500 --> 00:00:08.000\nfile",
+        )
+
+    def test_build_vtt_from_json_files_preserves_file_order(self, tmp_path, temp_output_file):
+        """Test many input files are merged in the order given."""
+        temp_files = []
+        for i in range(12):
+            path = tmp_path / f"part_{i}.json"
+            segment = {"id": 1, "start": 0.0, "end": 1.0, "text": f"Part {i}"}
+            path.write_text(json.dumps({"transcript": f"Part {i}", "segments": [segment]}))
+            temp_files.append(str(path))
+
+        build_vtt_from_json_files(temp_files, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        for i in range(12):
+            assert f"{i + 1}\n00:00:{i:02d}.000 --> 00:00:{i + 1:02d}.000\nPart {i}\n" in content
+
+    def test_build_transcript_from_json_files_preserves_file_order(
+        self, tmp_path, temp_output_file
+    ):
+        """Test transcript text from many files is joined in the order given."""
+        temp_files = []
+        for i in range(12):
+            path = tmp_path / f"part_{i}.json"
+            path.write_text(json.dumps({"transcript": f"Part {i}", "segments": []}))
+            temp_files.append(str(path))
+
+        build_transcript_from_json_files(temp_files, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        assert content == "\n\n".join(f"Part {i}" for i in range(12)) + "\n"
+
+    def test_build_vtt_from_json_files_nonexistent_file(self, temp_output_file):
+        """Test error handling for nonexistent input file."""
+        with pytest.raises(IOError):
+            build_vtt_from_json_files(["/nonexistent/file.json"], temp_output_file)
+
+    def test_build_vtt_from_json_files_invalid_json(self, tmp_path, temp_output_file):
+        """Test error handling for invalid JSON."""
+        temp_invalid = tmp_path / "invalid.json"
+        temp_invalid.write_text("{ invalid json }")
+
+        with pytest.raises(ValueError):
+            build_vtt_from_json_files([str(temp_invalid)], temp_output_file)
+
+    def test_build_from_json_files_streamed_file(self, tmp_path, temp_output_file):
+        """Test files above the read-buffer limit, which are streamed, build the same output."""
+        segments = [
+            {"id": i + 1, "start": float(i), "end": i + 1.0, "text": f"Cue {i}"}
+            for i in range(1000)
+        ]
+        # The transcript comes first, so the segments are parsed after many buffer refills
+        transcript = "word " * (STREAMED_FILE_BYTES // 5 + 1)
+        large, small = write_json_files(
+            tmp_path,
+            json.dumps({"transcript": transcript, "segments": segments}),
+            json.dumps({"transcript": "", "segments": segments}),
+        )
+        assert os.path.getsize(large) > STREAMED_FILE_BYTES
+
+        build_vtt_from_json_files([small], temp_output_file)
+        expected = read_output(temp_output_file)
+        build_vtt_from_json_files([large], temp_output_file)
+        assert read_output(temp_output_file) == expected
+
+        build_transcript_from_json_files([large], temp_output_file)
+        assert read_output(temp_output_file) == transcript.strip() + "\n"
+
+    def test_build_from_json_files_streamed_invalid_json(self, tmp_path, temp_output_file):
+        """Test invalid JSON in a streamed file raises ValueError, not IOError."""
+        document = json.dumps(
+            {"transcript": "word " * (STREAMED_FILE_BYTES // 5 + 1), "segments": []}
+        )
+        # Truncated, so the parser only fails once it reaches the end of the stream
+        (path,) = write_json_files(tmp_path, document[:-1])
+        assert os.path.getsize(path) > STREAMED_FILE_BYTES
+
+        for build in (build_vtt_from_json_files, build_transcript_from_json_files):
+            with pytest.raises(ValueError):
+                build([path], temp_output_file)
+
+    def test_build_transcript_from_json_files_single_file(self, temp_json_file, temp_output_file):
+        """Test building transcript from a single JSON file."""
+        build_transcript_from_json_files([temp_json_file], temp_output_file)
+
+        content = read_output(temp_output_file).strip()
+
+        assert content == "Hello world. This is a test."
+
+    def test_build_transcript_from_json_files_multiple_files(self, tmp_path, temp_output_file):
+        """Test building transcript from multiple JSON files."""
+        temp_files = write_json_files(tmp_path, SAMPLE_JSON_1, SAMPLE_JSON_2)
+        build_transcript_from_json_files(temp_files, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        expected = "Hello world. This is a test.\n\nSecond transcript file.\n"
+        assert content == expected
+
+    def test_build_vtt_from_records(self, temp_output_file):
+        """Test building VTT from Python dictionary records."""
+        segments = [
+            {"id": 1, "start": 0.0, "end": 2.0, "text": "First segment"},
+            {"id": 2, "start": 2.0, "end": 4.0, "text": "Second segment"},
+            {"id": 3, "start": 4.0, "end": 6.0, "text": "Third segment"},
+        ]
+
+        build_vtt_from_records(segments, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        assert content.startswith("WEBVTT\n")
+        assert_all_in(
+            content,
+            "1\n00:00:00.000 --> 00:00:02.000\nFirst segment",
+            "2\n00:00:02.000 --> 00:00:04.000\nSecond segment",
+            "3\n00:00:04.000 --> 00:00:06.000\nThird segment",
+        )
+
+    def test_build_vtt_from_records_missing_fields(self, temp_output_file):
+        """Test error handling for missing required fields."""
+        incomplete_segments = [
+            {"id": 1, "start": 0.0},  # Missing 'end' and 'text'
+        ]
+
+        with pytest.raises(KeyError):
+            build_vtt_from_records(incomplete_segments, temp_output_file)
+
+    def test_build_vtt_from_records_text_cleaning(self, temp_output_file):
+        """Test that newlines in text are properly handled."""
+        segments = [
+            {
+                "id": 1,
+                "start": 0.0,
+                "end": 2.0,
+                "text": "Text with\n\n\nnewlines\nhere",
+            },
+            {"id": 2, "start": 2.0, "end": 4.0, "text": "  Whitespace text  "},
+        ]
+
+        build_vtt_from_records(segments, temp_output_file)
+
+        content = read_output(temp_output_file)
+
+        # Newlines should be replaced with spaces, text should be trimmed
+        assert "Text with newlines here" in content
+        assert "Whitespace text" in content
+
+    @pytest.mark.parametrize("content, expected_error", VTT_VALIDATION_CASES)
+    def test_validate_vtt_file(self, vtt_corpus, content, expected_error):
+        """Test validate_vtt_file accepts valid files and raises the expected error otherwise."""
+        path = vtt_corpus[content]
+
+        if expected_error is None:
+            assert validate_vtt_file(path) is True
+        else:
+            with pytest.raises(expected_error):
+                validate_vtt_file(path)
+
+    @pytest.mark.parametrize("content, expected_error", VTT_VALIDATION_CASES)
+    def test_validate_vtt_string(self, content, expected_error):
+        """Test validate_vtt_string agrees with validate_vtt_file on every case."""
+        if isinstance(content, bytes):
+            try:
+                content = content.decode("utf-8")
+            except UnicodeDecodeError:
+                pytest.skip("content is not valid UTF-8, so it cannot be a str")
+
+        if expected_error is None:
+            assert validate_vtt_string(content) is True
+        else:
+            with pytest.raises(expected_error):
+                validate_vtt_string(content)
+
+    def test_validate_vtt_file_nonexistent(self):
+        """Test validation fails for nonexistent file."""
+        with pytest.raises(IOError):
+            validate_vtt_file("/nonexistent/file.vtt")
 
 
 class TestCharacterEscaping:
@@ -538,6 +586,19 @@ class TestCharacterEscaping:
         assert result == "Tom --&gt; Jerry"
         assert "-->" not in result
 
+    def test_escape_matches_translate_reference(self):
+        """Test escaping short and long text matches a single-pass reference."""
+        table = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+        for length in range(0, 40):
+            for special in ("", "&", "<", ">", "&lt;"):
+                text = ("é" + "x" * length)[:length] + special
+                assert escape_vtt_text(text) == text.translate(table)
+
+    def test_escape_clean_text_returns_same_object(self):
+        """Test text without special characters is returned without copying."""
+        original = "Nothing to escape here"
+        assert escape_vtt_text(original) is original
+
     def test_unescape_ampersand(self):
         """Test ampersand is unescaped."""
         result = unescape_vtt_text("Tom &amp; Jerry")
@@ -563,6 +624,54 @@ class TestCharacterEscaping:
         result = unescape_vtt_text("&lrm;Text&rlm;")
         assert result == "\u200eText\u200f"
 
+    def test_unescape_decimal_references(self):
+        """Test decimal character references are unescaped."""
+        assert unescape_vtt_text("Tom &#38; Jerry &#60;3") == "Tom & Jerry <3"
+        assert unescape_vtt_text("&#0;&#x26;") == "&#0;&#x26;"
+
+    def test_unescape_is_single_pass(self):
+        """Test decoded output is not decoded a second time."""
+        assert unescape_vtt_text("&amp;lt;") == "&lt;"
+        assert unescape_vtt_text(escape_vtt_text("&lt;b&gt;")) == "&lt;b&gt;"
+
+    def test_escape_clean_unicode_text_returns_same_object(self):
+        """Test non-ASCII text without special characters is not copied."""
+        for original in ["¿Año?", "Hola, ¿cómo estás? Año nuevo", "日本語のテキスト" * 4]:
+            assert escape_vtt_text(original) is original
+
+    def test_unescape_plain_text_returns_same_object(self):
+        """Test text without entities is returned without copying."""
+        original = "Nothing to unescape here"
+        assert unescape_vtt_text(original) is original
+
+    def test_unescape_literal_ampersand_returns_same_object(self):
+        """Test text whose '&' starts no entity is returned without copying."""
+        original = "Tom & Jerry &copy; 2024"
+        assert unescape_vtt_text(original) is original
+
+    def test_escape_many(self):
+        """Test batch escaping matches per-string escaping."""
+        texts = ["Tom & Jerry", "plain", "1 < 2 > 0", ""]
+        assert escape_vtt_text_many(texts) == [escape_vtt_text(t) for t in texts]
+
+    def test_escape_many_reuses_clean_strings(self):
+        """Test strings without special characters are passed through."""
+        texts = ["plain", "Tom & Jerry"]
+        result = escape_vtt_text_many(texts)
+        assert result[0] is texts[0]
+
+    def test_unescape_many(self):
+        """Test batch unescaping matches per-string unescaping."""
+        texts = ["Tom &amp; Jerry", "plain", "&lt;b&gt;&nbsp;", ""]
+        assert unescape_vtt_text_many(texts) == [unescape_vtt_text(t) for t in texts]
+
+    def test_escape_many_rejects_non_strings(self):
+        """Test batch functions raise TypeError for non-string items."""
+        with pytest.raises(TypeError):
+            escape_vtt_text_many(["ok", 42])
+        with pytest.raises(TypeError):
+            unescape_vtt_text_many([None])
+
     def test_escape_unescape_roundtrip(self):
         """Test escaping and unescaping returns original text."""
         original = "Tom & Jerry say 1 < 2 > 0"
@@ -570,31 +679,25 @@ class TestCharacterEscaping:
         unescaped = unescape_vtt_text(escaped)
         assert unescaped == original
 
-    def test_build_vtt_escapes_special_chars(self, temp_output_file):
+    def test_build_vtt_escapes_special_chars(self):
         """Test that building VTT automatically escapes special characters."""
         segments = [
             {"id": 1, "start": 0.0, "end": 2.0, "text": "Tom & Jerry"},
             {"id": 2, "start": 2.0, "end": 4.0, "text": "Use <html> tags"},
         ]
 
-        build_vtt_from_records(segments, temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string(segments)
 
         assert "Tom &amp; Jerry" in content
         assert "Use &lt;html&gt; tags" in content
 
-    def test_build_vtt_can_disable_escaping(self, temp_output_file):
+    def test_build_vtt_can_disable_escaping(self):
         """Test that escaping can be disabled."""
         segments = [
             {"id": 1, "start": 0.0, "end": 2.0, "text": "Tom & Jerry"},
         ]
 
-        build_vtt_from_records(segments, temp_output_file, escape_text=False)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string(segments, escape_text=False)
 
         # Should NOT be escaped
         assert "Tom & Jerry" in content
@@ -674,6 +777,16 @@ class TestSegmentValidation:
         with pytest.raises(VttTimestampError):
             build_vtt_from_records(invalid_segments, temp_output_file)
 
+    def test_build_vtt_writes_no_cues_when_validation_fails(self, temp_output_file):
+        """Test that a late invalid segment keeps earlier cues out of the file."""
+        segments = [
+            {"id": 1, "start": 0.0, "end": 1.0, "text": "Valid cue"},
+            {"id": 2, "start": 1.0, "end": 2.0, "text": "   "},
+        ]
+        with pytest.raises(VttCueError):
+            build_vtt_from_records(segments, temp_output_file)
+        assert read_output(temp_output_file) == "WEBVTT\n\n"
+
     def test_build_vtt_can_skip_validation(self, temp_output_file):
         """Test that validation can be disabled."""
         invalid_segments = [
@@ -697,146 +810,94 @@ class TestSegmentValidation:
         assert result is True
 
 
-class TestMultilingualSupport:
-    """Test support for multiple languages."""
-
-    def test_spanish_characters(self, temp_output_file):
-        """Test Spanish characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "El niño comió"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "¿Cómo estás? ¡Hola!"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "El niño comió" in content
-        assert "¿Cómo estás? ¡Hola!" in content
+# Two cue texts per language, which must come through the builder byte for byte
+MULTILINGUAL_TEXTS = [
+    pytest.param(["El niño comió", "¿Cómo estás? ¡Hola!"], id="spanish"),
+    pytest.param(["Ação e emoção", "São Paulo é lindo"], id="portuguese"),
+    pytest.param(["Café et crème brûlée", "Ça va très bien, merci"], id="french"),
+    pytest.param(["Größe und Übung", "Schöne Grüße aus München"], id="german"),
+    pytest.param(["Città e università", "È più grande"], id="italian"),
+    pytest.param(["Łódź i Kraków", "Żółć i gęś"], id="polish"),
+]
 
-    def test_portuguese_characters(self, temp_output_file):
-        """Test Portuguese characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "Ação e emoção"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "São Paulo é lindo"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "Ação e emoção" in content
-        assert "São Paulo é lindo" in content
 
-    def test_french_characters(self, temp_output_file):
-        """Test French characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "Café et crème brûlée"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "Ça va très bien, merci"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "Café et crème brûlée" in content
-        assert "Ça va très bien, merci" in content
+@pytest.fixture(scope="session")
+def multilingual_vtt(tmp_path_factory):
+    """Bytes of one VTT file holding every MULTILINGUAL_TEXTS cue, built once per session."""
+    texts = [text for case in MULTILINGUAL_TEXTS for text in case.values[0]]
+    segments = [
+        {"id": i + 1, "start": i * 2.0, "end": i * 2.0 + 2.0, "text": text}
+        for i, text in enumerate(texts)
+    ]
+    path = tmp_path_factory.mktemp("multilingual") / "all.vtt"
+    build_vtt_from_records(segments, str(path))
+    return path.read_bytes()
 
-    def test_german_characters(self, temp_output_file):
-        """Test German characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "Größe und Übung"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "Schöne Grüße aus München"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "Größe und Übung" in content
-        assert "Schöne Grüße aus München" in content
 
-    def test_italian_characters(self, temp_output_file):
-        """Test Italian characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "Città e università"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "È più grande"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "Città e università" in content
-        assert "È più grande" in content
+class TestMultilingualSupport:
+    """Test support for multiple languages."""
 
-    def test_polish_characters(self, temp_output_file):
-        """Test Polish characters are preserved."""
-        segments = [
-            {"id": 1, "start": 0.0, "end": 2.0, "text": "Łódź i Kraków"},
-            {"id": 2, "start": 2.0, "end": 4.0, "text": "Żółć i gęś"},
-        ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
-        assert "Łódź i Kraków" in content
-        assert "Żółć i gęś" in content
+    @pytest.mark.parametrize("texts", MULTILINGUAL_TEXTS)
+    def test_non_ascii_characters_preserved(self, multilingual_vtt, texts):
+        """Test accented characters are preserved in each language."""
+        # The file is UTF-8, so compare encoded bytes rather than decoding it
+        for text in texts:
+            assert f"\n{text}\n".encode() in multilingual_vtt
 
-    def test_mixed_language_with_special_chars(self, temp_output_file):
+    def test_mixed_language_with_special_chars(self):
         """Test mixed languages with special characters that need escaping."""
         segments = [
             {"id": 1, "start": 0.0, "end": 2.0, "text": "Español: niño & niña"},
             {"id": 2, "start": 2.0, "end": 4.0, "text": "Français: café < thé"},
             {"id": 3, "start": 4.0, "end": 6.0, "text": "Deutsch: größer > kleiner"},
         ]
-        build_vtt_from_records(segments, temp_output_file)
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
+        content = build_vtt_string(segments)
         # Check escaping works with special characters
-        assert "Español: niño &amp; niña" in content
-        assert "Français: café &lt; thé" in content
-        assert "Deutsch: größer &gt; kleiner" in content
+        assert_all_in(
+            content,
+            "Español: niño &amp; niña",
+            "Français: café &lt; thé",
+            "Deutsch: größer &gt; kleiner",
+        )
 
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_empty_segments_list(self, temp_output_file):
+    def test_empty_segments_list(self):
         """Test building VTT with empty segments list."""
-        build_vtt_from_records([], temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string([])
 
         # Should still have WEBVTT header
         assert content.strip() == "WEBVTT"
 
-    def test_single_segment(self, temp_output_file):
+    def test_single_segment(self):
         """Test building VTT with a single segment."""
         segments = [{"id": 1, "start": 0.0, "end": 2.0, "text": "Only segment"}]
 
-        build_vtt_from_records(segments, temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string(segments)
 
         assert "WEBVTT" in content
         assert "1\n00:00:00.000 --> 00:00:02.000\nOnly segment" in content
 
-    def test_zero_duration_segment(self, temp_output_file):
+    def test_zero_duration_segment(self):
         """Test segment with zero duration."""
         segments = [{"id": 1, "start": 1.0, "end": 1.0, "text": "Zero duration"}]
 
-        build_vtt_from_records(segments, temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string(segments)
 
         assert "1\n00:00:01.000 --> 00:00:01.000\nZero duration" in content
 
-    def test_large_timestamps(self, temp_output_file):
+    def test_large_timestamps(self):
         """Test with large timestamp values."""
         segments = [{"id": 1, "start": 3661.5, "end": 3665.0, "text": "Large timestamp"}]
 
-        build_vtt_from_records(segments, temp_output_file)
-
-        with open(temp_output_file) as f:
-            content = f.read()
+        content = build_vtt_string(segments)
 
         # Should format as 01:01:01.500 --> 01:01:05.000
         assert "01:01:01.500 --> 01:01:05.000" in content
 
-    def test_special_characters_in_text(self, temp_output_file):
+    def test_special_characters_in_text(self):
         """Test segments with special characters."""
         segments = [
             {"id": 1, "start": 0.0, "end": 2.0, "text": "Text with émojis 🎉 and ñ"},
@@ -848,10 +909,7 @@ class TestEdgeCases:
             },
         ]
 
-        build_vtt_from_records(segments, temp_output_file)
-
-        with open(temp_output_file, encoding="utf-8") as f:
-            content = f.read()
+        content = build_vtt_string(segments)
 
         assert "Text with émojis 🎉 and ñ" in content
         assert "Quotes \"here\" and 'apostrophes'" in content
@@ -863,6 +921,7 @@ class TestEdgeCases:
         assert issubclass(VttTimestampError, VttValidationError)
         assert issubclass(VttHeaderError, VttValidationError)
         assert issubclass(VttCueError, VttValidationError)
+        assert issubclass(VttEscapingError, VttValidationError)
 
         # VttError itself should be a ValueError
         assert issubclass(VttError, ValueError)
@@ -922,6 +981,21 @@ class TestBuildVTTString:
         result = build_vtt_string(segments, validate=False)
         assert "Invalid but allowed" in result
 
+    def test_build_vtt_string_matches_file_output(self, temp_output_file):
+        """Test the string and file builders produce identical documents."""
+        segments = [
+            {"id": i, "start": i * 2.0, "end": i * 2.0 + 1.5, "text": f"Cue {i} <b>&</b>\n  more"}
+            for i in range(1, 2001)
+        ]
+        build_vtt_from_records(segments, temp_output_file)
+        with open(temp_output_file, encoding="utf-8", newline="") as f:
+            expected = f.read()
+
+        assert build_vtt_string(segments) == expected
+        # The shared output buffer is reused between calls
+        assert build_vtt_string(segments[:1]) == build_vtt_string(segments[:1])
+        assert build_vtt_string(segments) == expected
+
 
 class TestTimestampConversion:
     """Test timestamp conversion utilities."""
@@ -983,6 +1057,69 @@ class TestTimestampConversion:
         back = timestamp_to_seconds(timestamp)
         assert abs(original - back) < 0.001
 
+    def test_repeated_conversions_stay_consistent(self):
+        """Test that repeated and interleaved conversions agree."""
+        values = [0.0, 1.5, 0.0, 61.25, 1.5, 3661.0, 0.0]
+        for value in values:
+            assert seconds_to_timestamp(value) == seconds_to_timestamp(value)
+            assert seconds_to_timestamp(value, True) != seconds_to_timestamp(value + 3600.0, True)
+            timestamp = seconds_to_timestamp(value)
+            assert timestamp_to_seconds(timestamp) == timestamp_to_seconds(timestamp)
+        assert seconds_to_timestamp(61.25, True) == "01:01.250"
+        assert seconds_to_timestamp(61.25) == "00:01:01.250"
+
+    def test_repeated_conversion_reuses_string(self):
+        """Test a repeated timestamp returns the cached string object."""
+        first = seconds_to_timestamp(42.125)
+        assert seconds_to_timestamp(42.125) is first
+        assert seconds_to_timestamp(42.125, True) == "00:42.125"
+        assert seconds_to_timestamp(42.125) == "00:00:42.125"
+
+    def test_seconds_to_timestamp_array(self):
+        """Test the array variant matches per-value conversion."""
+        values = [0.0, 61.5, 3661.123, 0.0005, 359999.999]
+        for short in (False, True):
+            expected = [seconds_to_timestamp(v, short) for v in values]
+            assert seconds_to_timestamp_array(array("d", values), short) == expected
+        assert seconds_to_timestamp_array(array("d")) == []
+
+    def test_seconds_to_timestamp_array_repeated_values(self):
+        """Test runs of equal timestamps share one string and other values stay distinct."""
+        result = seconds_to_timestamp_array(array("d", [2.0, 2.0004, 5.0, 2.0]))
+        assert result == ["00:00:02.000", "00:00:02.000", "00:00:05.000", "00:00:02.000"]
+        assert result[0] is result[1]
+
+    def test_seconds_to_timestamp_array_rejects_negative(self):
+        """Test the array variant range-checks every value."""
+        with pytest.raises(VttTimestampError):
+            seconds_to_timestamp_array(array("d", [1.0, -1.0]))
+
+    def test_timestamp_to_seconds_array(self):
+        """Test the array variant matches per-string parsing."""
+        timestamps = ["00:00:00.000", "01:01:01.123", "02:05.500", "123:00:00.001", "59:59.999"]
+        result = timestamp_to_seconds_array(timestamps)
+        assert isinstance(result, array) and result.typecode == "d"
+        assert list(result) == [timestamp_to_seconds(t) for t in timestamps]
+        assert len(timestamp_to_seconds_array([])) == 0
+
+    def test_timestamp_to_seconds_array_round_trip(self):
+        """Test parsed arrays format back to the original strings."""
+        timestamps = seconds_to_timestamp_array(array("d", [0.5, 61.25, 3661.123]))
+        assert seconds_to_timestamp_array(timestamp_to_seconds_array(timestamps)) == timestamps
+
+    def test_timestamp_to_seconds_array_rejects_invalid(self):
+        """Test one malformed entry fails the whole conversion."""
+        with pytest.raises(VttTimestampError):
+            timestamp_to_seconds_array(["00:00:01.000", "00:61.000"])
+        with pytest.raises(TypeError):
+            timestamp_to_seconds_array(["00:00:01.000", 1.0])
+
+    def test_invalid_timestamp_not_cached(self):
+        """Test that a rejected timestamp is rejected again on repeat."""
+        for _ in range(2):
+            with pytest.raises(VttTimestampError):
+                timestamp_to_seconds("00:61.000")
+
 
 class TestMergeSegments:
     """Test segment merging functionality."""
@@ -1031,6 +1168,16 @@ class TestMergeSegments:
         assert result[0]["text"] == "One Two Three"
         assert result[1]["text"] == "Four"
 
+    def test_merge_segments_long_chain(self):
+        """Test a long chain of runs merges into one segment per run."""
+        segments = [{"start": float(i), "end": i + 1.0, "text": f" w{i} "} for i in range(500)]
+        segments.append({"start": 600.0, "end": 601.0, "text": " tail "})
+        result = merge_segments(segments, gap_threshold=0.5)
+        assert len(result) == 2
+        assert result[0]["text"] == " ".join(f"w{i}" for i in range(500))
+        assert result[0]["end"] == 500.0
+        assert result[1] == {"id": 2, "start": 600.0, "end": 601.0, "text": "tail"}
+
     def test_merge_segments_preserves_ids(self):
         """Test that merged segments get new IDs."""
         segments = [
@@ -1089,6 +1236,15 @@ class TestSplitLongSegments:
         for i in range(len(result) - 1):
             assert result[i]["end"] == result[i + 1]["start"]
 
+    def test_split_many_pieces_timing(self):
+        """Test piece boundaries stay proportional across a long split."""
+        text = " ".join(["ab"] * 1000)
+        result = split_long_segments([{"start": 3.0, "end": 3003.0, "text": text}], max_chars=2)
+        assert len(result) == 1000
+        for i, seg in enumerate(result[:-1]):
+            assert seg["end"] == pytest.approx(3.0 + (i + 1) * 2 / len(text) * 3000.0, abs=1e-9)
+        assert result[-1]["end"] == 3003.0
+
     def test_split_multiple_segments(self):
         """Test splitting multiple segments."""
         segments = [
@@ -1128,6 +1284,16 @@ class TestSplitLongSegments:
             assert not seg["text"].endswith(" ")
             assert seg["text"].strip() == seg["text"]
 
+    def test_split_irregular_whitespace_matches_single_spaced(self):
+        """Test that spacing in the input does not change where splits fall."""
+        text = "Supercalifragilistic word and some more words to split here"
+        irregular = text.replace(" ", "  ", 3).replace(" ", "\t", 1)
+        expected = split_long_segments([{"start": 0.0, "end": 6.0, "text": text}], max_chars=12)
+        result = split_long_segments([{"start": 0.0, "end": 6.0, "text": irregular}], max_chars=12)
+        assert result[0]["text"] == "Supercalifragilistic"
+        assert [seg["text"] for seg in result] == [seg["text"] for seg in expected]
+        assert all(len(seg["text"]) <= 12 for seg in result[1:])
+
 
 class TestShiftTimestamps:
     """Test timestamp shifting functionality."""
@@ -1160,6 +1326,16 @@ class TestShiftTimestamps:
         result = shift_timestamps(segments, offset_seconds=5.0)
         assert result[0]["text"] == "Keep this"
 
+    def test_shift_timestamps_reuses_trimmed_text(self):
+        """Test already-trimmed text is passed through and other text is trimmed."""
+        segments = [
+            {"start": 0.0, "end": 2.0, "text": "Keep this"},
+            {"start": 2.0, "end": 4.0, "text": "  padded \n"},
+        ]
+        result = shift_timestamps(segments, offset_seconds=5.0)
+        assert result[0]["text"] is segments[0]["text"]
+        assert result[1]["text"] == "padded"
+
     def test_shift_timestamps_preserves_ids(self):
         """Test that IDs are preserved during shift."""
         segments = [{"id": 42, "start": 0.0, "end": 2.0, "text": "Test"}]
@@ -1178,6 +1354,28 @@ class TestShiftTimestamps:
         assert result[0]["start"] == 1.0
         assert result[0]["end"] == 3.0
 
+    def test_shift_timestamps_array_in_place(self):
+        """Test shifting start/end arrays in place."""
+        starts = array("d", [0.0, 2.0])
+        ends = array("d", [2.0, 4.0])
+        shift_timestamps_array(starts, ends, 10.0)
+        assert list(starts) == [10.0, 12.0]
+        assert list(ends) == [12.0, 14.0]
+
+    def test_shift_timestamps_array_negative_result_leaves_arrays(self):
+        """Test a rejected shift does not modify the arrays."""
+        starts = array("d", [5.0, 1.0])
+        ends = array("d", [6.0, 2.0])
+        with pytest.raises(VttTimestampError):
+            shift_timestamps_array(starts, ends, -3.0)
+        assert list(starts) == [5.0, 1.0]
+        assert list(ends) == [6.0, 2.0]
+
+    def test_shift_timestamps_array_length_mismatch(self):
+        """Test arrays of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            shift_timestamps_array(array("d", [0.0]), array("d", [1.0, 2.0]), 1.0)
+
 
 class TestFilterSegmentsByTime:
     """Test time-based segment filtering."""
@@ -1242,6 +1440,39 @@ class TestFilterSegmentsByTime:
         assert result[0]["id"] == 5
         assert result[0]["text"] == "Keep me"
 
+    def test_filter_array_matches_dict_version(self):
+        """Test the array variant selects the same segments as the dict variant."""
+        segments = [
+            {"start": 0.0, "end": 2.0, "text": "First"},
+            {"start": 3.0, "end": 5.0, "text": "Second"},
+            {"start": 5.0, "end": 7.0, "text": "Third"},
+            {"start": 10.0, "end": 12.0, "text": "Fourth"},
+        ]
+        starts = array("d", [seg["start"] for seg in segments])
+        ends = array("d", [seg["end"] for seg in segments])
+
+        indices = filter_segments_by_time_array(starts, ends, 4.0, 8.0)
+        expected = filter_segments_by_time(segments, start_time=4.0, end_time=8.0)
+
+        assert indices == [1, 2]
+        assert [segments[i]["text"] for i in indices] == [seg["text"] for seg in expected]
+
+    def test_filter_array_empty(self):
+        """Test filtering empty arrays."""
+        assert filter_segments_by_time_array(array("d"), array("d"), 0.0, 10.0) == []
+
+    def test_filter_array_unsorted_and_nan(self):
+        """Test unsorted or NaN columns select the same segments as a full scan."""
+        nan = float("nan")
+        starts = array("d", [5.0, 0.0, 10.0, 3.0])
+        ends = array("d", [7.0, 2.0, 12.0, 5.0])
+        assert filter_segments_by_time_array(starts, ends, 4.0, 8.0) == [0, 3]
+
+        starts = array("d", [nan, 3.0, 5.0])
+        ends = array("d", [2.0, 5.0, 7.0])
+        assert filter_segments_by_time_array(starts, ends, 0.0, 10.0) == [1, 2]
+        assert filter_segments_by_time_array(array("d", [1.0]), array("d", [2.0]), nan, 10.0) == []
+
 
 class TestGetSegmentsStats:
     """Test statistics calculation functionality."""
@@ -1335,6 +1566,14 @@ class TestRemoveFillerWords:
         result = remove_filler_words(segments, fillers=["well", "the thing is"])
         assert result[0]["text"] == "very interesting"
 
+    def test_custom_fillers_change_between_calls(self):
+        """Test that switching filler lists is not served a stale matcher."""
+        segments = [{"start": 0.0, "end": 2.0, "text": "well basically fine"}]
+        assert remove_filler_words(segments, fillers=["well"])[0]["text"] == "basically fine"
+        assert remove_filler_words(segments, fillers=["well"])[0]["text"] == "basically fine"
+        assert remove_filler_words(segments, fillers=["basically"])[0]["text"] == "well fine"
+        assert remove_filler_words(segments)[0]["text"] == "well fine"
+
     def test_preserve_timing(self):
         """Test that timing is preserved."""
         segments = [
@@ -1377,6 +1616,24 @@ class TestRemoveFillerWords:
         result = remove_filler_words([])
         assert result == []
 
+    def test_whole_words_only(self):
+        """Test fillers inside other words are left alone."""
+        segments = [{"start": 0.0, "end": 2.0, "text": "Umbrella likely um, alright"}]
+        result = remove_filler_words(segments)
+        assert result[0]["text"] == "Umbrella likely , alright"
+
+    def test_earlier_filler_takes_precedence(self):
+        """Test overlapping fillers resolve in list order."""
+        segments = [{"start": 0.0, "end": 2.0, "text": "so like this"}]
+        assert remove_filler_words(segments, fillers=["like", "so like"])[0]["text"] == "so this"
+        assert remove_filler_words(segments, fillers=["so like", "like"])[0]["text"] == "this"
+
+    def test_non_ascii_fillers(self):
+        """Test non-ASCII fillers are matched case-insensitively."""
+        segments = [{"start": 0.0, "end": 2.0, "text": "ÄHM das ist gut"}]
+        result = remove_filler_words(segments, fillers=["ähm"])
+        assert result[0]["text"] == "das ist gut"
+
 
 class TestGroupBySpeaker:
     """Test speaker diarization grouping."""
@@ -1440,6 +1697,42 @@ class TestGroupBySpeaker:
         result = group_by_speaker([])
         assert result == []
 
+    def test_returning_speaker_starts_new_group(self):
+        """Test that grouping only merges consecutive segments."""
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a", "speaker": "Alice"},
+            {"start": 1.0, "end": 2.0, "text": "b", "speaker": "Alice"},
+            {"start": 2.0, "end": 3.0, "text": "c", "speaker": "Bob"},
+            {"start": 3.0, "end": 4.0, "text": "d", "speaker": "Alice"},
+            {"start": 4.0, "end": 5.0, "text": "e", "speaker": "Alice"},
+        ]
+        result = group_by_speaker(segments)
+        assert [r["id"] for r in result] == [1, 2, 3]
+        assert [r["text"] for r in result] == [
+            "<v Alice>a b",
+            "<v Bob>c",
+            "<v Alice>d e",
+        ]
+        assert [(r["start"], r["end"]) for r in result] == [
+            (0.0, 2.0),
+            (2.0, 3.0),
+            (3.0, 5.0),
+        ]
+
+    def test_speaker_strings_shared_with_input(self):
+        """Test that output speakers reuse the input str objects."""
+        alice = "".join(["Ali", "ce"])
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a", "speaker": alice},
+            {"start": 1.0, "end": 2.0, "text": "b", "speaker": "Alice"},
+            {"start": 2.0, "end": 3.0, "text": "c", "speaker": 42},
+        ]
+        result = group_by_speaker(segments)
+        assert len(result) == 2
+        assert result[0]["speaker"] is alice
+        assert result[0]["text"] == "<v Alice>a b"
+        assert result[1]["speaker"] == "Unknown"
+
 
 class TestFilterByConfidence:
     """Test confidence-based filtering."""
@@ -1496,6 +1789,29 @@ class TestFilterByConfidence:
         result = filter_by_confidence([])
         assert result == []
 
+    def test_text_passed_through(self):
+        """Test that kept segments reuse the input text object."""
+        text = "".join(["Kept ", "text"])
+        result = filter_by_confidence([{"start": 0.0, "end": 1.0, "text": text}])
+        assert result[0]["text"] is text
+
+    def test_array_matches_dict_api(self):
+        """Test the array variant keeps the same segments as "remove" mode."""
+        confidences = [0.95, 0.4, 0.8, 0.7999, 1.0]
+        segments = [
+            {"start": float(i), "end": i + 1.0, "text": f"s{i}", "confidence": c}
+            for i, c in enumerate(confidences)
+        ]
+        kept = filter_by_confidence_array(array("d", confidences), 0.8)
+        assert kept == [0, 2, 4]
+        assert [segments[i]["text"] for i in kept] == [
+            r["text"] for r in filter_by_confidence(segments, 0.8)
+        ]
+
+    def test_array_empty(self):
+        """Test the array variant with no segments."""
+        assert filter_by_confidence_array(array("d")) == []
+
 
 class TestWordsToSegments:
     """Test word-level to segment-level aggregation."""
@@ -1516,9 +1832,7 @@ class TestWordsToSegments:
         assert "Hello" in result[0]["text"]
         # Verify segments are created
         all_text = " ".join(seg["text"] for seg in result)
-        assert "Hello" in all_text
-        assert "world." in all_text
-        assert "you?" in all_text
+        assert_all_in(all_text, "Hello", "world.", "you?")
 
     def test_pause_threshold_breaks(self):
         """Test that long pauses break segments."""
@@ -1636,28 +1950,268 @@ class TestDetectChapters:
         assert result[0]["chapter"] == 1
         assert result[0]["start"] == 0.0
 
-    def test_timestamp_formatting(self):
-        """Test that timestamps are formatted correctly."""
-        segments = [
-            {"start": 3661.0, "end": 3700.0, "text": "Content"},
-        ]
-        result = detect_chapters(segments)
-        assert result[0]["timestamp"] == "01:01:01"
+    @pytest.mark.parametrize(
+        "segments, expected",
+        [
+            pytest.param(
+                [{"start": 3661.0, "end": 3700.0, "text": "Content"}],
+                [{"chapter": 1, "start": 3661.0, "timestamp": "01:01:01"}],
+                id="timestamp-formatting",
+            ),
+            pytest.param(
+                [
+                    {"start": 0.0, "end": 10.0, "text": "Short 1"},
+                    # 10s gap, but the chapter would be shorter than the minimum
+                    {"start": 20.0, "end": 30.0, "text": "Short 2"},
+                ],
+                [{"chapter": 1, "start": 0.0, "timestamp": "00:00"}],
+                id="min-chapter-duration",
+            ),
+            pytest.param([], [], id="empty"),
+        ],
+    )
+    def test_detect_chapters_cases(self, segments, expected):
+        """Test the complete chapter list for small inputs."""
+        assert (
+            detect_chapters(segments, min_chapter_duration=60.0, silence_threshold=5.0) == expected
+        )
+
+    def test_array_matches_dict_version(self):
+        """Test the array variant finds the same chapter starts as the dict variant."""
+        segments = [
+            {"start": 0.0, "end": 30.0, "text": "One"},
+            {"start": 31.0, "end": 90.0, "text": "Two"},
+            {"start": 100.0, "end": 130.0, "text": "Three"},
+            {"start": 131.0, "end": 200.0, "text": "Four"},
+            {"start": 210.0, "end": 220.0, "text": "Five"},
+        ]
+        starts = array("d", [seg["start"] for seg in segments])
+        ends = array("d", [seg["end"] for seg in segments])
+
+        indices = detect_chapters_array(
+            starts, ends, min_chapter_duration=60.0, silence_threshold=5.0
+        )
+        chapters = detect_chapters(segments, min_chapter_duration=60.0, silence_threshold=5.0)
+
+        assert indices == [0, 2, 4]
+        assert [segments[i]["start"] for i in indices] == [ch["start"] for ch in chapters]
+        assert detect_chapters_array(array("d"), array("d")) == []
+
+
+class TestSegments:
+    """Test the columnar Segments container."""
+
+    @pytest.fixture
+    def records(self):
+        return [
+            {"id": 1, "start": 0.0, "end": 2.0, "text": " Hello "},
+            {"id": 2, "start": 2.2, "end": 4.0, "text": "world"},
+            {"id": 3, "start": 10.0, "end": 12.0, "text": "Later & again"},
+        ]
+
+    def test_round_trip(self, records):
+        """Test dicts survive conversion to and from columns (text is trimmed)."""
+        segments = Segments.from_dicts(records)
+        assert len(segments) == 3
+        assert segments.ids == [1, 2, 3]
+        assert segments.starts == [0.0, 2.2, 10.0]
+        assert segments.ends == [2.0, 4.0, 12.0]
+        assert segments.texts == ["Hello", "world", "Later & again"]
+        assert segments.to_dicts()[0] == {"id": 1, "start": 0.0, "end": 2.0, "text": "Hello"}
+
+    def test_to_tuples(self, records):
+        """Test to_tuples carries the same records as to_dicts."""
+        segments = Segments.from_dicts(records)
+        assert segments.to_tuples() == [
+            (d["id"], d["start"], d["end"], d["text"]) for d in segments.to_dicts()
+        ]
+        assert Segments().to_tuples() == []
+
+    def test_repeated_short_texts_share_objects(self):
+        """Test equal short texts come back as one str object."""
+        segments = Segments()
+        for i, word in enumerate(["the", "cat", "the", "the"]):
+            segments.append(float(i), i + 0.5, word)
+        texts = [d["text"] for d in segments.to_dicts()]
+        assert texts == ["the", "cat", "the", "the"]
+        assert texts[0] is texts[2] is texts[3]
+        words = segments.texts
+        assert words[0] is words[2]
+
+    def test_detect_chapters_matches_dict_version(self):
+        """Test chapter detection on columns matches the dict function."""
+        records = [
+            {"start": 0.0, "end": 30.0, "text": "One"},
+            {"start": 31.0, "end": 90.0, "text": "Two"},
+            {"start": 100.0, "end": 130.0, "text": "Three"},
+        ]
+        segments = Segments.from_dicts(records)
+        expected = detect_chapters(records, min_chapter_duration=60.0, silence_threshold=5.0)
+        assert segments.detect_chapters(60.0, 5.0) == expected
+        assert len(expected) == 2
+        assert Segments().detect_chapters() == []
+
+    def test_from_columns(self, records):
+        """Test building from parallel columns matches building from dicts."""
+        starts = array("d", [rec["start"] for rec in records])
+        ends = array("d", [rec["end"] for rec in records])
+        texts = [rec["text"] for rec in records]
+        segments = Segments.from_columns(starts, ends, texts)
+        assert segments.to_vtt_string() == build_vtt_string(records)
+        assert segments.ids == list(range(1, len(records) + 1))
+        with pytest.raises(ValueError):
+            Segments.from_columns(starts, ends, texts[:-1])
+
+    def test_time_arrays(self, records):
+        """Test starts_array/ends_array return packed doubles usable by the array API."""
+        segments = Segments.from_dicts(records)
+        starts, ends = segments.starts_array(), segments.ends_array()
+        assert starts.typecode == "d" and ends.typecode == "d"
+        assert list(starts) == segments.starts
+        assert list(ends) == segments.ends
+        assert filter_segments_by_time_array(starts, ends, 3.0, 11.0) == [1, 2]
+        assert len(Segments().starts_array()) == 0
+
+    def test_append(self):
+        """Test appending segments with default and explicit ids."""
+        segments = Segments()
+        segments.append(0.0, 1.0, "One")
+        segments.append(1.0, 2.0, "Two", id=7)
+        assert segments.ids == [1, 7]
+        assert segments.texts == ["One", "Two"]
+
+    def test_append_trims_text(self):
+        """Test appended text is trimmed, so transforms match the dict functions."""
+        segments = Segments()
+        segments.append(0.0, 1.0, " Hi ")
+        assert segments.texts == ["Hi"]
+        record = {"start": 0.0, "end": 1.0, "text": " Hi "}
+        assert segments.merge().to_dicts() == merge_segments([record])
+
+    def test_missing_field_raises(self):
+        """Test from_dicts reports missing fields like the dict API."""
+        with pytest.raises(KeyError):
+            Segments.from_dicts([{"start": 0.0, "end": 1.0}])
 
-    def test_min_chapter_duration_respected(self):
-        """Test minimum chapter duration is respected."""
-        segments = [
-            {"start": 0.0, "end": 10.0, "text": "Short 1"},
-            {"start": 20.0, "end": 30.0, "text": "Short 2"},  # 10s gap but chapter too short
-        ]
-        result = detect_chapters(segments, min_chapter_duration=60.0, silence_threshold=5.0)
-        # Should not create new chapter since minimum duration not met
-        assert len(result) == 1
+    def test_merge_matches_dict_api(self, records):
+        """Test Segments.merge matches merge_segments."""
+        merged = Segments.from_dicts(records).merge(gap_threshold=0.5)
+        assert merged.to_dicts() == merge_segments(records, gap_threshold=0.5)
 
-    def test_empty_segments_list(self):
-        """Test with empty segments list."""
-        result = detect_chapters([])
-        assert result == []
+    def test_split_long_matches_dict_api(self):
+        """Test Segments.split_long matches split_long_segments."""
+        records = [{"start": 0.0, "end": 10.0, "text": "one two three four five six seven"}]
+        split = Segments.from_dicts(records).split_long(max_chars=10)
+        assert split.to_dicts() == split_long_segments(records, max_chars=10)
+
+    def test_group_words_matches_dict_api(self):
+        """Test Segments.group_words matches words_to_segments."""
+        words = [
+            {"word": "Hello", "start": 0.0, "end": 0.5},
+            {"word": "world.", "start": 0.5, "end": 1.0},
+            {"word": "Next", "start": 3.0, "end": 3.5},
+        ]
+        columns = Segments()
+        for word in words:
+            columns.append(word["start"], word["end"], word["word"])
+        assert columns.group_words().to_dicts() == words_to_segments(words)
+
+    def test_shift_and_filter(self, records):
+        """Test shift and filter_by_time keep ids and match the dict API."""
+        segments = Segments.from_dicts(records)
+        shifted = segments.shift(5.0)
+        assert shifted.starts == [5.0, 7.2, 15.0]
+        assert segments.starts == [0.0, 2.2, 10.0]
+
+        filtered = segments.filter_by_time(3.0, 11.0)
+        assert filtered.to_dicts() == filter_segments_by_time(records, 3.0, 11.0)
+
+    def test_filter_by_time_ordered_and_unordered(self):
+        """Test filter_by_time gives the same result whether or not segments are sorted."""
+        records = [
+            {"id": i + 1, "start": float(i), "end": i + 1.5, "text": f"Seg {i}"} for i in range(50)
+        ]
+        for ordering in (records, records[::-1]):
+            segments = Segments.from_dicts(ordering)
+            for window in [(10.2, 12.7), (0.0, 0.0), (49.5, 100.0), (-5.0, -1.0)]:
+                assert segments.filter_by_time(*window).to_dicts() == filter_segments_by_time(
+                    ordering, *window
+                )
+
+    def test_stats_matches_dict_api(self, records):
+        """Test Segments.stats matches get_segments_stats."""
+        assert Segments.from_dicts(records).stats() == get_segments_stats(records)
+        assert Segments().stats() == get_segments_stats([])
+
+    def test_stats_large_batch_matches_dict_api(self):
+        """Test Segments.stats sums durations exactly like get_segments_stats."""
+        records = [
+            {"start": i / 3, "end": i / 3 + 0.1 * (i % 7), "text": f"word {i} é "}
+            for i in range(2000)
+        ]
+        assert Segments.from_dicts(records).stats() == get_segments_stats(records)
+
+    def test_to_vtt_string_matches_dict_api(self, records):
+        """Test Segments.to_vtt_string matches build_vtt_string for each option."""
+        segments = Segments.from_dicts(records)
+        for escape_text in (True, False):
+            expected = build_vtt_string(records, escape_text=escape_text)
+            assert segments.to_vtt_string(escape_text=escape_text) == expected
+
+    def test_merge_then_render_matches_dict_pipeline(self, records):
+        """Test merging and rendering in columns matches the dict round trip."""
+        via_dicts = build_vtt_string(merge_segments(records, gap_threshold=0.5))
+        via_columns = Segments.from_dicts(records).merge(gap_threshold=0.5).to_vtt_string()
+        assert via_columns == via_dicts
+
+    def test_to_vtt_string_cached_until_append(self, records):
+        """Test repeated renders reuse the cached string and append invalidates it."""
+        segments = Segments.from_dicts(records)
+        first = segments.to_vtt_string()
+        assert segments.to_vtt_string() is first
+        assert segments.merge().to_vtt_string() is not first
+
+        segments.append(20.0, 21.0, "More")
+        updated = segments.to_vtt_string()
+        assert updated is not first
+        assert updated.endswith("4\n00:00:20.000 --> 00:00:21.000\nMore\n\n")
+
+    def test_to_vtt_string_validates(self):
+        """Test validation still runs when only an unvalidated render is cached."""
+        segments = Segments()
+        segments.append(5.0, 1.0, "Backwards")
+        segments.to_vtt_string(validate=False)
+        with pytest.raises(VttTimestampError):
+            segments.to_vtt_string()
+
+    def test_shift_negative_raises(self, records):
+        """Test shifting below zero raises VttTimestampError."""
+        with pytest.raises(VttTimestampError):
+            Segments.from_dicts(records).shift(-1.0)
+
+
+class TestPackageExports:
+    """Test the lazily resolved package namespace."""
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ can be accessed on the package."""
+        for name in vtt_builder.__all__:
+            assert getattr(vtt_builder, name) is not None
+
+    def test_escape_alias(self):
+        """Test escape_vtt_text is the extension's escape function."""
+        from vtt_builder import _lowlevel
+
+        assert vtt_builder.escape_vtt_text is _lowlevel.escape_vtt_text_py
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            vtt_builder.does_not_exist  # noqa: B018
+
+    def test_dir_lists_exports(self):
+        """Test dir() includes exports that have not been accessed yet."""
+        assert set(vtt_builder.__all__) <= set(dir(vtt_builder))
 
 
 if __name__ == "__main__":